@@ -40,6 +40,74 @@ infopanel = st.Page(
     "./demos/infopanel.py",
     title="Infopanel",
 )
+legend = st.Page(
+    "./demos/legend.py",
+    title="Legend",
+)
+filters = st.Page(
+    "./demos/filters.py",
+    title="Range Filters",
+)
+search = st.Page(
+    "./demos/search.py",
+    title="Search",
+)
+queries = st.Page(
+    "./demos/queries.py",
+    title="Graph Queries",
+)
+metrics = st.Page(
+    "./demos/metrics.py",
+    title="Graph Metrics",
+)
+telemetry = st.Page(
+    "./demos/telemetry.py",
+    title="Telemetry",
+)
+progressive = st.Page(
+    "./demos/progressive.py",
+    title="Progressive Loading",
+)
+webgl = st.Page(
+    "./demos/webgl.py",
+    title="WebGL Renderer",
+)
+timeline = st.Page(
+    "./demos/timeline.py",
+    title="Temporal Playback",
+)
+streaming = st.Page(
+    "./demos/streaming.py",
+    title="Live Streaming",
+)
+layout_pool = st.Page(
+    "./demos/layout_pool.py",
+    title="Shared Layouts",
+)
+refine = st.Page(
+    "./demos/refine.py",
+    title="Layout Refinement",
+)
+matrix = st.Page(
+    "./demos/matrix.py",
+    title="Adjacency Matrix",
+)
+groups = st.Page(
+    "./demos/groups.py",
+    title="Node Groups",
+)
+folding = st.Page(
+    "./demos/folding.py",
+    title="Leaf Folding",
+)
+sampling = st.Page(
+    "./demos/sampling.py",
+    title="Graph Sampling",
+)
+fragment = st.Page(
+    "./demos/fragment.py",
+    title="Fragment Reruns",
+)
 
 # --------- Navigation ---------
 pg = st.navigation(
@@ -53,6 +121,23 @@ pg = st.navigation(
         edge_actions,
         multi_tab,
         infopanel,
+        legend,
+        filters,
+        search,
+        queries,
+        metrics,
+        telemetry,
+        progressive,
+        webgl,
+        timeline,
+        streaming,
+        layout_pool,
+        refine,
+        matrix,
+        groups,
+        folding,
+        sampling,
+        fragment,
     ]
 )
 pg.run()
@@ -0,0 +1,68 @@
+import json
+from datetime import date
+import streamlit as st
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    Filter,
+    cytoscape_fragment,
+    register_elements,
+)
+
+with open("./data/claims.json", "r") as f:
+    elements = json.load(f)
+
+st.markdown("# Range Filters")
+st.markdown(
+    """
+    `Filter` hides the elements whose numeric or date attribute is out of a
+    range. The frontend builds a sorted index of each filtered attribute once,
+    so moving a slider neither resends the elements nor reloads the graph:
+    only the elements crossing the bounds are shown or hidden. Elements
+    without the attribute (here, `PERSON` and `CAR` nodes) are kept.
+    """
+)
+
+node_styles = [
+    NodeStyle("CLAIM", "#a87c2a", "claim_amount", "description"),
+    NodeStyle("CAR", "#028391", None, "directions_car"),
+    NodeStyle("PERSON", "#01204E", None, "person"),
+]
+
+handle = register_elements(elements)
+
+
+@cytoscape_fragment
+def graph():
+    left, right = st.columns(2)
+    amount = left.slider(
+        "Claim amount", 5000.0, 50000.0, (5000.0, 50000.0), step=1000.0
+    )
+    claim_date = right.slider(
+        "Claim date",
+        date(2024, 1, 1),
+        date(2024, 6, 30),
+        (date(2024, 1, 1), date(2024, 6, 30)),
+    )
+    filters = [
+        Filter("claim_amount", *amount),
+        Filter("claim_date", *claim_date),
+    ]
+    streamlit_cytoscape(
+        handle, "fcose", node_styles, filters=filters, key="filters"
+    )
+
+
+graph()
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        filters = [
+            Filter("claim_amount", min_value=10000, max_value=30000),
+            Filter("claim_date", min_value=date(2024, 3, 1)),
+        ]
+        streamlit_cytoscape(handle, "fcose", node_styles, filters=filters)
+        """,
+        language="python",
+    )
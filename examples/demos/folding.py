@@ -0,0 +1,142 @@
+import numpy as np
+import streamlit as st
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    EdgeStyle,
+    GraphIndex,
+    GraphOverlay,
+)
+
+LEAVES = {"EMAIL": 3, "PHONE": 2, "CARD": 2}
+
+
+@st.cache_resource
+def load_base_graph(n_people, seed=0):
+    """People knowing each other, each with emails, phones and cards,
+    and some cards with a chain of transactions."""
+    rng = np.random.default_rng(seed)
+    nodes = [
+        {"data": {"id": f"p{i}", "label": "PERSON", "name": f"Person {i}"}}
+        for i in range(n_people)
+    ]
+    edges = [
+        {
+            "data": {
+                "id": f"k{i}",
+                "source": f"p{i}",
+                "target": f"p{t}",
+                "label": "KNOWS",
+            }
+        }
+        for i, t in enumerate(rng.integers(0, n_people, n_people).tolist())
+        if t != i
+    ]
+    for i in range(n_people):
+        for label, high in LEAVES.items():
+            for j in range(rng.integers(0, high + 1)):
+                leaf = f"{label.lower()}{i}_{j}"
+                nodes.append(
+                    {"data": {"id": leaf, "label": label, "name": leaf}}
+                )
+                edges.append(
+                    {
+                        "data": {
+                            "id": f"{leaf}:edge",
+                            "source": f"p{i}",
+                            "target": leaf,
+                            "label": "HAS",
+                        }
+                    }
+                )
+                if label == "CARD" and rng.random() < 0.3:
+                    # chain of transactions paid with the card
+                    previous = leaf
+                    for k in range(rng.integers(1, 4)):
+                        tx = f"tx{i}_{j}_{k}"
+                        nodes.append(
+                            {"data": {"id": tx, "label": "TX", "name": tx}}
+                        )
+                        edges.append(
+                            {
+                                "data": {
+                                    "id": f"{tx}:edge",
+                                    "source": previous,
+                                    "target": tx,
+                                    "label": "PAID",
+                                }
+                            }
+                        )
+                        previous = tx
+    return GraphIndex({"nodes": nodes, "edges": edges})
+
+
+st.markdown("# Leaf Folding")
+st.markdown(
+    """
+    Leaves (nodes with a single neighbor, like the emails, phones and cards
+    of a person) are folded into the node they hang off before the elements
+    are sent: the node shows their count as a badge (e.g. `Person 3 +5`).
+    With 'chains', leaves are folded repeatedly, so chains and trees
+    hanging off the graph are folded too. Double-click a node with a badge
+    to expand it: the folded nodes are restored by the `expand` node
+    action of the `GraphOverlay`.
+    """
+)
+
+left, right = st.columns(2)
+n_people = left.select_slider("People", [20, 200, 2000], 20)
+fold = right.radio("Fold", ["none", "leaves", "chains"], 1, horizontal=True)
+
+base = load_base_graph(n_people)
+state_key = f"folding_{n_people}_{fold}"
+if state_key not in st.session_state:
+    st.session_state[state_key] = GraphOverlay(
+        base, fold=None if fold == "none" else fold
+    )
+overlay = st.session_state[state_key]
+
+elements = overlay.elements()
+st.caption(
+    f"{len(elements['nodes']):,} of {len(base):,} nodes and "
+    f"{len(elements['edges']):,} of {len(base.edges):,} edges sent"
+)
+
+
+def on_change():
+    overlay.handle_action(st.session_state[state_key + "_graph"])
+
+
+streamlit_cytoscape(
+    overlay,
+    "fcose",
+    [
+        NodeStyle("PERSON", "#FF7F3E", "name", "person"),
+        NodeStyle("EMAIL", "#2A629A", "name", "email"),
+        NodeStyle("PHONE", "#27AE60", "name", "phone"),
+        NodeStyle("CARD", "#9B59B6", "name", "credit_card"),
+        NodeStyle("TX", "#A0A0A0", "name"),
+    ],
+    [EdgeStyle("KNOWS", "#2A629A"), EdgeStyle("HAS"), EdgeStyle("PAID")],
+    node_actions=["expand"],
+    on_change=on_change,
+    key=state_key + "_graph",
+)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        overlay = GraphOverlay(index, fold="leaves")
+
+        streamlit_cytoscape(
+            overlay,
+            node_actions=["expand"],
+            on_change=lambda: overlay.handle_action(st.session_state["g"]),
+            key="g",
+        )
+        # or with plain elements
+        elements = fold_leaves(index, chains=True)
+        # and `unfold(index, node_ids, chains=True, visible=...)` on expand
+        """,
+        language="python",
+    )
@@ -0,0 +1,105 @@
+import json
+import streamlit as st
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    EdgeStyle,
+    cytoscape_fragment,
+)
+
+COMPONENT_KEY = "fragment_graph"
+
+
+@st.cache_data
+def load_elements():
+    with open("./data/social.json", "r") as f:
+        return json.load(f)
+
+
+if "fragment_removed" not in st.session_state:
+    st.session_state.fragment_removed = set()
+    st.session_state.script_runs = 0
+    st.session_state.fragment_runs = 0
+st.session_state.script_runs += 1
+
+st.markdown("# Fragment Reruns")
+st.markdown(
+    """
+    Decorating the function that renders the graph with
+    `cytoscape_fragment` runs it as a Streamlit fragment: removing nodes
+    (select one and press delete, or use the remove button) only reruns
+    the fragment, not the whole page. Inside the fragment, elements
+    passed as a dict are registered by content hash, so unchanged
+    elements are not sent to the browser again on fragment reruns.
+    """
+)
+
+node_styles = [
+    NodeStyle("PERSON", "#FF7F3E", "name", "person"),
+    NodeStyle("POST", "#2A629A", "created_at", "description"),
+]
+
+edge_styles = [
+    EdgeStyle("FOLLOWS", caption="label", directed=True),
+    EdgeStyle("POSTED", caption="label", directed=True),
+    EdgeStyle("QUOTES", caption="label", directed=True),
+]
+
+
+def on_change():
+    value = st.session_state[COMPONENT_KEY]
+    if value and value["action"] == "remove":
+        st.session_state.fragment_removed.update(value["data"]["node_ids"])
+
+
+@cytoscape_fragment
+def graph():
+    st.session_state.fragment_runs += 1
+    elements = load_elements()
+    removed = st.session_state.fragment_removed
+    elements = {
+        "nodes": [
+            n for n in elements["nodes"] if n["data"]["id"] not in removed
+        ],
+        "edges": [
+            e
+            for e in elements["edges"]
+            if e["data"]["source"] not in removed
+            and e["data"]["target"] not in removed
+        ],
+    }
+    streamlit_cytoscape(
+        elements,
+        "fcose",
+        node_styles,
+        edge_styles,
+        node_actions=["remove"],
+        on_change=on_change,
+        key=COMPONENT_KEY,
+    )
+    st.caption(
+        f"Fragment runs: {st.session_state.fragment_runs}, "
+        f"removed nodes: {sorted(removed) or 'none'}"
+    )
+
+
+st.caption(f"Full script runs: {st.session_state.script_runs}")
+with st.container(border=True):
+    graph()
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        @cytoscape_fragment
+        def graph():
+            streamlit_cytoscape(
+                get_elements(),  # e.g. filtered by the removed nodes
+                node_actions=["remove"],
+                on_change=on_change,
+                key="graph",
+            )
+
+        graph()
+        """,
+        language="python",
+    )
@@ -0,0 +1,88 @@
+import numpy as np
+import streamlit as st
+from streamlit_cytoscape import streamlit_cytoscape, NodeStyle, EdgeStyle
+
+
+@st.cache_data
+def make_graph(n_nodes, n_companies, seed=0):
+    """People of companies, knowing mostly colleagues."""
+    rng = np.random.default_rng(seed)
+    company = rng.integers(0, n_companies, n_nodes)
+    order = np.argsort(company, kind="stable")
+    rank = np.empty(n_nodes, dtype=np.int64)
+    rank[order] = np.arange(n_nodes)
+    source = rng.integers(0, n_nodes, n_nodes)
+    # colleagues are contiguous in `order`, others anywhere
+    colleague = order[(rank[source] + 1) % n_nodes]
+    other = rng.integers(0, n_nodes, n_nodes)
+    target = np.where(rng.random(n_nodes) < 0.9, colleague, other)
+    nodes = [
+        {
+            "data": {
+                "id": f"p{i}",
+                "label": "PERSON",
+                "name": f"Person {i}",
+                "company": f"Company {c}",
+            }
+        }
+        for i, c in enumerate(company.tolist())
+    ]
+    edges = [
+        {
+            "data": {
+                "id": f"e{k}",
+                "source": f"p{s}",
+                "target": f"p{t}",
+                "label": "KNOWS",
+            }
+        }
+        for k, (s, t) in enumerate(zip(source.tolist(), target.tolist()))
+        if s != t
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+st.markdown("# Node Groups")
+st.markdown(
+    """
+    With `group_by`, nodes are grouped under compound parent nodes by the
+    value of an attribute, here the company of each person. Double-click a
+    group to collapse it into a single node: the edges of its members are
+    rerouted to it, aggregated with their count. Double-click it again to
+    expand it. Collapsed elements are cached in the browser, so neither
+    action reruns the app. With `collapse_groups=True`, groups start
+    collapsed and only the groups are displayed and laid out.
+    """
+)
+
+left, middle, right = st.columns(3)
+n_nodes = left.select_slider("People", [100, 5000, 100000], 100)
+n_companies = middle.select_slider("Companies", [5, 50, 300], 5)
+collapsed = right.checkbox("Start collapsed", value=True)
+
+elements = make_graph(n_nodes, n_companies)
+
+vals = streamlit_cytoscape(
+    elements,
+    "fcose",
+    [NodeStyle("PERSON", "#FF7F3E", "name", "person")],
+    [EdgeStyle("KNOWS", "#A0A0A0")],
+    group_by="company",
+    collapse_groups=collapsed,
+    key=f"groups_{n_nodes}_{n_companies}_{collapsed}",
+)
+st.markdown("#### Returned Value")
+st.json(vals or {}, expanded=False)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        streamlit_cytoscape(
+            elements,
+            group_by="company",
+            collapse_groups=True,
+            key="graph",
+        )
+        """,
+        language="python",
+    )
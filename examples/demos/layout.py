@@ -1,7 +1,7 @@
 import json
 import streamlit as st
 from streamlit_cytoscape import streamlit_cytoscape, NodeStyle
-from streamlit_cytoscape.layouts import LAYOUTS
+from streamlit_cytoscape.layouts import LAYOUTS, adaptive_layout
 
 LAYOUT_NAMES = list(LAYOUTS.keys())
 
@@ -26,10 +26,14 @@ st.markdown(
     You can select from different layout options which determines how elements
     positions are calculated in the graph. Refer to
     [Cytoscape JS](https://js.cytoscape.org/#layouts) for full options.
+    Named layouts adapt their options to the number of nodes: fewer
+    iterations, no animation and no label-aware sizing on larger graphs.
     """
 )
 
 layout = st.selectbox("Layout Name", LAYOUT_NAMES, index=0)
+with st.expander("Options applied to this graph", icon="⚙️"):
+    st.json(adaptive_layout(layout, len(elements["nodes"])))
 
 node_styles = [
     NodeStyle("CLAIM", "#a87c2a", None, "description"),
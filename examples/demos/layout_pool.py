@@ -0,0 +1,77 @@
+import time
+
+import numpy as np
+import streamlit as st
+from streamlit_cytoscape import streamlit_cytoscape, NodeStyle, EdgeStyle
+from streamlit_cytoscape import GraphIndex
+from streamlit_cytoscape.layout_pool import get_layout_pool
+
+
+@st.cache_resource
+def load_graph(n_nodes, seed=0):
+    """Random clustered graph, shared by every session."""
+    rng = np.random.default_rng(seed)
+    clusters = rng.integers(0, 12, n_nodes)
+    order = np.argsort(clusters, kind="stable")
+    rank = np.empty(n_nodes, dtype=np.int64)
+    rank[order] = np.arange(n_nodes)
+    source = rng.integers(0, n_nodes, 2 * n_nodes)
+    target = order[(rank[source] + rng.integers(1, 40, len(source))) % n_nodes]
+    nodes = [
+        {"data": {"id": f"n{i}", "label": "NODE", "cluster": int(c)}}
+        for i, c in enumerate(clusters.tolist())
+    ]
+    edges = [
+        {"data": {"id": f"e{k}", "source": f"n{s}", "target": f"n{t}"}}
+        for k, (s, t) in enumerate(zip(source.tolist(), target.tolist()))
+        if s != t
+    ]
+    for e in edges:
+        e["data"]["label"] = "LINK"
+    return GraphIndex({"nodes": nodes, "edges": edges})
+
+
+st.markdown("# Shared Layouts")
+st.markdown(
+    """
+    Layouts can be computed on the server, in a process pool shared by every
+    session. Requests for the same graph (by fingerprint) and layout options
+    made while it is being computed wait for the same job, and positions are
+    kept in an LRU cache: open this page in several tabs, only the first one
+    pays for the layout. The graph is then displayed with the 'preset' layout.
+    """
+)
+
+left, right = st.columns(2)
+n_nodes = left.select_slider("Nodes", [500, 1000, 3000, 10000], 1000)
+iterations = right.select_slider("Iterations", [25, 50, 100], 50)
+
+index = load_graph(n_nodes)
+pool = get_layout_pool()
+start = time.perf_counter()
+elements = pool.elements(index, "force", iterations=iterations)
+elapsed = time.perf_counter() - start
+
+st.caption(
+    f"Positions in {elapsed * 1000:.0f} ms. Pool: {pool.misses} computed, "
+    f"{pool.coalesced} coalesced, {pool.hits} cached"
+)
+streamlit_cytoscape(
+    elements,
+    {"name": "preset"},
+    [NodeStyle("NODE", "#2A629A")],
+    [EdgeStyle("LINK", "#A0A0A0")],
+    key="layout_pool",
+)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        from streamlit_cytoscape.layout_pool import layout_elements
+
+        index = load_graph()  # a GraphIndex cached with st.cache_resource
+        elements = layout_elements(index, "force", iterations=50)
+        streamlit_cytoscape(elements, {"name": "preset"}, key="graph")
+        """,
+        language="python",
+    )
@@ -0,0 +1,71 @@
+import json
+import streamlit as st
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    EdgeStyle,
+    Event,
+)
+
+with open("./data/social.json", "r") as f:
+    elements = json.load(f)
+
+if hasattr(st.session_state, "legend_counter"):
+    st.session_state.legend_counter += 1
+else:
+    st.session_state.legend_counter = 1
+
+st.markdown("# Legend")
+st.markdown(
+    """
+    With `legend=True`, a legend panel lists the labels of the node and edge
+    styles. Click a label to show or hide its elements: toggling happens in
+    the browser only, without rerunning the app. The hidden labels are
+    reported lazily under `hidden_labels`, with the next returned value (e.g.
+    after clicking a node below).
+    """
+)
+st.markdown("**Total Number of runs:** %i" % st.session_state.legend_counter)
+
+node_styles = [
+    NodeStyle("PERSON", "#FF7F3E", "name", "person"),
+    NodeStyle("POST", "#2A629A", "created_at", "description"),
+]
+
+edge_styles = [
+    EdgeStyle("FOLLOWS", "#A0C878", caption="label", directed=True),
+    EdgeStyle("POSTED", caption="label", directed=True),
+    EdgeStyle("QUOTES", caption="label", directed=True),
+]
+
+events = [Event("clicked_node", "click tap", "node")]
+
+with st.container(border=True):
+    vals = streamlit_cytoscape(
+        elements,
+        "fcose",
+        node_styles,
+        edge_styles,
+        events=events,
+        legend=True,
+        key="legend",
+    )
+    st.markdown("#### Returned Value")
+    st.json(vals or {}, expanded=True)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        vals = streamlit_cytoscape(
+            elements,
+            "fcose",
+            node_styles,
+            edge_styles,
+            events=[Event("clicked_node", "click tap", "node")],
+            legend=True,
+            key="legend",
+        )
+        hidden = (vals or {}).get("hidden_labels")
+        """,
+        language="python",
+    )
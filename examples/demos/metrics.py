@@ -0,0 +1,59 @@
+import json
+import streamlit as st
+from streamlit_cytoscape import streamlit_cytoscape, NodeStyle, GraphIndex
+from streamlit_cytoscape.metrics import compute_metrics
+
+
+@st.cache_resource
+def load_index():
+    with open("./data/claims.json", "r") as f:
+        return GraphIndex(json.load(f))
+
+
+st.markdown("# Graph Metrics")
+st.markdown(
+    """
+    `compute_metrics` computes degree, weighted degree, PageRank and k-core
+    numbers in one vectorized pass over a `GraphIndex`, cached by graph
+    fingerprint. `NodeMetrics.elements()` adds them to the nodes data (e.g.
+    `_pagerank`) and `NodeMetrics.map_data()` binds node sizes and colors to
+    their range.
+    """
+)
+
+left, right = st.columns(2)
+size_by = left.selectbox("Size by", ["pagerank", "degree", "core"])
+color_by = right.selectbox("Color by", ["core", "degree", "pagerank"])
+
+metrics = compute_metrics(load_index())
+node_styles = [
+    NodeStyle(
+        label,
+        color=metrics.map_data(color_by, "#9ecae1", "#08306b"),
+        size=metrics.map_data(size_by, 12, 40),
+        icon=icon,
+    )
+    for label, icon in [
+        ("CLAIM", "description"),
+        ("CAR", "directions_car"),
+        ("PERSON", "person"),
+    ]
+]
+
+streamlit_cytoscape(metrics.elements(), "fcose", node_styles, key="metrics")
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        f"""
+        metrics = compute_metrics(index)
+        node_styles = [
+            NodeStyle(
+                "PERSON",
+                color=metrics.map_data("{color_by}", "#9ecae1", "#08306b"),
+                size=metrics.map_data("{size_by}", 12, 40),
+            ),
+        ]
+        streamlit_cytoscape(metrics.elements(), node_styles=node_styles)
+        """,
+        language="python",
+    )
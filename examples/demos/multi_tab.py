@@ -1,13 +1,18 @@
 """
 Demo to show the multi-tab auto-fit fix (st-link-analysis#35).
 
-This creates two tabs with graphs to verify that:
+This creates three tabs with graphs to verify that:
 1. Graph in first tab fits correctly on load
 2. Graph in second tab auto-fits when tab becomes visible
+3. Graph in third tab shares the registered elements of the first one
 """
 
 import streamlit as st
-from streamlit_cytoscape import streamlit_cytoscape, NodeStyle
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    register_elements,
+)
 
 st.markdown("# Multi-Tab Auto-Fit Test")
 st.markdown(
@@ -19,6 +24,11 @@ st.markdown(
     1. Observe that the graph in Tab 1 fits correctly
     2. Click on Tab 2 - the graph should auto-fit when the tab becomes visible
     3. Switch back to Tab 1 - it should still display correctly
+
+    Tab 1 and Tab 3 show the same graph with different layouts. Its
+    elements are registered once with `register_elements` and both
+    components reference the returned handle, so the browser keeps a
+    single shared copy.
     """
 )
 
@@ -64,12 +74,20 @@ node_styles = [
     NodeStyle("CLAIM", "#a87c2a", None, "description"),
 ]
 
-tab1, tab2 = st.tabs(["Tab 1 - Graph A", "Tab 2 - Graph B"])
+graph_a = register_elements(elements_tab1)
+
+tab1, tab2, tab3 = st.tabs(
+    ["Tab 1 - Graph A", "Tab 2 - Graph B", "Tab 3 - Graph A (shared)"]
+)
 
 with tab1:
     st.markdown("### Graph A (loaded on page load)")
-    streamlit_cytoscape(elements_tab1, "fcose", node_styles, key="graph_tab1")
+    streamlit_cytoscape(graph_a, "fcose", node_styles, key="graph_tab1")
 
 with tab2:
     st.markdown("### Graph B (should auto-fit when tab becomes visible)")
     streamlit_cytoscape(elements_tab2, "fcose", node_styles, key="graph_tab2")
+
+with tab3:
+    st.markdown("### Graph A (shared elements, different layout)")
+    streamlit_cytoscape(graph_a, "circle", node_styles, key="graph_tab3")
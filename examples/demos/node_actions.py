@@ -1,6 +1,12 @@
 import json
 import streamlit as st
-from streamlit_cytoscape import streamlit_cytoscape, NodeStyle, EdgeStyle
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    EdgeStyle,
+    GraphIndex,
+    GraphOverlay,
+)
 from streamlit_cytoscape.layouts import LAYOUTS
 
 LAYOUT_NAMES = list(LAYOUTS.keys())
@@ -27,11 +33,19 @@ st.markdown(
 
 st.code(
     """
+    index = GraphIndex(all_elements)  # cache with st.cache_resource
+
     def my_call_back() -> None:
         val = st.session_state["mygraph"]
         if val["action"] == "expand":
             node_ids = val["data"]["node_ids"]
-            # .. handle expand - currently only one node allowed
+            # .. handle expand - currently only one node allowed, e.g.
+            new_elements = index.neighborhood(
+                node_ids,
+                depth=val["data"]["depth"],
+                limit=val["data"]["limit"],
+                visible=visible_node_ids,
+            )
         elif val["action"] == "remove":
             node_ids = val["data"]["node_ids"]
             # .. handle remove
@@ -39,6 +53,8 @@ st.code(
     streamlit_cytoscape(
         elements,
         node_actions=['remove', 'expand'],
+        expand_depth=2,
+        expand_limit=10,
         on_change=my_call_back,
         key="mygraph"
     )
@@ -46,11 +62,23 @@ st.code(
     language="python",
 )
 
+st.markdown(
+    """
+    Alternatively, as done in this demo, load the graph once per server
+    with `st.cache_resource`, keep a `GraphOverlay` of it in the session
+    state and let `handle_action` apply the actions. Each session then
+    only stores the ids it removed or expanded.
+    """
+)
+
 st.warning(
     """
     **Notes**
     - Ensure all edges have an existing source and target IDs to prevent
     errors.
+    - With `expand_limit`, nodes with more neighbors get a "load more"
+    placeholder node (labeled `_MORE`). Expanding it returns the next
+    page of neighbors; the placeholder itself should then be removed.
     - This configuration is only initialized once. For changes to take
     effect, you need
     to remount the component.
@@ -59,50 +87,27 @@ st.warning(
 )
 
 
-class DummyGraph:
-    def __init__(self):
-        with open("./data/company.json", "r") as f:
-            elements = json.load(f)
-        self.all_nodes = elements["nodes"]
-        self.all_edges = elements["edges"]
-        self.nodes = set([n["data"]["id"] for n in elements["nodes"]])
-        self.edges = set([e["data"]["id"] for e in elements["edges"]])
-
-    def get_elements(self):
-        return {
-            "nodes": [n for n in self.all_nodes if n["data"]["id"] in self.nodes],
-            "edges": [e for e in self.all_edges if e["data"]["id"] in self.edges],
-        }
-
-    def remove(self, node_ids):
-        self.nodes -= set(node_ids)
-        self._update_edges()
-
-    def expand(self, node_ids):
-        new_nodes = set()
-        node_ids = set(node_ids)
-        for e in self.all_edges:
-            if e["data"]["source"] in node_ids:  # outbound
-                new_nodes.add(e["data"]["target"])
-            elif e["data"]["target"] in node_ids:  # inbound
-                new_nodes.add(e["data"]["source"])
-        self.nodes |= new_nodes
-        self._update_edges()
-
-    def _update_edges(self):
-        self.edges = {
-            e["data"]["id"]
-            for e in self.all_edges
-            if e["data"]["source"] in self.nodes and e["data"]["target"] in self.nodes
-        }
+@st.cache_resource
+def load_base_graph():
+    # loaded once per server process and shared by all sessions
+    with open("./data/company.json", "r") as f:
+        return GraphIndex(json.load(f))
 
 
 COMPONENT_KEY = "NODE_ACTIONS"
 
 if not hasattr(st.session_state, "graph"):
-    st.session_state.graph = DummyGraph()
+    # each session only keeps its removed / expanded node ids
+    st.session_state.graph = GraphOverlay(load_base_graph())
 
 layout = st.selectbox("Try with different layouts", LAYOUT_NAMES, index=0)
+col1, col2 = st.columns(2)
+depth = col1.number_input("Expansion depth", min_value=1, max_value=3, value=1)
+limit = col2.number_input(
+    "Max neighbors per expanded node (0 for no limit)",
+    min_value=0,
+    value=0,
+)
 
 node_styles = [
     NodeStyle("PERSON", "#FF7F3E", "email", "person"),
@@ -116,23 +121,18 @@ edge_styles = [
 
 
 def onchange_callback():
-    val = st.session_state[COMPONENT_KEY]
-
-    if val["action"] == "remove":
-        st.session_state.graph.remove(val["data"]["node_ids"])
+    st.session_state.graph.handle_action(st.session_state[COMPONENT_KEY])
 
-    elif val["action"] == "expand":
-        st.session_state.graph.expand(val["data"]["node_ids"])
 
-
-elements = st.session_state.graph.get_elements()
 with st.container(border=True):
     vals = streamlit_cytoscape(
-        elements,
+        st.session_state.graph,
         layout=layout,
         node_styles=node_styles,
         key=COMPONENT_KEY,
         node_actions=["remove", "expand"],
+        expand_depth=depth,
+        expand_limit=limit or None,
         on_change=onchange_callback,
     )
     st.markdown("#### Returned Value")
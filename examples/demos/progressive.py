@@ -0,0 +1,82 @@
+import numpy as np
+import streamlit as st
+from streamlit_cytoscape import streamlit_cytoscape, NodeStyle, EdgeStyle
+
+
+@st.cache_data
+def make_graph(n_nodes, with_positions, seed=0):
+    """Random clustered graph, nodes placed around their cluster."""
+    rng = np.random.default_rng(seed)
+    clusters = rng.integers(0, 20, n_nodes)
+    centers = rng.uniform(-3000, 3000, (20, 2))
+    xy = centers[clusters] + rng.normal(0, 250, (n_nodes, 2))
+    nodes = []
+    for i in range(n_nodes):
+        node = {"data": {"id": f"n{i}", "label": "NODE"}}
+        if with_positions:
+            node["position"] = {"x": float(xy[i, 0]), "y": float(xy[i, 1])}
+        nodes.append(node)
+    # edges mostly within clusters
+    source = rng.integers(0, n_nodes, 2 * n_nodes)
+    order = np.argsort(clusters, kind="stable")
+    rank = np.empty(n_nodes, dtype=np.int64)
+    rank[order] = np.arange(n_nodes)
+    offsets = rng.integers(1, 50, len(source))
+    target = order[(rank[source] + offsets) % n_nodes]
+    edges = [
+        {
+            "data": {
+                "id": f"e{k}",
+                "source": f"n{s}",
+                "target": f"n{t}",
+                "label": "LINK",
+            }
+        }
+        for k, (s, t) in enumerate(zip(source.tolist(), target.tolist()))
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+st.markdown("# Progressive Loading")
+st.markdown(
+    """
+    With `progressive=True`, the first elements are added in time slices,
+    nodes then edges, while a progress bar is shown: the graph is displayed
+    and can be panned while it loads. Nodes with a `position` are placed
+    right away and no layout is run. Otherwise the layout runs once loaded,
+    and its positions are cached in the browser session for the next load
+    of the same elements.
+    """
+)
+
+left, right = st.columns(2)
+n_nodes = left.select_slider("Nodes", [2000, 10000, 20000, 40000], 10000)
+with_positions = right.toggle("Nodes with positions", value=True)
+
+elements = make_graph(n_nodes, with_positions)
+
+streamlit_cytoscape(
+    elements,
+    {"name": "preset"} if with_positions else "fcose",
+    [NodeStyle("NODE", "#2A629A", None, None)],
+    [EdgeStyle("LINK")],
+    compact=True,
+    progressive=True,
+    key=f"progressive_{n_nodes}_{with_positions}",
+)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        streamlit_cytoscape(
+            elements,  # nodes with a "position"
+            {"name": "preset"},
+            node_styles,
+            edge_styles,
+            compact=True,
+            progressive=True,
+            key="graph",
+        )
+        """,
+        language="python",
+    )
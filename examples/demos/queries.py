@@ -0,0 +1,85 @@
+import json
+import streamlit as st
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    GraphIndex,
+    register_elements,
+)
+from streamlit_cytoscape.queries import (
+    common_neighbors,
+    shortest_path,
+    simple_paths,
+)
+
+
+@st.cache_resource
+def load_graph():
+    with open("./data/claims.json", "r") as f:
+        elements = json.load(f)
+    return elements, GraphIndex(elements)
+
+
+elements, index = load_graph()
+
+st.markdown("# Graph Queries")
+st.markdown(
+    """
+    `streamlit_cytoscape.queries` answers "how is A connected to B" on the
+    CSR arrays of a `GraphIndex`: shortest paths, all simple paths up to a
+    length and common neighbors. The result is a `Highlight`, applied to the
+    displayed graph in one batch (the other elements are faded out and the
+    viewport fits the result) without resending the elements.
+    """
+)
+
+query = st.radio(
+    "Query",
+    ["Shortest path", "Simple paths", "Common neighbors"],
+    horizontal=True,
+)
+left, middle, right = st.columns(3)
+source = left.selectbox("Source", index.ids, index=index.ids.index("p21"))
+target = middle.selectbox("Target", index.ids, index=index.ids.index("p22"))
+max_length = right.number_input("Max length", 1, 8, 6)
+
+if query == "Shortest path":
+    result = shortest_path(index, source, target)
+elif query == "Simple paths":
+    result = simple_paths(index, source, target, max_length, limit=50)
+else:
+    result = common_neighbors(index, [source, target])
+
+node_styles = [
+    NodeStyle("CLAIM", "#a87c2a", "claim_id", "description"),
+    NodeStyle("CAR", "#028391", None, "directions_car"),
+    NodeStyle("PERSON", "#01204E", "name", "person"),
+]
+
+st.markdown(
+    f"**{len(result.paths)} path(s), {len(result.node_ids)} node(s)**"
+    if query != "Common neighbors"
+    else f"**{len(result.node_ids) - 2} common neighbor(s)**"
+)
+streamlit_cytoscape(
+    register_elements(elements),
+    "fcose",
+    node_styles,
+    highlight=result,
+    key="queries",
+)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        from streamlit_cytoscape.queries import shortest_path
+
+        @st.cache_resource
+        def load_graph():
+            return GraphIndex(elements)
+
+        result = shortest_path(load_graph(), "p21", "p22")
+        streamlit_cytoscape(elements, highlight=result, key="queries")
+        """,
+        language="python",
+    )
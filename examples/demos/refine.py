@@ -0,0 +1,72 @@
+import numpy as np
+import streamlit as st
+from streamlit_cytoscape import streamlit_cytoscape, NodeStyle, EdgeStyle
+from streamlit_cytoscape.layouts import LAYOUTS
+
+
+@st.cache_data
+def make_graph(n_nodes, seed=0):
+    """Random clustered graph, edges mostly within clusters."""
+    rng = np.random.default_rng(seed)
+    clusters = rng.integers(0, 12, n_nodes)
+    order = np.argsort(clusters, kind="stable")
+    rank = np.empty(n_nodes, dtype=np.int64)
+    rank[order] = np.arange(n_nodes)
+    source = rng.integers(0, n_nodes, 2 * n_nodes)
+    target = order[(rank[source] + rng.integers(1, 30, len(source))) % n_nodes]
+    nodes = [
+        {"data": {"id": f"n{i}", "label": "NODE"}} for i in range(n_nodes)
+    ]
+    edges = [
+        {
+            "data": {
+                "id": f"e{k}",
+                "source": f"n{s}",
+                "target": f"n{t}",
+                "label": "LINK",
+            }
+        }
+        for k, (s, t) in enumerate(zip(source.tolist(), target.tolist()))
+        if s != t
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+st.markdown("# Layout Refinement")
+st.markdown(
+    """
+    The 'refine' layout places the nodes right away with a cheap layout, so
+    the graph is displayed and interactive at once. A force directed layout
+    then refines the positions in a Web Worker, round by round, and the
+    nodes are animated toward the positions of each round. The view follows
+    the nodes until you pan or zoom. Nodes given a position (e.g. computed
+    on the server) are refined from there.
+    """
+)
+
+left, middle, right = st.columns(3)
+n_nodes = left.select_slider("Nodes", [200, 1000, 3000, 10000], 1000)
+initial = middle.selectbox("Initial positions", ["grid", "circle"])
+rounds = right.slider("Rounds", 1, 10, 5)
+
+elements = make_graph(n_nodes)
+layout = {**LAYOUTS["refine"], "initial": initial, "rounds": rounds}
+
+streamlit_cytoscape(
+    elements,
+    layout,
+    [NodeStyle("NODE", "#2A629A")],
+    [EdgeStyle("LINK", "#A0A0A0")],
+    key="refine",
+)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        from streamlit_cytoscape.layouts import LAYOUTS
+
+        layout = {**LAYOUTS["refine"], "initial": "grid", "rounds": 5}
+        streamlit_cytoscape(elements, layout, key="graph")
+        """,
+        language="python",
+    )
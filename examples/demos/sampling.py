@@ -0,0 +1,99 @@
+import numpy as np
+import streamlit as st
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    EdgeStyle,
+    GraphIndex,
+    GraphOverlay,
+)
+from streamlit_cytoscape.metrics import compute_metrics
+from streamlit_cytoscape.sampling import METHODS, sample_nodes
+
+
+@st.cache_resource
+def load_base_graph(n_nodes=50000, seed=0):
+    """Random graph with hubs: edges mostly from high weight nodes."""
+    rng = np.random.default_rng(seed)
+    weight = rng.pareto(1.5, n_nodes) + 1
+    source = rng.choice(n_nodes, 5 * n_nodes, p=weight / weight.sum())
+    target = rng.integers(0, n_nodes, 5 * n_nodes)
+    nodes = [
+        {"data": {"id": f"n{i}", "label": "NODE", "name": f"Node {i}"}}
+        for i in range(n_nodes)
+    ]
+    edges = [
+        {
+            "data": {
+                "id": f"e{k}",
+                "source": f"n{s}",
+                "target": f"n{t}",
+                "label": "LINK",
+            }
+        }
+        for k, (s, t) in enumerate(zip(source.tolist(), target.tolist()))
+        if s != t
+    ]
+    return GraphIndex({"nodes": nodes, "edges": edges})
+
+
+st.markdown("# Graph Sampling")
+st.markdown(
+    """
+    `streamlit_cytoscape.sampling` previews huge graphs with a connected,
+    representative sample of a target size, computed with NumPy over the
+    `GraphIndex` arrays and reproducible for a given seed: random walk,
+    forest fire, degree stratified, or the top nodes by a metric with the
+    paths between them. The sample is shown through a `GraphOverlay` of the
+    full graph, so double-clicking a node expands it from the full graph.
+    """
+)
+
+base = load_base_graph()
+left, middle, right = st.columns(3)
+method = left.selectbox("Method", METHODS, 1)
+size = middle.select_slider("Sample size", [100, 300, 1000], 300)
+seed = right.number_input("Seed", min_value=0, value=0)
+
+node_ids = sample_nodes(base, size, method, seed=seed)
+state_key = f"sampling_{method}_{size}_{seed}"
+if state_key not in st.session_state:
+    st.session_state[state_key] = GraphOverlay(base, node_ids)
+overlay = st.session_state[state_key]
+
+degree = base.degree
+sampled = degree[[base.position(i) for i in node_ids]]
+st.caption(
+    f"{len(node_ids):,} of {len(base):,} nodes. Median degree in the "
+    f"sample {np.median(sampled):.0f}, in the graph {np.median(degree):.0f}."
+)
+
+metrics = compute_metrics(base, ["degree"])
+
+
+def on_change():
+    overlay.handle_action(st.session_state[state_key + "_graph"])
+
+
+streamlit_cytoscape(
+    overlay,
+    "fcose",
+    [NodeStyle("NODE", "#2A629A", size=metrics.map_data("degree", 15, 45))],
+    [EdgeStyle("LINK", "#A0A0A0")],
+    node_actions=["expand"],
+    expand_limit=20,
+    on_change=on_change,
+    key=state_key + "_graph",
+)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        from streamlit_cytoscape.sampling import sample_nodes
+
+        node_ids = sample_nodes(index, 300, "forest_fire", seed=0)
+        overlay = GraphOverlay(index, node_ids)
+        streamlit_cytoscape(overlay, node_actions=["expand"], key="g")
+        """,
+        language="python",
+    )
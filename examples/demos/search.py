@@ -0,0 +1,45 @@
+import json
+import streamlit as st
+from streamlit_cytoscape import streamlit_cytoscape, NodeStyle
+
+with open("./data/claims.json", "r") as f:
+    elements = json.load(f)
+
+st.markdown("# Search")
+st.markdown(
+    """
+    `search_fields` adds a search box to the toolbar, backed by an index of
+    the given node data fields built in the browser (in a web worker) once per
+    elements version. Matches are ranked exact, prefix, word prefix, then
+    substring. Pick a result (click, or arrows and `Enter`) to select the
+    node and zoom to it.
+    """
+)
+
+node_styles = [
+    NodeStyle("CLAIM", "#a87c2a", "claim_id", "description"),
+    NodeStyle("CAR", "#028391", None, "directions_car"),
+    NodeStyle("PERSON", "#01204E", "name", "person"),
+]
+
+streamlit_cytoscape(
+    elements,
+    "fcose",
+    node_styles,
+    search_fields=["name", "claimant_name", "claim_id", "id"],
+    key="search",
+)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        streamlit_cytoscape(
+            elements,
+            "fcose",
+            node_styles,
+            search_fields=["name", "claimant_name", "claim_id", "id"],
+            key="search",
+        )
+        """,
+        language="python",
+    )
@@ -0,0 +1,91 @@
+import random
+
+import streamlit as st
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    EdgeStyle,
+    ElementStream,
+    cytoscape_fragment,
+)
+
+
+def transfers(n_accounts=200, seed=0):
+    """Endless stream of batches of transfers between accounts."""
+    rng = random.Random(seed)
+    k = 0
+    while True:
+        nodes, edges = [], []
+        for _ in range(rng.randint(1, 5)):
+            a, b = rng.sample(range(n_accounts), 2)
+            # pushing the accounts again keeps them while active
+            nodes += [
+                {"data": {"id": f"a{i}", "label": "ACCOUNT"}} for i in (a, b)
+            ]
+            edges.append(
+                {
+                    "data": {
+                        "id": f"t{k}",
+                        "source": f"a{a}",
+                        "target": f"a{b}",
+                        "label": "TRANSFER",
+                        "amount": rng.randint(10, 5000),
+                    }
+                }
+            )
+            k += 1
+        yield {"nodes": nodes, "edges": edges}
+
+
+st.markdown("# Live Streaming")
+st.markdown(
+    """
+    An `ElementStream` keeps a bounded window of the latest elements pushed
+    to it, evicting the oldest first (evicted accounts take their transfers
+    with them). Passed in place of the elements, only the elements pushed or
+    evicted since the last update are sent, and added to the graph in one
+    batch: the payload stays small however long the stream runs. Here, a
+    fragment pulls new transfers from a generator every second.
+    """
+)
+
+max_elements = st.select_slider(
+    "Elements kept", [100, 300, 1000, 3000], value=300
+)
+if st.session_state.get("stream_max") != max_elements:
+    st.session_state.stream = ElementStream(max_elements=max_elements)
+    st.session_state.stream_max = max_elements
+    st.session_state.transfers = transfers()
+stream = st.session_state.stream
+paused = st.toggle("Pause", value=False)
+
+
+@cytoscape_fragment(run_every=None if paused else 1)
+def live_graph():
+    stream.consume(st.session_state.transfers, max_batches=1)
+    streamlit_cytoscape(
+        stream,
+        "fcose",
+        [NodeStyle("ACCOUNT", "#2A629A", None, "account_balance")],
+        [EdgeStyle("TRANSFER", "#FF7F3E", "amount", directed=True)],
+        key="streaming",
+    )
+    st.caption(f"Version {stream.version}: {len(stream)} elements kept")
+
+
+live_graph()
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        stream = ElementStream(max_elements=300)  # or window=seconds
+
+        @cytoscape_fragment(run_every=1)
+        def live_graph():
+            stream.consume(batches, max_batches=1)  # queue or generator
+            streamlit_cytoscape(stream, "fcose", key="streaming")
+
+        live_graph()
+        """,
+        language="python",
+    )
@@ -0,0 +1,79 @@
+import json
+import streamlit as st
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    EdgeStyle,
+    Event,
+)
+
+with open("./data/social.json", "r") as f:
+    elements = json.load(f)
+
+if "telemetry_reports" not in st.session_state:
+    st.session_state.telemetry_reports = []
+
+st.markdown("# Telemetry")
+st.markdown(
+    """
+    With `telemetry`, the frontend times its phases (arguments parsing,
+    elements update, style, layout, first paint, event round trips) and
+    reports them to Python with the element counts and the JS heap size.
+    Reports are logged to the `streamlit_cytoscape.telemetry` logger and
+    passed to the given hook. They ride along with returned values (e.g.
+    when clicking a node). With `telemetry_interval`, they are also sent
+    every `telemetry_interval` seconds when new phases were measured,
+    each periodic report rerunning the app.
+    """
+)
+
+node_styles = [
+    NodeStyle("PERSON", "#FF7F3E", "name", "person"),
+    NodeStyle("POST", "#2A629A", "created_at", "description"),
+]
+
+edge_styles = [
+    EdgeStyle("FOLLOWS", "#A0C878", caption="label", directed=True),
+    EdgeStyle("POSTED", caption="label", directed=True),
+    EdgeStyle("QUOTES", caption="label", directed=True),
+]
+
+events = [Event("clicked_node", "click tap", "node")]
+
+vals = streamlit_cytoscape(
+    elements,
+    "fcose",
+    node_styles,
+    edge_styles,
+    events=events,
+    telemetry=st.session_state.telemetry_reports.append,
+    telemetry_interval=2,
+    key="telemetry",
+)
+
+col1, col2 = st.columns(2)
+with col1:
+    st.markdown("#### Returned Value")
+    st.json(vals or {}, expanded=True)
+with col2:
+    reports = st.session_state.telemetry_reports
+    st.markdown("#### Last Report (%i received)" % len(reports))
+    st.json(reports[-1] if reports else {}, expanded=True)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        reports = []
+        vals = streamlit_cytoscape(
+            elements,
+            "fcose",
+            node_styles,
+            edge_styles,
+            events=[Event("clicked_node", "click tap", "node")],
+            telemetry=reports.append,  # or True to only log them
+            telemetry_interval=2,  # opt-in, each report reruns the app
+            key="telemetry",
+        )
+        """,
+        language="python",
+    )
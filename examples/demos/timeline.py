@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+
+import numpy as np
+import streamlit as st
+from streamlit_cytoscape import (
+    streamlit_cytoscape,
+    NodeStyle,
+    EdgeStyle,
+    Event,
+    Timeline,
+)
+
+
+@st.cache_data
+def make_transactions(n_accounts=400, n_transactions=4000, seed=0):
+    """Random transactions between accounts over 2024, each shown for
+    30 days. Accounts are shown from their first transaction on."""
+    rng = np.random.default_rng(seed)
+    day0 = date(2024, 1, 1)
+    days = np.sort(rng.integers(0, 366, n_transactions))
+    # a few busy accounts
+    weights = rng.pareto(1.5, n_accounts) + 1
+    weights /= weights.sum()
+    source = rng.choice(n_accounts, n_transactions, p=weights)
+    target = rng.choice(n_accounts, n_transactions, p=weights)
+    first = np.full(n_accounts, 366)
+    np.minimum.at(first, source, days)
+    np.minimum.at(first, target, days)
+    nodes = [
+        {
+            "data": {
+                "id": f"a{i}",
+                "label": "ACCOUNT",
+                "start": (day0 + timedelta(days=int(d))).isoformat(),
+            }
+        }
+        for i, d in enumerate(first.tolist())
+    ]
+    edges = [
+        {
+            "data": {
+                "id": f"t{k}",
+                "source": f"a{s}",
+                "target": f"a{t}",
+                "label": "TRANSFER",
+                "start": (day0 + timedelta(days=d)).isoformat(),
+                "end": (day0 + timedelta(days=d + 30)).isoformat(),
+            }
+        }
+        for k, (s, t, d) in enumerate(
+            zip(source.tolist(), target.tolist(), days.tolist())
+        )
+        if s != t
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+st.markdown("# Temporal Playback")
+st.markdown(
+    """
+    With a `Timeline`, elements carry `start` / `end` times and the whole
+    timeline is sent once. Use the slider or the play button below the graph:
+    the browser keeps an interval index of the elements and only shows or
+    hides those starting or ending between two frames, without rerunning the
+    app. The current time is reported lazily under `timeline`, with the next
+    returned value (e.g. after clicking a node).
+    """
+)
+
+vals = streamlit_cytoscape(
+    make_transactions(),
+    "fcose",
+    [NodeStyle("ACCOUNT", "#2A629A", None, "account_balance")],
+    [EdgeStyle("TRANSFER", "#FF7F3E", directed=True)],
+    events=[Event("clicked_node", "click tap", "node")],
+    timeline=Timeline(dtype="date", duration=20, loop=True),
+    compact=True,
+    key="timeline",
+)
+st.markdown("#### Returned Value")
+st.json(vals or {}, expanded=True)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        vals = streamlit_cytoscape(
+            elements,  # with "start" / "end" ISO dates in the data
+            "fcose",
+            node_styles,
+            edge_styles,
+            timeline=Timeline(dtype="date", duration=20, loop=True),
+            key="timeline",
+        )
+        current_time = (vals or {}).get("timeline")
+        """,
+        language="python",
+    )
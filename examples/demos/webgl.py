@@ -0,0 +1,83 @@
+import numpy as np
+import streamlit as st
+from streamlit_cytoscape import streamlit_cytoscape, NodeStyle, EdgeStyle
+
+
+@st.cache_data
+def make_graph(n_nodes, seed=0):
+    """Random geometric-like graph: nodes linked to nearby nodes."""
+    rng = np.random.default_rng(seed)
+    xy = rng.uniform(0, 40 * np.sqrt(n_nodes), (n_nodes, 2))
+    # nodes sorted by vertical strip, linked to the next ones
+    order = np.lexsort((xy[:, 1], xy[:, 0] // 200))
+    rank = np.repeat(np.arange(n_nodes), 2)
+    source = order[rank]
+    target = order[(rank + np.tile([1, 7], n_nodes)) % n_nodes]
+    labels = np.where(rng.random(n_nodes) < 0.2, "HUB", "NODE")
+    nodes = [
+        {
+            "data": {"id": f"n{i}", "label": labels[i]},
+            "position": {"x": float(x), "y": float(y)},
+        }
+        for i, (x, y) in enumerate(xy.tolist())
+    ]
+    edges = [
+        {
+            "data": {
+                "id": f"e{k}",
+                "source": f"n{s}",
+                "target": f"n{t}",
+                "label": "LINK",
+            }
+        }
+        for k, (s, t) in enumerate(zip(source.tolist(), target.tolist()))
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+st.markdown("# WebGL Renderer")
+st.markdown(
+    """
+    `renderer="webgl"` enables the WebGL mode of the Cytoscape renderer:
+    nodes, edges and labels are drawn in batches on the GPU, with the node
+    and edge styles (icons included) rendered to textures. It falls back to
+    the canvas renderer when WebGL2 is unavailable. Compare panning and
+    zooming with both renderers.
+    """
+)
+
+left, right = st.columns(2)
+n_nodes = left.select_slider("Nodes", [10000, 30000, 50000], 30000)
+renderer = right.radio("Renderer", ["webgl", "canvas"], horizontal=True)
+
+streamlit_cytoscape(
+    make_graph(n_nodes),
+    {"name": "preset"},
+    [
+        NodeStyle("NODE", "#2A629A"),
+        NodeStyle("HUB", "#FF7F3E", icon="person"),
+    ],
+    [EdgeStyle("LINK", curve_style="haystack")],
+    compact=True,
+    progressive=True,
+    renderer=renderer,
+    # the renderer is set once, a new key remounts the component
+    key=f"webgl_{n_nodes}_{renderer}",
+)
+
+with st.expander("Snippet", expanded=False, icon="💻"):
+    st.code(
+        """
+        streamlit_cytoscape(
+            elements,
+            {"name": "preset"},
+            node_styles,
+            edge_styles,
+            compact=True,
+            progressive=True,
+            renderer="webgl",
+            key="graph",
+        )
+        """,
+        language="python",
+    )
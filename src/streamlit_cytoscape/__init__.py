@@ -1,5 +1,26 @@
 from streamlit_cytoscape.component import streamlit_cytoscape
 from streamlit_cytoscape.styles import NodeStyle, EdgeStyle
 from streamlit_cytoscape.events import Event
+from streamlit_cytoscape.filters import Filter
+from streamlit_cytoscape.timeline import Timeline
+from streamlit_cytoscape.datasets import register_elements
+from streamlit_cytoscape.graph import GraphIndex
+from streamlit_cytoscape.overlay import GraphOverlay
+from streamlit_cytoscape.streaming import ElementStream
+from streamlit_cytoscape.fragment import cytoscape_fragment
+from streamlit_cytoscape.queries import Highlight
 
-__all__ = ["streamlit_cytoscape", "NodeStyle", "EdgeStyle", "Event"]
+__all__ = [
+    "streamlit_cytoscape",
+    "NodeStyle",
+    "EdgeStyle",
+    "Event",
+    "Filter",
+    "Timeline",
+    "register_elements",
+    "GraphIndex",
+    "GraphOverlay",
+    "ElementStream",
+    "cytoscape_fragment",
+    "Highlight",
+]
@@ -0,0 +1,55 @@
+"""
+Size bounded LRU caches of the values computed per graph version
+(metrics, orderings, foldings, samples), shared by the script threads
+of every session of the process.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    def __init__(self, maxsize: int) -> None:
+        """
+        Thread safe LRU cache of at most `maxsize` values. Values are
+        computed outside of the cache: concurrent misses of a key may
+        compute it twice, the last value put being kept.
+        """
+        self.maxsize = maxsize
+        self._values: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        Returns the value of `key`, marked as the most recently used,
+        or None if not cached.
+        """
+        with self._lock:
+            if key not in self._values:
+                return None
+            self._values.move_to_end(key)
+            return self._values[key]
+
+    def put(self, key: Hashable, value: V) -> None:
+        """
+        Caches the value of `key`, evicting the least recently used
+        values over `maxsize`.
+        """
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
@@ -1,13 +1,54 @@
 import os
+import streamlit as st
 import streamlit.components.v1 as components
-from typing import Optional, Union, Callable, Literal, Dict, Any, List
+from typing import (
+    Optional,
+    Union,
+    Callable,
+    Literal,
+    Dict,
+    Any,
+    List,
+    Tuple,
+)
 
-from streamlit_cytoscape.layouts import LAYOUTS
+from streamlit_cytoscape.layouts import LAYOUTS, _size_tiers
 from streamlit_cytoscape.styles import NodeStyle, EdgeStyle
-from streamlit_cytoscape.events import Event
+from streamlit_cytoscape.events import Event, _skip_actions
+from streamlit_cytoscape.filters import Filter
+from streamlit_cytoscape.timeline import Timeline
+from streamlit_cytoscape.datasets import (
+    HANDLE_PREFIX,
+    RESYNC_ACTION,
+    get_registry,
+)
+from streamlit_cytoscape.encoding import pack_elements
+from streamlit_cytoscape.overlay import GraphOverlay
+from streamlit_cytoscape.fragment import in_fragment
+from streamlit_cytoscape.queries import Highlight
+from streamlit_cytoscape.matrix import ORDERS, _matrix_args
+from streamlit_cytoscape.streaming import (
+    SYNC_ACTION,
+    ElementStream,
+    _handle_sync,
+    _stream_args,
+)
+from streamlit_cytoscape.profiling import (
+    _finish as _finish_profile,
+    _phase,
+    _start as _start_profile,
+)
+from streamlit_cytoscape.telemetry import (
+    TELEMETRY_ACTION,
+    TelemetryHook,
+    _handle_value,
+    _telemetry_args,
+)
 
 
 _RELEASE = True
+RENDERERS = ("canvas", "webgl")
+VIEWS = ("graph", "matrix")
 
 if not _RELEASE:
     _component_func = components.declare_component(
@@ -23,8 +64,60 @@ else:
     )
 
 
+def _elements_args(
+    elements: Union[Dict[str, Any], str, GraphOverlay],
+    key: Optional[str],
+    compact: bool,
+) -> Tuple[Optional[Union[Dict[str, Any], bytes]], Optional[str]]:
+    """
+    Returns the elements payload and its handle. The payload is None
+    when the keyed component instance already received the handle.
+    """
+    registry = get_registry()
+    if key is not None:
+        registry.resync(key, st.session_state.get(key))
+    if isinstance(elements, GraphOverlay):
+        # versioned by the overlay, only materialized when needed
+        handle = HANDLE_PREFIX + elements.handle
+        if _RELEASE and not registry.needs_payload(handle, key):
+            return None, handle
+        payload = elements.elements()
+        return (pack_elements(payload) if compact else payload), handle
+    if not isinstance(elements, str) and key is not None and in_fragment():
+        # cache elements by content between fragment reruns
+        elements = registry.register_for(key, elements)
+    if isinstance(elements, str):
+        payload = registry.get(elements)
+        if _RELEASE and not registry.needs_payload(elements, key):
+            return None, elements
+        if compact:
+            return registry.get_packed(elements), elements
+        return payload, elements
+    return (pack_elements(elements) if compact else elements), None
+
+
+def _view_matrix_args(
+    elements: Union[Dict[str, Any], str, GraphOverlay, ElementStream],
+    order: str,
+) -> Dict[str, Any]:
+    """
+    Returns the matrix view arguments, ordered once per version of the
+    elements (a dataset or overlay handle, else the content hash).
+    """
+    if isinstance(elements, ElementStream):
+        raise ValueError("the matrix view does not support streams")
+    if isinstance(elements, GraphOverlay):
+        # only materialized when not ordered yet
+        return _matrix_args(
+            elements.elements, order, HANDLE_PREFIX + elements.handle
+        )
+    if isinstance(elements, str):
+        return _matrix_args(get_registry().get(elements), order, elements)
+    return _matrix_args(elements, order)
+
+
 def streamlit_cytoscape(
-    elements: Dict[str, Any],
+    elements: Union[Dict[str, Any], str, GraphOverlay, ElementStream],
     layout: Union[str, Dict[str, Any]] = "cose",
     node_styles: List[NodeStyle] = [],
     edge_styles: List[EdgeStyle] = [],
@@ -32,28 +125,54 @@ def streamlit_cytoscape(
     key: Optional[str] = None,
     on_change: Optional[Callable[..., None]] = None,
     node_actions: List[Literal["remove", "expand"]] = [],
+    expand_depth: int = 1,
+    expand_limit: Optional[int] = None,
     edge_actions: List[Literal["collapse", "expand"]] = [],
     collapse_parallel_edges: bool = False,
     priority_edge_label: Optional[str] = None,
     meta_edge_style: Optional[Dict[str, Any]] = None,
     events: List[Event] = [],
     hide_underscore_attrs: bool = True,
+    compact: bool = False,
+    legend: bool = False,
+    filters: List[Filter] = [],
+    search_fields: List[str] = [],
+    highlight: Optional[Highlight] = None,
+    telemetry: Union[bool, TelemetryHook] = False,
+    telemetry_interval: Optional[float] = None,
+    progressive: bool = False,
+    renderer: Literal["canvas", "webgl"] = "canvas",
+    timeline: Optional[Timeline] = None,
+    view: Literal["graph", "matrix"] = "graph",
+    matrix_order: Literal["label", "degree", "cluster"] = "cluster",
+    group_by: Optional[str] = None,
+    collapse_groups: bool = False,
 ) -> Any:
     """
     Renders a link analysis graph using Cytoscape in Streamlit.
 
     Parameters
     ----------
-    elements : dict
+    elements : Union[dict, str, GraphOverlay, ElementStream]
         Graph elements data including nodes and edges. Each node
         should have an 'id', and 'label'. Each edge should have
-        an 'id', 'source', 'target', and 'label'.
+        an 'id', 'source', 'target', and 'label'. Alternatively, a
+        handle returned by `register_elements`. Instances
+        sharing a handle share one copy of the elements in the
+        browser, and keyed instances only receive the elements
+        again when the handle changes. Or a `GraphOverlay` of a
+        shared base graph, materialized only when it changed. Or an
+        `ElementStream` (requires a key), of which only the elements
+        pushed or evicted since the last update are sent.
     layout : Union[str, dict], default 'cose'
         Layout configuration for Cytoscape. If a string is
         provided, it specifies the layout name. If a dictionary
         is provided, it should contain layout options. Default is
         "cose". A list of support layouts and default settings is
-        available in `streamlit_cytoscape.layouts`
+        available in `streamlit_cytoscape.layouts`. Named layouts
+        adapt their options to the number of nodes (fewer
+        iterations, no animation above `SIZE_THRESHOLDS`), layout
+        dictionaries are used as given.
     node_styles : list[NodeStyle], default []
         A list of custom NodeStyle instances to apply styles to
         node groups in the graph
@@ -79,6 +198,14 @@ def streamlit_cytoscape(
         Streamlit app as the component's return value. CAUTION:
         keeping an edge with missing source or target IDs will
         lead to an error.
+    expand_depth: int, default 1
+        Number of hops requested by the 'expand' node action. It is
+        included as 'depth' in the action data, along with the
+        'node_ids', to be handled in a single rerun (e.g. with
+        `GraphIndex.neighborhood`).
+    expand_limit: Optional[int], default None
+        Maximum number of neighbors to add per expanded node,
+        included as 'limit' in the 'expand' action data.
     edge_actions: list[Literal['collapse', 'expand']], default []
         Specifies the actions to enable for edges. Valid options
         are 'collapse' and 'expand'. When enabled, parallel edges
@@ -111,32 +238,223 @@ def streamlit_cytoscape(
         an underscore (_) will be hidden from the infopanel. This
         allows distinguishing between user-facing data and internal
         styling/rendering data.
+    compact: bool, default False
+        If True, the elements are sent in a compact wire format:
+        node IDs are interned, edges reference their nodes by index,
+        repeated strings are interned and the payload is deflated.
+        This typically makes payloads several times smaller, and is
+        transparent to the rest of the component. Attributes with a
+        null value are dropped. Streamed elements are not deflated.
+    legend: bool, default False
+        If True, a legend panel lists the labels of `node_styles` and
+        `edge_styles`. Clicking a label shows or hides its elements
+        in the browser, without rerunning the app. The hidden labels
+        are reported lazily, with the next returned value, under
+        'hidden_labels' (e.g. {"nodes": ["POST"], "edges": []}).
+    filters: list[Filter], default []
+        A list of range filters over numeric or date attributes.
+        Elements out of range are hidden in the browser. Changing
+        the ranges does not resend the elements, and only the
+        elements crossing the bounds are updated.
+    search_fields: list[str], default []
+        Node data fields indexed by a search box in the toolbar
+        (e.g. ["name", "id"]). The index is built in the browser,
+        in a web worker, once per elements version. Matches are
+        ranked exact, prefix, word prefix then substring, and
+        picking one selects the node and zooms to it. If empty, the
+        search box is hidden.
+    highlight: Optional[Highlight], default None
+        Elements to highlight, e.g. the result of a query from
+        `streamlit_cytoscape.queries`. It is applied in one batch to
+        the displayed graph, fading out the other elements and
+        fitting the viewport to the result if requested, without
+        resending the elements.
+    telemetry: Union[bool, Callable[[dict], None]], default False
+        If True, the frontend times its phases (arguments parsing,
+        elements update, style, layout, first paint, event round
+        trips) and reports them with element counts and the JS heap
+        size, logged to the 'streamlit_cytoscape.telemetry' logger.
+        If a callable, it is also called with each report. Reports
+        are attached to the values returned by user interactions (and
+        removed from them). Requires a `key`. See
+        `streamlit_cytoscape.telemetry` for the report format.
+    telemetry_interval: Optional[float], default None
+        If set, telemetry reports are also sent every
+        `telemetry_interval` seconds when new phases were measured.
+        NOTE: each periodic report reruns the app, though it does not
+        call `on_change` and is not returned (the last other value is
+        returned instead).
+    progressive: bool, default False
+        If True, the first elements are added in time slices (nodes,
+        then edges) while a progress bar is shown, so large graphs
+        are displayed and interactive while loading instead of
+        blocking the browser. Nodes are placed at their 'position'
+        if given, else at their position cached in the browser
+        session by a previous load of the same elements; the layout
+        only runs if some nodes have no position.
+    renderer: Literal['canvas', 'webgl'], default 'canvas'
+        Cytoscape renderer. 'webgl' enables the experimental WebGL
+        mode of the canvas renderer, which draws nodes, edges and
+        labels (styles and icons included, as textures) in batches
+        on the GPU and stays interactive with 100k+ elements. It
+        falls back to 'canvas' when WebGL2 is unavailable; software
+        WebGL is enough. The renderer used is reported by
+        `telemetry`. NOTE: only defined once. Changing the renderer
+        requires remounting the component.
+    timeline: Optional[Timeline], default None
+        Temporal playback of the elements, shown between their start
+        and end times. Scrubbing and playing happen in the browser
+        over an interval index of the elements, only updating those
+        whose visibility changed, without rerunning the app. The
+        current time is reported lazily under 'timeline'.
+    view: Literal['graph', 'matrix'], default 'graph'
+        'matrix' draws the elements as an adjacency matrix on a
+        canvas instead of a node-link graph, at a cost scaling with
+        the number of nodes squared rather than with the edges.
+        Clicking a cell selects the edges between its nodes, and a
+        row label its node, returning the usual values and events.
+        No layout is run. NOTE: only defined once. Changing the view
+        requires remounting the component.
+    matrix_order: str, default 'cluster'
+        Order of the rows and columns of the matrix view: 'label',
+        'degree' or 'cluster', computed on the server, see
+        `streamlit_cytoscape.matrix`. 'cluster' groups the nodes of
+        dense clusters into blocks along the diagonal.
+    group_by: Optional[str], default None
+        Node data attribute (e.g. "company") by which nodes are
+        grouped under compound parent nodes, one per value. Nodes
+        without the attribute are not grouped. Double-clicking a
+        group collapses it into a single node, the edges of its
+        members being rerouted to it as aggregate edges with their
+        count. Double-clicking it again expands it. Both happen in
+        the browser, the hidden elements being cached there, and
+        the collapsed group IDs are reported lazily under
+        'collapsed_groups'. Not supported with an `ElementStream`
+        or the matrix view. NOTE: only defined once. Changing the
+        grouping requires remounting the component.
+    collapse_groups: bool, default False
+        If True, groups start collapsed: the members are cached
+        before being added, so only the groups are displayed and
+        laid out (e.g. 100k nodes as a few hundred groups). Groups
+        collapsed or expanded by hand keep their state when the
+        elements change.
     """
-    node_styles_dump = [n.dump() for n in node_styles]
-    edge_styles_dump = [e.dump() for e in edge_styles]
-    style = node_styles_dump + edge_styles_dump
+    call = _start_profile(key)
+
+    with _phase(call, "styles"):
+        node_styles_dump = [n.dump() for n in node_styles]
+        edge_styles_dump = [e.dump() for e in edge_styles]
+        style = node_styles_dump + edge_styles_dump
 
-    height_str = str(height) + "px"
+        events_dump = [e.dump() for e in events]
+        filters_dump = [f.dump() for f in filters]
+        timeline_dump = timeline.dump() if timeline else None
 
-    if isinstance(layout, str):
-        layout_config = LAYOUTS[layout]
+        legend_entries = []
+        if legend:
+            legend_entries = [
+                {"group": "nodes", "label": n.label, "color": n.color}
+                for n in node_styles
+            ] + [
+                {"group": "edges", "label": e.label, "color": e.color}
+                for e in edge_styles
+            ]
+
+    with _phase(call, "args"):
+        if renderer not in RENDERERS:
+            raise ValueError(f"renderer must be one of {RENDERERS}")
+        if view not in VIEWS:
+            raise ValueError(f"view must be one of {VIEWS}")
+        if expand_depth < 1:
+            raise ValueError("expand_depth must be at least 1")
+        if expand_limit is not None and expand_limit < 1:
+            raise ValueError("expand_limit must be at least 1")
+        if view == "matrix" and matrix_order not in ORDERS:
+            raise ValueError(f"matrix_order must be one of {ORDERS}")
+        if group_by is not None and (
+            view == "matrix" or isinstance(elements, ElementStream)
+        ):
+            raise ValueError(
+                "group_by is not supported with an ElementStream or the "
+                "matrix view"
+            )
+
+        height_str = str(height) + "px"
+
+        if isinstance(layout, str):
+            # size-aware defaults, applied on the number of nodes
+            layout_config = {**LAYOUTS[layout]}
+            tiers = _size_tiers(layout)
+            if tiers:
+                layout_config["sizeDefaults"] = tiers
+        else:
+            layout_config = layout
+
+        stream_args = None
+        if isinstance(elements, ElementStream):
+            stream_args = _stream_args(elements, key, compact)
+            elements_payload, elements_key = None, None
+        else:
+            elements_payload, elements_key = _elements_args(
+                elements, key, compact
+            )
+
+        matrix_args = None
+        if view == "matrix":
+            matrix_args = _view_matrix_args(elements, matrix_order)
+
+        telemetry_args = _telemetry_args(telemetry, telemetry_interval, key)
+        internal_actions = [TELEMETRY_ACTION] if telemetry_args else []
+        if stream_args:
+            internal_actions.append(SYNC_ACTION)
+        if elements_key:
+            internal_actions.append(RESYNC_ACTION)
+        if internal_actions and on_change is not None and key is not None:
+            on_change = _skip_actions(key, on_change, internal_actions)
+
+        args: Dict[str, Any] = dict(
+            elements=elements_payload,
+            elementsKey=elements_key,
+            stream=stream_args,
+            style=style,
+            layout=layout_config,
+            height=height_str,
+            nodeActions=node_actions,
+            expandDepth=expand_depth,
+            expandLimit=expand_limit,
+            edgeActions=edge_actions,
+            collapseParallelEdges=collapse_parallel_edges,
+            priorityEdgeLabel=priority_edge_label,
+            metaEdgeStyle=meta_edge_style or {},
+            events=events_dump,
+            hideUnderscoreAttrs=hide_underscore_attrs,
+            legend=legend_entries,
+            filters=filters_dump,
+            searchFields=search_fields,
+            highlight=highlight.dump() if highlight else None,
+            telemetry=telemetry_args,
+            progressive=progressive,
+            renderer=renderer,
+            timeline=timeline_dump,
+            view=view,
+            matrix=matrix_args,
+            groups=(
+                {"attribute": group_by, "collapsed": collapse_groups}
+                if group_by is not None
+                else None
+            ),
+        )
+
+    if call is None:
+        value = _component_func(key=key, on_change=on_change, **args)
     else:
-        layout_config = layout
-
-    events_dump = [e.dump() for e in events]
-
-    return _component_func(
-        elements=elements,
-        style=style,
-        layout=layout_config,
-        height=height_str,
-        key=key,
-        on_change=on_change,
-        nodeActions=node_actions,
-        edgeActions=edge_actions,
-        collapseParallelEdges=collapse_parallel_edges,
-        priorityEdgeLabel=priority_edge_label,
-        metaEdgeStyle=meta_edge_style or {},
-        events=events_dump,
-        hideUnderscoreAttrs=hide_underscore_attrs,
-    )
+        call.measure(args)
+        with call.phase("component"):
+            value = _component_func(key=key, on_change=on_change, **args)
+        _finish_profile(call)
+    if stream_args:
+        value = _handle_sync(value, key)
+    value = _handle_value(value, key, telemetry)
+    if elements_key and key is not None:
+        value = get_registry().handle_value(key, value)
+    return value
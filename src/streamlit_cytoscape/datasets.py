@@ -0,0 +1,207 @@
+"""
+Session scoped registry of graph elements shared between component
+instances. Elements are registered once and referenced by a handle,
+so several `streamlit_cytoscape()` instances can display the same
+graph without each of them shipping and storing its own copy.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+from streamlit_cytoscape.encoding import pack_elements
+
+REGISTRY_KEY = "_streamlit_cytoscape_datasets"
+HANDLE_PREFIX = "dataset:"
+# action of the browser requesting elements missing from its cache
+RESYNC_ACTION = "dataset_sync"
+# registered elements kept per session, as many as the browser cache
+# (MAX_DATASETS of frontend/src/utils/cache.js) keeps
+MAX_DATASETS = 8
+
+
+class DatasetRegistry:
+    def __init__(self) -> None:
+        """
+        Holds registered elements and tracks which handle was last
+        delivered to each keyed component instance. Use
+        `get_registry()` to access the registry of the current
+        session. At most `MAX_DATASETS` registered elements are kept,
+        the least recently used being evicted.
+        """
+        self.datasets: Dict[str, Dict[str, Any]] = {}
+        self.delivered: Dict[str, str] = {}
+        self.owned: Dict[str, str] = {}
+        self.pinned: "OrderedDict[str, None]" = OrderedDict()
+        self.packed: Dict[str, bytes] = {}
+        self.synced: Dict[str, Any] = {}
+        self.values: Dict[str, Any] = {}
+
+    def register(self, elements: Dict[str, Any]) -> str:
+        handle = self._store(elements)
+        self.pinned[handle] = None
+        self.pinned.move_to_end(handle)
+        while len(self.pinned) > MAX_DATASETS:
+            self._evict(next(iter(self.pinned)))
+        return handle
+
+    def _evict(self, handle: str) -> None:
+        """
+        Drops registered elements, unless still used by a component
+        instance they were registered for. The browser cache evicts
+        them as well, and they are sent again when registered again.
+        """
+        del self.pinned[handle]
+        if handle not in self.owned.values():
+            self.datasets.pop(handle, None)
+            self.packed.pop(handle, None)
+        self.delivered = {
+            k: h for k, h in self.delivered.items() if h != handle
+        }
+
+    def register_for(self, key: str, elements: Dict[str, Any]) -> str:
+        """
+        Registers elements on behalf of the component instance `key`
+        (e.g. elements passed as dict inside a fragment), dropping
+        the elements it registered previously if no longer used.
+        """
+        handle = self._store(elements)
+        previous = self.owned.get(key)
+        self.owned[key] = handle
+        unused = previous not in self.owned.values()
+        if previous and unused and previous not in self.pinned:
+            self.datasets.pop(previous, None)
+            self.packed.pop(previous, None)
+        return handle
+
+    def _store(self, elements: Dict[str, Any]) -> str:
+        handle = HANDLE_PREFIX + _fingerprint(elements)
+        self.datasets.setdefault(handle, elements)
+        return handle
+
+    def get(self, handle: str) -> Dict[str, Any]:
+        if handle not in self.datasets:
+            raise KeyError(
+                f"'{handle}' is not a registered dataset, only the last "
+                f"{MAX_DATASETS} registered datasets are kept"
+            )
+        if handle in self.pinned:
+            self.pinned.move_to_end(handle)
+        return self.datasets[handle]
+
+    def get_packed(self, handle: str) -> bytes:
+        """
+        Returns the elements behind `handle` in the compact wire
+        format, packed once per handle.
+        """
+        if handle not in self.packed:
+            self.packed[handle] = pack_elements(self.get(handle))
+        return self.packed[handle]
+
+    def remove(self, handle: str) -> None:
+        self.datasets.pop(handle, None)
+        self.packed.pop(handle, None)
+        self.pinned.pop(handle, None)
+        self.delivered = {
+            k: h for k, h in self.delivered.items() if h != handle
+        }
+
+    def needs_payload(self, handle: str, key: Optional[str]) -> bool:
+        """
+        Returns True if the elements behind `handle` have to be sent
+        to the component instance identified by `key`. Instances
+        without a key cannot be tracked and always receive them.
+        """
+        if key is None:
+            return True
+        if self.delivered.get(key) == handle:
+            return False
+        self.delivered[key] = handle
+        return True
+
+    def resync(self, key: str, value: Any) -> None:
+        """
+        Forgets the handle delivered to the component instance `key`
+        when its last returned `value` requests the elements again,
+        so they are sent on this run. The browser cache is shared by
+        the page and bounded, and loses the elements of a handle when
+        evicted or when the page is reloaded. Each request is handled
+        once, as values are returned again on every rerun.
+        """
+        if not _is_resync(value):
+            return
+        if value.get("timestamp") != self.synced.get(key):
+            self.synced[key] = value.get("timestamp")
+            self.delivered.pop(key, None)
+
+    def handle_value(self, key: str, value: Any) -> Any:
+        """
+        Resync requests are not returned: the last other value of the
+        component instance `key` is returned instead.
+        """
+        if _is_resync(value):
+            return self.values.get(key)
+        self.values[key] = value
+        return value
+
+
+def _is_resync(value: Any) -> bool:
+    return isinstance(value, dict) and value.get("action") == RESYNC_ACTION
+
+
+def _fingerprint(elements: Dict[str, Any]) -> str:
+    dump = json.dumps(elements, sort_keys=True, default=str)
+    return hashlib.sha1(dump.encode("utf-8")).hexdigest()
+
+
+def get_registry() -> DatasetRegistry:
+    if REGISTRY_KEY not in st.session_state:
+        st.session_state[REGISTRY_KEY] = DatasetRegistry()
+    return st.session_state[REGISTRY_KEY]
+
+
+def register_elements(elements: Dict[str, Any]) -> str:
+    """
+    Register graph elements for the current session and get a handle
+    that can be passed to `streamlit_cytoscape()` in place of the
+    elements.
+
+    Parameters
+    ----------
+    elements : dict
+        Graph elements data including nodes and edges, in the same
+        format accepted by `streamlit_cytoscape()`.
+
+    Returns
+    -------
+    str
+        A content based handle. Registering identical elements again
+        returns the same handle, changed elements get a new one. The
+        registered elements should be treated as immutable. Only the
+        last 8 used datasets are kept per session, so elements should
+        be registered on every run rather than once.
+
+    Example
+    -------
+    >>> handle = register_elements(elements)
+    >>> streamlit_cytoscape(handle, layout="fcose", key="graph1")
+    >>> streamlit_cytoscape(handle, layout="circle", key="graph2")
+    """
+    return get_registry().register(elements)
+
+
+def get_elements(handle: str) -> Dict[str, Any]:
+    """
+    Returns the elements registered under `handle`.
+    """
+    return get_registry().get(handle)
+
+
+def unregister_elements(handle: str) -> None:
+    """
+    Removes the elements registered under `handle` from the session.
+    """
+    get_registry().remove(handle)
@@ -0,0 +1,262 @@
+"""
+Compact wire format of the graph elements. Elements are sent column
+by column: node IDs are interned and edges reference their source and
+target by node index, strings repeated anywhere in the elements are
+interned in a shared table, sequential IDs (e.g. 'e1', 'e2', ...) are
+sent as a range and other repeated values are dictionary encoded. The
+encoded elements are sent deflated, as bytes, and the frontend inflates
+and decodes them back into cytoscape elements.
+"""
+
+import json
+import re
+import zlib
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+COMPACT_FORMAT = "compact"
+# dictionary encode a column if it has at most this ratio of distinct
+# values
+DICTIONARY_RATIO = 0.5
+# zlib compression level of the packed elements
+COMPRESSION_LEVEL = 6
+
+_SUFFIX = re.compile(r"(0|[1-9][0-9]*)$")
+
+
+def encode_elements(elements: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Encodes graph elements in the compact wire format.
+
+    Parameters
+    ----------
+    elements : dict
+        Graph elements data including nodes and edges, in the same
+        format accepted by `streamlit_cytoscape()`.
+
+    Returns
+    -------
+    dict
+        The encoded elements, of the form::
+
+            {
+                "format": "compact",
+                "strings": [...],  # interned strings
+                "ids": {...},  # node IDs, edges refer to their index
+                "nodes": {"length": n, "data": {...}, "fields": {...}},
+                "edges": {"length": m, "data": {...}, "fields": {...}},
+            }
+
+        where "data" holds one column per data attribute and "fields"
+        one column per other element field (e.g. "position"). Columns
+        are either {"values": [...]}, {"range": [prefix, start]} for
+        the strings prefix + str(start + i), {"strings": [...]} where
+        ints are indices in "strings" and strings are not repeated,
+        or {"dictionary": [...], "codes": [...]}. Missing values are
+        null (code -1); columns with mostly missing values only hold
+        the values of the rows listed in "rows". Edge "source" and
+        "target" columns hold node indices, or IDs for nodes missing
+        from the elements. The edge "id" column is {"join": separator}
+        when edge IDs are source + separator + target.
+
+    Notes
+    -----
+    Data attributes with a null value are dropped by the encoding.
+    """
+    nodes = elements.get("nodes", [])
+    edges = elements.get("edges", [])
+    ids = [n["data"]["id"] for n in nodes]
+    index = {str(_id): i for i, _id in enumerate(ids)}
+
+    node_columns = _columns(nodes, skip=("id",))
+    # edge IDs made of their source and target IDs are not sent
+    separator = _separator(edges)
+    skip = ("source", "target") + (("id",) if separator is not None else ())
+    edge_columns = _columns(edges, skip=skip)
+    counts: Counter = Counter()
+    for values in [ids, *_values(node_columns), *_values(edge_columns)]:
+        if _is_strings(values):
+            counts.update(v for v in values if v is not None)
+    # the most frequent strings get the shortest indices
+    strings = [s for s, count in counts.most_common() if count > 1]
+    interned = {s: i for i, s in enumerate(strings)}
+
+    encoded_edges = _encode_group(edge_columns, interned)
+    if separator is not None:
+        encoded_edges["data"]["id"] = {"join": separator}
+    for end in ("source", "target"):
+        encoded_edges["data"][end] = {
+            "values": [
+                index.get(str(e["data"][end]), str(e["data"][end]))
+                for e in edges
+            ]
+        }
+    return {
+        "format": COMPACT_FORMAT,
+        "strings": strings,
+        "ids": _encode_column(ids, interned),
+        "nodes": _encode_group(node_columns, interned),
+        "edges": encoded_edges,
+    }
+
+
+def pack_elements(elements: Dict[str, Any]) -> bytes:
+    """
+    Encodes graph elements in the compact wire format, deflated (zlib
+    format), as sent to the frontend.
+    """
+    encoded = json.dumps(
+        encode_elements(elements), separators=(",", ":"), default=str
+    )
+    return zlib.compress(encoded.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def _columns(
+    group: List[Dict[str, Any]], skip: tuple = ()
+) -> Dict[str, Any]:
+    """
+    Values of each data attribute and other field of the elements,
+    by key.
+    """
+    data_keys: Dict[str, None] = {}
+    field_keys: Dict[str, None] = {}
+    for el in group:
+        data_keys.update(dict.fromkeys(el["data"]))
+        field_keys.update(dict.fromkeys(k for k in el if k != "data"))
+    return {
+        "length": len(group),
+        "data": {
+            key: [el["data"].get(key) for el in group]
+            for key in data_keys
+            if key not in skip
+        },
+        "fields": {
+            key: [el.get(key) for el in group] for key in field_keys
+        },
+    }
+
+
+def _values(columns: Dict[str, Any]) -> List[List[Any]]:
+    return [*columns["data"].values(), *columns["fields"].values()]
+
+
+def _encode_group(
+    columns: Dict[str, Any], interned: Dict[str, int]
+) -> Dict[str, Any]:
+    return {
+        "length": columns["length"],
+        "data": {
+            key: _encode_column(values, interned)
+            for key, values in columns["data"].items()
+        },
+        "fields": {
+            key: _encode_column(values, interned)
+            for key, values in columns["fields"].items()
+        },
+    }
+
+
+def _encode_column(
+    values: List[Any], interned: Dict[str, int]
+) -> Dict[str, Any]:
+    present = [i for i, v in enumerate(values) if v is not None]
+    if len(present) < len(values) / 2:
+        # sparse: the values of the rows listed in "rows", null in the
+        # others
+        return {
+            "rows": present,
+            **_encode_values([values[i] for i in present], interned),
+        }
+    return _encode_values(values, interned)
+
+
+def _encode_values(
+    values: List[Any], interned: Dict[str, int]
+) -> Dict[str, Any]:
+    if _is_strings(values):
+        start = _range(values)
+        if start is not None:
+            return {"range": start}
+        return {
+            "strings": [
+                interned.get(v, v) if v is not None else None
+                for v in values
+            ]
+        }
+    dictionary = _dictionary(values)
+    if dictionary is None:
+        return {"values": values}
+    positions = {v: i for i, v in enumerate(dictionary)}
+    return {
+        "dictionary": dictionary,
+        "codes": [-1 if v is None else positions[v] for v in values],
+    }
+
+
+def _separator(edges: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Returns the separator of edge IDs made of the IDs of their source
+    and target (source + separator + target), None if they are not.
+    """
+    if not edges or not isinstance(edges[0]["data"].get("id"), str):
+        return None
+    first = edges[0]["data"]
+    _id, source, target = first["id"], first["source"], first["target"]
+    source, target = str(source), str(target)
+    matches = _id.startswith(source) and _id.endswith(target)
+    if not matches or len(_id) < len(source) + len(target):
+        return None
+    start, end = len(source), len(_id) - len(target)
+    separator = _id[start:end]
+    for e in edges:
+        data = e["data"]
+        joined = f"{data['source']}{separator}{data['target']}"
+        if data.get("id") != joined:
+            return None
+    return separator
+
+
+def _is_strings(values: List[Any]) -> bool:
+    """
+    Returns True if the non-null values of a column are all strings.
+    """
+    return any(isinstance(v, str) for v in values) and all(
+        v is None or isinstance(v, str) for v in values
+    )
+
+
+def _range(values: List[Any]) -> Optional[List[Any]]:
+    """
+    Returns [prefix, start] if the values are the strings
+    prefix + str(start + i), None otherwise.
+    """
+    if not values or values[0] is None:
+        return None
+    match = _SUFFIX.search(values[0])
+    if match is None:
+        return None
+    prefix = values[0][: match.start()]
+    start = int(match.group())
+    for i, v in enumerate(values):
+        if v != f"{prefix}{start + i}":
+            return None
+    return [prefix, start]
+
+
+def _dictionary(values: List[Any]) -> Optional[List[Any]]:
+    """
+    Returns the distinct values of a column if it is worth dictionary
+    encoding, None otherwise.
+    """
+    distinct: Dict[Any, None] = {}
+    limit = len(values) * DICTIONARY_RATIO
+    for v in values:
+        if v is None:
+            continue
+        # bool is kept apart from the equal 0 / 1 ints
+        if not isinstance(v, (str, int, float)) or isinstance(v, bool):
+            return None
+        distinct[v] = None
+        if len(distinct) > limit:
+            return None
+    return list(distinct) if distinct else None
@@ -2,9 +2,18 @@
 For more details refer to https://js.cytoscape.org/#events
 """
 
-from typing import Dict
+from typing import Callable, Collection, Dict
 
-RESERVED_NAMES = ["remove", "expand", "expand_edge"]
+import streamlit as st
+
+RESERVED_NAMES = [
+    "remove",
+    "expand",
+    "expand_edge",
+    "telemetry",
+    "stream_sync",
+    "dataset_sync",
+]
 
 
 class Event:
@@ -47,3 +56,20 @@ class Event:
             "event_type": self.event_type,
             "selector": self.selector,
         }
+
+
+def _skip_actions(
+    key: str, on_change: Callable[..., None], actions: Collection[str]
+) -> Callable[[], None]:
+    """
+    Wraps an `on_change` callback so internal actions (e.g. periodic
+    telemetry reports) don't trigger it.
+    """
+
+    def callback() -> None:
+        value = st.session_state.get(key)
+        if isinstance(value, dict) and value.get("action") in actions:
+            return
+        on_change()
+
+    return callback
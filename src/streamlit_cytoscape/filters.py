@@ -0,0 +1,77 @@
+from datetime import date
+from typing import Any, Dict, Literal, Optional, Union
+
+Bound = Optional[Union[int, float, str, date]]
+
+
+class Filter:
+    def __init__(
+        self,
+        attribute: str,
+        min_value: Bound = None,
+        max_value: Bound = None,
+        group: Literal["nodes", "edges"] = "nodes",
+        dtype: Optional[Literal["number", "date"]] = None,
+    ) -> None:
+        """
+        Define a range filter over a numeric or date attribute of the
+        nodes or edges. Elements whose value is out of the range are
+        hidden in the browser, elements without a value are kept.
+        Filters are applied by the frontend over sorted indexes of the
+        attributes, so changing a range does not resend the elements
+        and only updates the elements crossing the bounds.
+
+        Parameters
+        ----------
+        attribute : str
+            Name of the data attribute to filter on.
+        min_value : Optional[Union[int, float, str, date]], default None
+            Inclusive lower bound. If not provided, the range has no
+            lower bound.
+        max_value : Optional[Union[int, float, str, date]], default None
+            Inclusive upper bound. If not provided, the range has no
+            upper bound.
+        group : Literal['nodes', 'edges'], default 'nodes'
+            Group of the elements to filter. Edges of hidden nodes are
+            hidden as well.
+        dtype : Optional[Literal['number', 'date']], default None
+            Type of the attribute values. Dates are compared as parsed
+            by the browser (e.g. ISO 8601 strings). If not provided,
+            'date' is used when a bound is a date or datetime, and
+            'number' otherwise.
+
+        Example
+        -------
+        >>> amount = Filter("amount", min_value=1000, group="edges")
+        >>> opened = Filter("opened", min_value=date(2024, 1, 1))
+        """
+        bounds = (min_value, max_value)
+        if None not in bounds and type(min_value) is type(max_value):
+            if min_value > max_value:  # type: ignore[operator]
+                raise ValueError(
+                    f"min_value {min_value} is greater than max_value "
+                    f"{max_value}"
+                )
+        if group not in ("nodes", "edges"):
+            raise ValueError(f"Unknown group '{group}'")
+        self.attribute = attribute
+        self.min_value = min_value
+        self.max_value = max_value
+        self.group = group
+        if dtype is None:
+            is_date = any(isinstance(b, date) for b in bounds)
+            dtype = "date" if is_date else "number"
+        self.dtype = dtype
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "attribute": self.attribute,
+            "min": _bound(self.min_value),
+            "max": _bound(self.max_value),
+            "group": self.group,
+            "dtype": self.dtype,
+        }
+
+
+def _bound(value: Bound) -> Any:
+    return value.isoformat() if isinstance(value, date) else value
@@ -0,0 +1,208 @@
+"""
+Folding of leaf nodes. Graphs dominated by leaves (e.g. the emails,
+phones and cards of a person) are sent with their leaves folded into
+the node they hang off, which shows their count as a badge, so far
+fewer elements are sent, laid out and drawn. Folded nodes are
+neighbors of the node they are folded into, and are restored by the
+'expand' node action (e.g. with `GraphOverlay(base, fold="leaves")`
+or `unfold()`).
+
+    >>> elements = fold_leaves(index, chains=True)
+    >>> streamlit_cytoscape(elements, node_actions=["expand"], key="g")
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from streamlit_cytoscape.caching import LRUCache
+from streamlit_cytoscape.datasets import _fingerprint
+from streamlit_cytoscape.graph import GraphIndex, gather
+
+# node data attribute holding the number of folded nodes
+FOLDED_ATTR = "_folded"
+# computed foldings kept per process, by graph version and chains
+CACHE_SIZE = 16
+# node each node is folded into (-1 if kept), and the folded nodes of
+# each peeling round
+Folding = Tuple[np.ndarray, List[np.ndarray]]
+_cache: "LRUCache[Folding]" = LRUCache(CACHE_SIZE)
+
+
+def fold_tree(index: GraphIndex, chains: bool = False) -> Folding:
+    """
+    Folds the leaves (nodes with a single distinct neighbor) into
+    their neighbor. With `chains`, leaves are peeled repeatedly, so
+    chains and trees hanging off the graph fold into the node they
+    hang off. Of two nodes only linked to each other, the first is
+    kept. Returns the position of the node each node is folded into
+    (-1 for the nodes kept), and the positions folded in each round.
+    """
+    n = len(index)
+    rows = np.repeat(np.arange(n), index.degree)
+    loops = rows == index.indices
+    pairs = np.unique(rows[~loops] * n + index.indices[~loops])
+    count = np.bincount(pairs // n, minlength=n)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(count, out=indptr[1:])
+    indices = pairs % n
+
+    parent = np.full(n, -1, dtype=np.int64)
+    alive = np.ones(n, dtype=bool)
+    rounds: List[np.ndarray] = []
+    leaves = np.flatnonzero(count == 1)
+    while len(leaves):
+        neighbors, owners = gather(indptr, indices, leaves)
+        alive_neighbors = alive[neighbors]
+        parent[owners[alive_neighbors]] = neighbors[alive_neighbors]
+        into = parent[leaves]
+        # leaves only linked to each other: the first one is kept
+        kept = (count[into] == 1) & (into > leaves)
+        parent[leaves[kept]] = -1
+        folded, into = leaves[~kept], into[~kept]
+        alive[folded] = False
+        count -= np.bincount(into, minlength=n)
+        count[folded] = 0
+        rounds.append(folded)
+        if not chains:
+            break
+        leaves = np.flatnonzero(alive & (count == 1))
+    return parent, rounds
+
+
+def folded_counts(folding: Folding, displayed: np.ndarray) -> np.ndarray:
+    """
+    Number of hidden nodes folded into each displayed node, directly
+    or through other hidden nodes.
+    """
+    parent, rounds = folding
+    counts = np.zeros(len(parent), dtype=np.int64)
+    for folded in rounds:
+        hidden = folded[~displayed[folded]]
+        counts[hidden] += 1
+        counts += np.bincount(
+            parent[hidden], weights=counts[hidden], minlength=len(parent)
+        ).astype(np.int64)
+    counts[~displayed] = 0
+    return counts
+
+
+def fold_leaves(
+    graph: Union[GraphIndex, Dict[str, Any]],
+    chains: bool = False,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Returns the elements without their leaves, folded into the node
+    they hang off. The number of nodes folded into a node is set as
+    its '_folded' data, shown as a badge.
+
+    Parameters
+    ----------
+    graph : Union[GraphIndex, dict]
+        A `GraphIndex`, or graph elements in the same format accepted
+        by `streamlit_cytoscape()`.
+    chains : bool, default False
+        If True, leaves are folded repeatedly, so chains and trees
+        hanging off the graph are folded too.
+
+    Example
+    -------
+    >>> elements = fold_leaves(index, chains=True)
+    >>> len(elements["nodes"]) < len(index)
+    True
+    """
+    index, folding = _folding(graph, chains)
+    displayed = folding[0] < 0
+    positions = np.flatnonzero(displayed).tolist()
+    return _with_counts(
+        index, index.subgraph([index.ids[i] for i in positions]), folding
+    )
+
+
+def unfold(
+    graph: Union[GraphIndex, Dict[str, Any]],
+    node_ids: Iterable[Any],
+    chains: bool = False,
+    visible: Optional[Iterable[Any]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Returns the nodes folded into the given nodes by `fold_leaves()`,
+    with their own folded counts, and their edges to the given and
+    visible nodes. Meant to handle the 'expand' node action of folded
+    elements. The given nodes are included with their updated count.
+
+    Parameters
+    ----------
+    graph : Union[GraphIndex, dict]
+        The graph passed to `fold_leaves()`.
+    node_ids : Iterable
+        IDs of the nodes to unfold.
+    chains : bool, default False
+        As passed to `fold_leaves()`.
+    visible : Optional[Iterable], default None
+        IDs of the nodes already displayed.
+    """
+    index, folding = _folding(graph, chains)
+    parent = folding[0]
+    given = np.zeros(len(index), dtype=bool)
+    for _id in node_ids:
+        given[index.position(_id)] = True
+    children = np.flatnonzero((parent >= 0) & given[np.maximum(parent, 0)])
+    displayed = given.copy()
+    displayed[children] = True
+    for _id in visible or []:
+        if _id in index:
+            displayed[index.position(_id)] = True
+    elements = index._elements(children.tolist(), displayed, [])
+    elements["nodes"] += [index.nodes[i] for i in np.flatnonzero(given)]
+    return _with_counts(index, elements, folding, displayed)
+
+
+def _folding(
+    graph: Union[GraphIndex, Dict[str, Any]], chains: bool
+) -> Tuple[GraphIndex, Folding]:
+    """
+    The index of the graph and its folding, cached by graph version
+    and `chains`.
+    """
+    if isinstance(graph, GraphIndex):
+        index, key = graph, graph.fingerprint
+    else:
+        index, key = GraphIndex(graph), _fingerprint(graph)
+    cached = _cache.get((key, chains))
+    if cached is not None:
+        return index, cached
+    folding = fold_tree(index, chains)
+    # shared by the sessions
+    for array in (folding[0], *folding[1]):
+        array.setflags(write=False)
+    _cache.put((key, chains), folding)
+    return index, folding
+
+
+def _with_counts(
+    index: GraphIndex,
+    elements: Dict[str, List[Dict[str, Any]]],
+    folding: Folding,
+    displayed: Optional[np.ndarray] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Sets the folded counts of the nodes of the elements (shallow
+    copies), removing stale ones. Nodes are displayed if not folded,
+    unless `displayed` is given.
+    """
+    if displayed is None:
+        displayed = folding[0] < 0
+    counts = folded_counts(folding, displayed)
+    nodes = []
+    for node in elements["nodes"]:
+        count = int(counts[index.position(node["data"]["id"])])
+        if count or FOLDED_ATTR in node["data"]:
+            data = {
+                k: v for k, v in node["data"].items() if k != FOLDED_ATTR
+            }
+            if count:
+                data[FOLDED_ATTR] = count
+            node = {**node, "data": data}
+        nodes.append(node)
+    return {"nodes": nodes, "edges": elements["edges"]}
@@ -0,0 +1,78 @@
+"""
+Helpers to render the graph in a Streamlit fragment, so interactions
+with the component only rerun the graph region of the page.
+"""
+
+import functools
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Union
+
+import streamlit as st
+
+_IN_FRAGMENT: ContextVar[bool] = ContextVar("in_fragment", default=False)
+
+
+def cytoscape_fragment(
+    func: Optional[Callable[..., Any]] = None,
+    *,
+    run_every: Optional[Union[int, float, str]] = None,
+) -> Any:
+    """
+    Decorator running a function that renders the graph and handles
+    its events (`on_change`, node and edge actions, event listeners)
+    as a Streamlit fragment. Interactions with the component then
+    rerun the decorated function only, instead of the whole script.
+
+    Inside the fragment, elements passed as dict to a keyed
+    `streamlit_cytoscape()` are registered by content hash (see
+    `register_elements`), so unchanged elements are not sent to the
+    browser again on fragment reruns.
+
+    Requires a Streamlit version providing `st.fragment`. With older
+    versions the function runs as a regular part of the script.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to decorate.
+    run_every : Optional[Union[int, float, str]], default None
+        Rerun the fragment periodically (e.g. to poll for new
+        elements). Passed on to `st.fragment`.
+
+    Example
+    -------
+    >>> @cytoscape_fragment
+    ... def graph():
+    ...     streamlit_cytoscape(
+    ...         get_elements(),
+    ...         node_actions=["remove", "expand"],
+    ...         on_change=on_change,
+    ...         key="graph",
+    ...     )
+    >>> graph()
+    """
+
+    def decorator(f: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = _IN_FRAGMENT.set(True)
+            try:
+                return f(*args, **kwargs)
+            finally:
+                _IN_FRAGMENT.reset(token)
+
+        fragment = getattr(st, "fragment", None)
+        if fragment is None:
+            return wrapper
+        return fragment(wrapper, run_every=run_every)
+
+    if func is None:
+        return decorator
+    return decorator(func)
+
+
+def in_fragment() -> bool:
+    """
+    Returns True while a `cytoscape_fragment` function is running.
+    """
+    return _IN_FRAGMENT.get()
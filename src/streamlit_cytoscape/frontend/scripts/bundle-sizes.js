@@ -0,0 +1,79 @@
+// Startup and lazily loaded bundle sizes of a production build, from
+// the stats.json written by `npm run analyze`, compared with the stats
+// of another build when given:
+//
+//     node scripts/bundle-sizes.js build/stats.json [before/stats.json]
+//
+// Gzipped sizes are computed from the emitted files, found next to the
+// stats file.
+
+const fs = require("fs");
+const path = require("path");
+const zlib = require("zlib");
+
+function sizes(statsFile) {
+    const stats = JSON.parse(fs.readFileSync(statsFile, "utf8"));
+    const dir = path.dirname(statsFile);
+    const result = {
+        startup: { raw: 0, gzip: 0 },
+        lazy: { raw: 0, gzip: 0 },
+        chunks: [],
+    };
+    stats.chunks.forEach((chunk) => {
+        chunk.files
+            .filter((file) => file.endsWith(".js"))
+            .forEach((file) => {
+                const asset = stats.assets.find((a) => a.name === file);
+                const raw = asset ? asset.size : 0;
+                const emitted = path.join(dir, file);
+                const gzip = fs.existsSync(emitted)
+                    ? zlib.gzipSync(fs.readFileSync(emitted)).length
+                    : 0;
+                const group = chunk.initial ? "startup" : "lazy";
+                result[group].raw += raw;
+                result[group].gzip += gzip;
+                result.chunks.push({
+                    name: (chunk.names || []).join(",") || String(chunk.id),
+                    group,
+                    raw,
+                    gzip,
+                });
+            });
+    });
+    return result;
+}
+
+function kb(bytes) {
+    return `${(bytes / 1024).toFixed(1)} KiB`;
+}
+
+function print(label, result) {
+    console.log(`${label}:`);
+    result.chunks.forEach((c) => {
+        console.log(`  ${c.group}\t${c.name}\t${kb(c.raw)}\t${kb(c.gzip)} gz`);
+    });
+    ["startup", "lazy"].forEach((group) => {
+        const { raw, gzip } = result[group];
+        console.log(`  total ${group}\t${kb(raw)}\t${kb(gzip)} gz`);
+    });
+}
+
+const [after, before] = process.argv.slice(2);
+if (!after) {
+    console.error("usage: bundle-sizes.js <stats.json> [<before stats>]");
+    process.exit(1);
+}
+const current = sizes(after);
+print(after, current);
+if (before) {
+    const previous = sizes(before);
+    print(before, previous);
+    const { raw, gzip } = previous.startup;
+    const ratio = (a, b) => (b ? ((100 * (a - b)) / b).toFixed(1) : "n/a");
+    console.log(
+        `startup change: ${kb(current.startup.raw - raw)} ` +
+            `(${ratio(current.startup.raw, raw)}%), gzipped ` +
+            `${kb(current.startup.gzip - gzip)} ` +
+            `(${ratio(current.startup.gzip, gzip)}%)`
+    );
+}
@@ -0,0 +1,120 @@
+import { getCyInstance } from "../utils/helpers";
+import { setHidden } from "../utils/visibility";
+import { parseValue } from "../utils/values";
+
+// Range filters over numeric or date attributes. Each filtered
+// attribute gets an index of its elements sorted by value, built once
+// per elements version. A filter's visible elements are a contiguous
+// slice of that index, so a threshold change only updates the
+// elements between the previous and the new slice bounds.
+
+// Sorted indexes, by group / attribute / dtype
+let indexes = new Map();
+// Applied filters, by position: index signature and slice bounds
+let applied = [];
+
+function _signature(f) {
+    return `${f.group}:${f.attribute}:${f.dtype}`;
+}
+
+function _buildIndex(cy, f) {
+    const entries = [];
+    (f.group === "edges" ? cy.edges() : cy.nodes()).forEach((el) => {
+        const value = parseValue(el.data(f.attribute), f.dtype);
+        // elements without a value are not filtered
+        if (!Number.isNaN(value)) {
+            entries.push([value, el]);
+        }
+    });
+    entries.sort((a, b) => a[0] - b[0]);
+    return {
+        values: Float64Array.from(entries, (e) => e[0]),
+        eles: entries.map((e) => e[1]),
+    };
+}
+
+// First position whose value is >= (or > if `strict`) the bound
+function _bisect(values, bound, strict) {
+    let lo = 0;
+    let hi = values.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (values[mid] < bound || (strict && values[mid] === bound)) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    return lo;
+}
+
+function _bounds(index, f) {
+    const min = parseValue(f.min, f.dtype);
+    const max = parseValue(f.max, f.dtype);
+    return [
+        Number.isNaN(min) ? 0 : _bisect(index.values, min, false),
+        Number.isNaN(max)
+            ? index.values.length
+            : _bisect(index.values, max, true),
+    ];
+}
+
+function _setRange(cy, index, reason, start, end, hidden) {
+    if (start < end) {
+        setHidden(cy.collection(index.eles.slice(start, end)), reason, hidden);
+    }
+}
+
+// Moves the visible slice of filter `i` from [lo, hi) to [start, end),
+// only touching the elements in between.
+function _apply(cy, i, index, lo, hi, start, end) {
+    const reason = `filter:${i}`;
+    cy.batch(() => {
+        // hidden: left of the new start / right of the new end
+        _setRange(cy, index, reason, lo, Math.min(start, hi), true);
+        _setRange(cy, index, reason, Math.max(end, lo), hi, true);
+        // shown: left of the old start / right of the old end
+        _setRange(cy, index, reason, start, Math.min(lo, end), false);
+        _setRange(cy, index, reason, Math.max(hi, start), end, false);
+    });
+}
+
+function _clear(cy, i) {
+    const { signature, lo, hi } = applied[i];
+    const index = indexes.get(signature);
+    _apply(cy, i, index, lo, hi, 0, index.values.length);
+}
+
+// Filters update, on every render
+function updateFilters(filters, elementsChanged) {
+    const cy = getCyInstance();
+    filters = filters || [];
+    if (elementsChanged) {
+        // elements kept by the update keep their hidden reasons, so
+        // filters are cleared before reindexing
+        applied.forEach((_, i) => _clear(cy, i));
+        applied = [];
+        indexes = new Map();
+    }
+    // filters removed or moved to another attribute
+    applied.forEach((a, i) => {
+        if (i >= filters.length || _signature(filters[i]) !== a.signature) {
+            _clear(cy, i);
+            applied[i] = null;
+        }
+    });
+    applied = filters.map((f, i) => {
+        const signature = _signature(f);
+        if (!indexes.has(signature)) {
+            indexes.set(signature, _buildIndex(cy, f));
+        }
+        const index = indexes.get(signature);
+        // nothing filtered yet: the whole index is visible
+        const { lo, hi } = applied[i] || { lo: 0, hi: index.values.length };
+        const [start, end] = _bounds(index, f);
+        _apply(cy, i, index, lo, hi, start, end);
+        return { signature, lo: start, hi: end };
+    });
+}
+
+export default updateFilters;
@@ -1,19 +1,17 @@
 import cytoscape from "cytoscape";
-import fcose from "cytoscape-fcose";
-import cola from "cytoscape-cola";
-import dagre from "cytoscape-dagre";
 import State from "../utils/state";
 import { debounce, getCyInstance, debouncedSetValue } from "../utils/helpers";
-import STYLES from "../utils/styles";
-
-// Register cytoscape extensions
-cytoscape.use(fcose);
-cytoscape.use(cola);
-cytoscape.use(dagre);
+import { runLayout } from "../utils/layouts";
+import { time } from "../utils/telemetry";
+import STYLES, { getFolded } from "../utils/styles";
 
 // Constants & configurations
 const CY_ID = "cy";
 const SELECT_DEBOUNCE = 100;
+const FOCUS = {
+    padding: 50,
+    duration: 400,
+};
 
 // Event hanlders
 function _handleSelection(e) {
@@ -27,9 +25,46 @@ function _handleSelection(e) {
     document.body.focus();
 }
 
-// Initailize cytoscape (only runs once)
-function initCyto(listeners) {
-    const cy = cytoscape({ container: document.getElementById(CY_ID) });
+// Cytoscape's WebGL renderer requires WebGL2, software rendering
+// included
+function _webglSupported() {
+    try {
+        return !!document.createElement("canvas").getContext("webgl2");
+    } catch {
+        return false;
+    }
+}
+
+// Renderer options, canvas unless WebGL was requested and is available
+function _rendererOptions(container, renderer, theme) {
+    const webgl = renderer === "webgl" && _webglSupported();
+    if (renderer === "webgl" && !webgl) {
+        console.warn("WebGL2 is unavailable, using the canvas renderer.");
+    }
+    container.setAttribute("data-renderer", webgl ? "webgl" : "canvas");
+    if (!webgl) {
+        return { name: "canvas" };
+    }
+    // the WebGL layer blends with the container background color
+    document.body.setAttribute("data-theme", theme);
+    container.style.backgroundColor = getComputedStyle(document.body)
+        .getPropertyValue("--neutral-1")
+        .trim();
+    return { name: "canvas", webgl: true };
+}
+
+// Initailize cytoscape (only runs once). The matrix view draws the
+// elements itself, from a headless instance.
+function initCyto(listeners, renderer, theme, view) {
+    const container = document.getElementById(CY_ID);
+    const options =
+        view === "matrix"
+            ? { headless: true, styleEnabled: true }
+            : { renderer: _rendererOptions(container, renderer, theme) };
+    const cy = cytoscape({
+        container: container,
+        ...options,
+    });
     cy.on("select unselect", debounce(_handleSelection, SELECT_DEBOUNCE));
     listeners.forEach((L) => {
         cy.on(
@@ -65,9 +100,37 @@ const graph = {
             el.connectedNodes().addClass("highlight");
         }
     },
+    updateQuery: function () {
+        const cy = getCyInstance();
+        const query = State.getState("query");
+        let eles = cy.collection();
+        cy.batch(() => {
+            cy.elements(".queried, .faded").removeClass("queried faded");
+            if (!query) {
+                return;
+            }
+            [...query.nodes, ...query.edges].forEach((id) => {
+                eles.merge(cy.getElementById(id));
+            });
+            eles.addClass("queried");
+            if (query.fade) {
+                cy.elements().difference(eles).addClass("faded");
+            }
+        });
+        if (query?.focus && eles.nonempty()) {
+            cy.animate({
+                fit: { eles: eles, padding: FOCUS.padding },
+                duration: FOCUS.duration,
+            });
+        }
+    },
     updateLayout: function () {
         const cy = getCyInstance();
-        cy.layout(State.getState("layout")).run();
+        if (cy.headless()) {
+            // matrix view: nodes have no position
+            return;
+        }
+        runLayout(cy, State.getState("layout"));
     },
     updateStyle: function () {
         const cy = getCyInstance();
@@ -81,10 +144,11 @@ const graph = {
             ...STYLES[theme]["default"],
             ...custom_style,
             ...metaEdgeStyles,
+            ...getFolded(theme, custom_style),
             ...STYLES[theme]["highlight"],
         ];
         document.body.setAttribute("data-theme", theme);
-        cy.style(style);
+        time("style", () => cy.style(style));
     },
 };
 
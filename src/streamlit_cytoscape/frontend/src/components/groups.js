@@ -0,0 +1,340 @@
+// Compound node groups. Nodes are placed under a compound parent per
+// value of the group attribute. Double-clicking a group collapses it
+// into a single node: its members and their edges are removed from the
+// graph and cached here, and the edges leaving the group are rerouted
+// to it, aggregated per other end with their count. Double-clicking it
+// again restores the cached elements, without a round trip to Python.
+// Groups starting collapsed have their members cached before being
+// added, so cytoscape only holds (and lays out) the groups.
+
+import State from "../utils/state";
+import { getCyInstance, debounce } from "../utils/helpers";
+
+// Constants / Configurations
+const GROUP_LABEL = "_GROUP";
+const GROUP_PREFIX = "_group:";
+const EDGE_PREFIX = "_group_edge:";
+const DELAYS = {
+    default: 150,
+};
+// grid spacing of the members expanded without a position
+const SPACING = 40;
+
+const options = {
+    attribute: null,
+    collapsed: false,
+};
+// Cached member nodes of the collapsed groups, by group ID
+const members = new Map();
+// Collapsed group of each cached node, by node ID
+const owner = new Map();
+// Cached edges (with a cached end) by ID, and their IDs by node ID
+const hiddenEdges = new Map();
+const incident = new Map();
+// Collapsed state of the groups toggled by the user, by group ID, kept
+// when the elements are replaced
+const toggled = new Map();
+
+function isGroup(node) {
+    return node.data("label") === GROUP_LABEL;
+}
+
+// Displayed end of a node: itself, or its collapsed group
+function _end(id) {
+    return owner.get(id) ?? id;
+}
+
+function _hideEdge(edge) {
+    const id = String(edge.data.id);
+    hiddenEdges.set(id, edge);
+    [edge.data.source, edge.data.target].forEach((end) => {
+        const key = String(end);
+        if (!incident.has(key)) {
+            incident.set(key, new Set());
+        }
+        incident.get(key).add(id);
+    });
+}
+
+function _showEdge(id) {
+    const edge = hiddenEdges.get(id);
+    hiddenEdges.delete(id);
+    [edge.data.source, edge.data.target].forEach((end) => {
+        const ids = incident.get(String(end));
+        ids?.delete(id);
+        if (ids?.size === 0) {
+            incident.delete(String(end));
+        }
+    });
+    return edge;
+}
+
+// Counts a cached edge in the aggregate edge between its displayed ends
+function _aggregate(counts, edge) {
+    const a = _end(String(edge.data.source));
+    const b = _end(String(edge.data.target));
+    if (a === b) {
+        return;
+    }
+    const [source, target] = a < b ? [a, b] : [b, a];
+    const id = `${EDGE_PREFIX}${source}|${target}`;
+    const aggregate = counts.get(id);
+    if (aggregate) {
+        aggregate.data._edgeCount += 1;
+    } else {
+        counts.set(id, {
+            group: "edges",
+            data: {
+                id,
+                source,
+                target,
+                label: GROUP_LABEL,
+                _isGroupEdge: true,
+                _edgeCount: 1,
+            },
+        });
+    }
+}
+
+// Aggregate edges not displayed yet, the counts of the others being
+// added to the displayed ones
+function _newAggregates(cy, counts) {
+    const added = [];
+    counts.forEach((edge, id) => {
+        const existing = cy?.getElementById(id);
+        if (existing?.nonempty()) {
+            existing.data(
+                "_edgeCount",
+                existing.data("_edgeCount") + edge.data._edgeCount
+            );
+        } else {
+            added.push(edge);
+        }
+    });
+    return added;
+}
+
+function _cacheMember(id, node) {
+    if (!members.has(id)) {
+        members.set(id, []);
+    }
+    members.get(id).push(node);
+    owner.set(String(node.data.id), id);
+}
+
+function _report() {
+    if (options.attribute) {
+        State.updateState("groups", [...members.keys()]);
+    }
+}
+
+/**
+ * Groups elements ({nodes, edges}) before they are added: parents are
+ * created for the group values, nodes of collapsed groups are cached
+ * and their edges rerouted. Unless `reset`, the elements are added to
+ * the displayed ones, skipping those displayed or cached already.
+ */
+function groupElements(elements, reset = true) {
+    if (reset) {
+        members.clear();
+        owner.clear();
+        hiddenEdges.clear();
+        incident.clear();
+    }
+    const { attribute, collapsed } = options;
+    if (!attribute) {
+        return elements;
+    }
+    const cy = reset ? null : getCyInstance();
+    const known = (id) => cy?.getElementById(id).nonempty();
+    const groups = new Map();
+    const nodes = [];
+    elements.nodes.forEach((node) => {
+        const nodeId = String(node.data.id);
+        if (!reset && (owner.has(nodeId) || known(nodeId))) {
+            return;
+        }
+        const value = node.data[attribute];
+        if (value === undefined || value === null || value === "") {
+            nodes.push(node);
+            return;
+        }
+        const id = GROUP_PREFIX + value;
+        if (!groups.has(id) && !known(id)) {
+            groups.set(id, {
+                group: "nodes",
+                data: { id, label: GROUP_LABEL, name: String(value) },
+            });
+        }
+        if (reset ? toggled.get(id) ?? collapsed : members.has(id)) {
+            _cacheMember(id, node);
+        } else {
+            nodes.push({ ...node, data: { ...node.data, parent: id } });
+        }
+    });
+    members.forEach((cached, id) => {
+        if (groups.has(id)) {
+            Object.assign(groups.get(id).data, {
+                _collapsed: true,
+                _groupSize: cached.length,
+            });
+        } else {
+            cy.getElementById(id).data("_groupSize", cached.length);
+        }
+    });
+
+    const counts = new Map();
+    const edges = [];
+    elements.edges.forEach((edge) => {
+        const id = String(edge.data.id);
+        if (!reset && (hiddenEdges.has(id) || known(id))) {
+            return;
+        }
+        const source = String(edge.data.source);
+        const target = String(edge.data.target);
+        if (owner.has(source) || owner.has(target)) {
+            _hideEdge(edge);
+            _aggregate(counts, edge);
+        } else {
+            edges.push(edge);
+        }
+    });
+    _report();
+    return {
+        nodes: [...groups.values(), ...nodes],
+        edges: [...edges, ..._newAggregates(cy, counts)],
+    };
+}
+
+/**
+ * Collapses a group into a single node, caching its members
+ */
+function collapseGroup(id) {
+    const cy = getCyInstance();
+    const group = cy.getElementById(id);
+    if (group.empty() || !group.isParent()) {
+        return;
+    }
+    const children = group.children();
+    const center = { ...group.position() };
+    const nodes = children.jsons();
+    children
+        .connectedEdges()
+        .filter((e) => !e.data("_isGroupEdge"))
+        .jsons()
+        .forEach(_hideEdge);
+    cy.batch(() => {
+        // aggregate edges to the members are removed with them, and
+        // counted again from the cached edges
+        children.remove();
+        nodes.forEach((node) => _cacheMember(id, node));
+        group.data({ _collapsed: true, _groupSize: nodes.length });
+        group.position(center);
+        const counts = new Map();
+        nodes.forEach((node) => {
+            incident.get(String(node.data.id))?.forEach((e) => {
+                _aggregate(counts, hiddenEdges.get(e));
+            });
+        });
+        cy.add(_newAggregates(cy, counts));
+    });
+    toggled.set(id, true);
+    _report();
+}
+
+// Grid positions around the group for members never displayed, set on
+// copies as cached nodes may be the shared elements
+function _place(nodes, center) {
+    const missing = nodes.filter((node) => !node.position).length;
+    const columns = Math.ceil(Math.sqrt(missing));
+    const offset = ((columns - 1) * SPACING) / 2;
+    let i = 0;
+    return nodes.map((node) => {
+        if (node.position) {
+            return node;
+        }
+        const position = {
+            x: center.x - offset + (i % columns) * SPACING,
+            y: center.y - offset + Math.floor(i / columns) * SPACING,
+        };
+        i++;
+        return { ...node, position };
+    });
+}
+
+/**
+ * Expands a collapsed group, restoring its cached members and edges
+ */
+function expandGroup(id) {
+    const cy = getCyInstance();
+    const nodes = members.get(id);
+    const group = cy.getElementById(id);
+    if (!nodes || group.empty()) {
+        return;
+    }
+    members.delete(id);
+    nodes.forEach((node) => owner.delete(String(node.data.id)));
+    const placed = _place(nodes, group.position());
+    const ids = new Set();
+    nodes.forEach((node) => {
+        incident.get(String(node.data.id))?.forEach((e) => ids.add(e));
+    });
+    cy.batch(() => {
+        // only aggregate edges are connected to a collapsed group
+        group.connectedEdges().remove();
+        group.removeData("_collapsed _groupSize");
+        cy.add(
+            placed.map((node) => ({
+                ...node,
+                data: { ...node.data, parent: id },
+            }))
+        );
+        const counts = new Map();
+        const restored = [];
+        ids.forEach((e) => {
+            const edge = hiddenEdges.get(e);
+            if (
+                owner.has(String(edge.data.source)) ||
+                owner.has(String(edge.data.target))
+            ) {
+                _aggregate(counts, edge);
+            } else {
+                restored.push(_showEdge(e));
+            }
+        });
+        cy.add([...restored, ..._newAggregates(cy, counts)]);
+    });
+    toggled.set(id, false);
+    _report();
+}
+
+function _handleToggle(e) {
+    const node = e.target;
+    if (!isGroup(node)) {
+        return;
+    }
+    if (node.data("_collapsed")) {
+        expandGroup(node.id());
+    } else {
+        collapseGroup(node.id());
+    }
+}
+
+const groupsHandlers = {
+    toggle: debounce(_handleToggle, DELAYS.default),
+};
+
+/**
+ * Initialize the groups, before the first elements are added
+ */
+function initGroups(groups) {
+    if (!groups) {
+        return;
+    }
+    options.attribute = groups.attribute;
+    options.collapsed = groups.collapsed;
+    getCyInstance().on("dblclick dbltap", "node", groupsHandlers.toggle);
+}
+
+export { groupElements, collapseGroup, expandGroup, isGroup };
+export default initGroups;
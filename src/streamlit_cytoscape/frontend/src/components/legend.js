@@ -0,0 +1,111 @@
+import State from "../utils/state";
+import { getCyInstance } from "../utils/helpers";
+import { setHidden } from "../utils/visibility";
+
+// Constants / Configurations
+const LEGEND_ID = "legend";
+const REASON = "legend";
+const COLOR_PROPERTY = {
+    nodes: "background-color",
+    edges: "line-color",
+};
+
+// Legend entries and their element collections, keyed by group and
+// label. The index is rebuilt when the elements change, so toggling a
+// label is a single batched display update without any rerun.
+let entries = [];
+let entriesKey = null;
+let index = new Map();
+
+function _key(group, label) {
+    return `${group}:${label}`;
+}
+
+function _buildIndex(cy) {
+    const groups = new Map(entries.map((e) => [_key(e.group, e.label), []]));
+    cy.elements().forEach((el) => {
+        groups.get(_key(el.group(), el.data("label")))?.push(el);
+    });
+    index = new Map();
+    groups.forEach((eles, key) => index.set(key, cy.collection(eles)));
+}
+
+function _applyVisibility(cy) {
+    const hidden = State.getState("legend");
+    cy.batch(() => {
+        index.forEach((eles, key) => setHidden(eles, REASON, hidden.has(key)));
+    });
+}
+
+function _toggle(key) {
+    const hidden = new Set(State.getState("legend"));
+    const hide = !hidden.has(key);
+    hide ? hidden.add(key) : hidden.delete(key);
+    setHidden(index.get(key), REASON, hide);
+    document
+        .querySelector(`#${LEGEND_ID} [data-key="${CSS.escape(key)}"]`)
+        .setAttribute("data-hidden", hide);
+    // only kept in state, reported with the next returned value
+    State.updateState("legend", hidden);
+}
+
+function _render(cy) {
+    const legend = document.getElementById(LEGEND_ID);
+    const hidden = State.getState("legend");
+    legend.replaceChildren(
+        ...entries.map((e) => {
+            const key = _key(e.group, e.label);
+            const eles = index.get(key);
+            const color = eles.nonempty()
+                ? eles.first().style(COLOR_PROPERTY[e.group])
+                : e.color;
+            const item = document.createElement("div");
+            item.className = "legend__item";
+            item.title = `Show / Hide ${e.label}`;
+            item.setAttribute("data-key", key);
+            item.setAttribute("data-group", e.group);
+            item.setAttribute("data-hidden", hidden.has(key));
+            item.innerHTML = `
+                <span class="legend__swatch"></span>
+                <span class="legend__label"></span>
+                <span class="legend__count">${eles.length}</span>`;
+            item.firstElementChild.style.backgroundColor = color || "";
+            item.children[1].innerText = e.label;
+            item.addEventListener("click", () => _toggle(key));
+            return item;
+        })
+    );
+    legend.setAttribute("data-visible", entries.length > 0);
+}
+
+// Legend update, on every render. The index is only rebuilt when the
+// entries, the elements or their style changed.
+function updateLegend(newEntries, changed) {
+    const cy = getCyInstance();
+    const key = JSON.stringify(newEntries || []);
+    const entriesChanged = key !== entriesKey;
+    if (!entriesChanged && !changed) {
+        return;
+    }
+    entries = newEntries || [];
+    entriesKey = key;
+    if (entriesChanged) {
+        // forget hidden labels that are not in the legend anymore
+        const keys = new Set(entries.map((e) => _key(e.group, e.label)));
+        const hidden = [...(State.getState("legend") || [])].filter((k) =>
+            keys.has(k)
+        );
+        State.updateState("legend", entries.length ? new Set(hidden) : null);
+        setHidden(cy.elements(), REASON, false);
+    }
+    if (!entries.length) {
+        index = new Map();
+        _render(cy);
+        return;
+    }
+    _buildIndex(cy);
+    _applyVisibility(cy);
+    _render(cy);
+}
+
+export default updateLegend;
@@ -0,0 +1,153 @@
+// Progressive elements loading. Nodes, then edges, are added in time
+// slices, each in a cy.batch(), yielding to the browser between
+// slices so the partial graph and a progress bar are painted while
+// loading. Slice sizes adapt to the measured insertion rate.
+// Nodes are placed at their given position or at their position
+// cached by a previous load of the same elements, so the layout only
+// needs to run when some are missing.
+
+// Constants / Configurations
+const PROGRESS_ID = "progress";
+const SLICE_BUDGET = 12; // milliseconds of insertion per frame
+const FIRST_SLICE = 500;
+const MIN_SLICE = 50;
+const GRID_SPACING = 60;
+const CACHE_PREFIX = "streamlit-cytoscape:positions:";
+const MAX_KEY_LENGTH = 64;
+
+function _nextFrame() {
+    return new Promise((resolve) => requestAnimationFrame(() => resolve()));
+}
+
+function _showProgress(done, total) {
+    const progress = document.getElementById(PROGRESS_ID);
+    const visible = done < total;
+    progress.setAttribute("data-visible", visible);
+    if (visible) {
+        const ratio = total ? done / total : 1;
+        progress.firstElementChild.style.width = `${ratio * 100}%`;
+        progress.lastElementChild.innerText =
+            `Loading ${done.toLocaleString()} / ${total.toLocaleString()}`;
+    }
+}
+
+// FNV-1a hash of long versions (plain elements are versioned by
+// content)
+function _cacheKey(version) {
+    if (version.length <= MAX_KEY_LENGTH) {
+        return CACHE_PREFIX + version;
+    }
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < version.length; i++) {
+        hash ^= version.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    return CACHE_PREFIX + (hash >>> 0).toString(16) + ":" + version.length;
+}
+
+function _cachedPositions(version) {
+    try {
+        const cached = sessionStorage.getItem(_cacheKey(version));
+        return cached ? JSON.parse(cached) : {};
+    } catch {
+        return {};
+    }
+}
+
+// Caches the node positions of the elements version, for the next
+// load of the same elements (e.g. when the component is remounted)
+function cachePositions(cy, version) {
+    const positions = {};
+    cy.nodes().forEach((node) => {
+        const { x, y } = node.position();
+        positions[node.id()] = [Math.round(x), Math.round(y)];
+    });
+    const key = _cacheKey(version);
+    const value = JSON.stringify(positions);
+    try {
+        sessionStorage.setItem(key, value);
+    } catch {
+        // over quota: only keep the latest elements
+        try {
+            Object.keys(sessionStorage)
+                .filter((k) => k.startsWith(CACHE_PREFIX))
+                .forEach((k) => sessionStorage.removeItem(k));
+            sessionStorage.setItem(key, value);
+        } catch {
+            console.warn("Node positions too large to be cached.");
+        }
+    }
+}
+
+// Returns the nodes with a position (copies of those without one, as
+// the elements may be shared), and whether all of them got one without
+// the grid
+function _place(nodes, version) {
+    const cached = _cachedPositions(version);
+    const placed = nodes.map((node) => {
+        const xy = !node.position && cached[String(node.data.id)];
+        return xy ? { ...node, position: { x: xy[0], y: xy[1] } } : node;
+    });
+    // spread on a grid until the layout runs
+    const missing = placed.filter((node) => !node.position).length;
+    const columns = Math.ceil(Math.sqrt(missing));
+    let i = 0;
+    const gridded = placed.map((node) => {
+        if (node.position) {
+            return node;
+        }
+        const position = {
+            x: (i % columns) * GRID_SPACING,
+            y: Math.floor(i / columns) * GRID_SPACING,
+        };
+        i++;
+        return { ...node, position };
+    });
+    return [gridded, missing === 0];
+}
+
+/**
+ * Adds the elements to an empty graph progressively. Resolves once
+ * every element is added, to whether all the nodes were positioned
+ * without running a layout. Rejects if elements can't be added, the
+ * progress bar being hidden either way.
+ */
+async function loadElements(cy, elements, version) {
+    const [nodes, positioned] = _place(elements.nodes, version);
+    const { edges } = elements;
+    const total = nodes.length + edges.length;
+    try {
+        await _addSlices(cy, [nodes, edges], total);
+    } finally {
+        _showProgress(total, total);
+    }
+    cy.fit();
+    return positioned;
+}
+
+// Adds the groups of elements in time slices
+async function _addSlices(cy, groups, total) {
+    let done = 0;
+    let size = FIRST_SLICE;
+    _showProgress(done, total);
+    for (const group of groups) {
+        for (let i = 0; i < group.length; ) {
+            const slice = group.slice(i, i + size);
+            const start = performance.now();
+            cy.batch(() => cy.add(slice));
+            const elapsed = performance.now() - start;
+            i += slice.length;
+            done += slice.length;
+            const rate = slice.length / Math.max(elapsed, 1);
+            size = Math.max(MIN_SLICE, Math.round(rate * SLICE_BUDGET));
+            if (done === slice.length) {
+                // first slice: bring the graph into view
+                cy.fit();
+            }
+            _showProgress(done, total);
+            await _nextFrame();
+        }
+    }
+}
+
+export { loadElements, cachePositions };
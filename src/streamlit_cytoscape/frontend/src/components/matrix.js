@@ -0,0 +1,374 @@
+import { getCyInstance } from "../utils/helpers";
+
+// Adjacency matrix view (view="matrix"). The elements are kept in a
+// headless Cytoscape instance, so selection, filters, legend, search and
+// events work as in the graph view, and drawn on a canvas: rows and
+// columns are the visible nodes, in the order computed on the server
+// (see streamlit_cytoscape/matrix.py). With more nodes than pixels,
+// consecutive nodes share a row and cells show the density of edges of
+// their block. A drawing counts each edge once into its cell and paints
+// each cell once, without any edge geometry.
+
+// Constants / Configurations
+const MATRIX_ID = "matrix";
+const CONTAINER_ID = "container";
+const LABEL_SIZE = 110; // pixels reserved for the node labels
+const MIN_LABEL_CELL = 10; // cell size (px) from which labels are drawn
+const FONT = "10px Cairo, sans-serif";
+const MIN_ALPHA = 0.35; // opacity of the sparsest non-empty cells
+const DEFAULT_COLOR = [128, 128, 128];
+const REDRAW_EVENTS = "add remove data style select unselect";
+
+let canvas = null;
+let offscreen = null;
+// Node IDs in the server order, and their cluster if ordered by cluster
+let order = { ids: [], groups: null };
+let orderKey = null;
+// Visible nodes in the order of the rows, and the geometry of the last
+// drawing
+let rows = [];
+let grid = null;
+let frame = null;
+let hovered = { key: null, target: null };
+
+function _rgb(color) {
+    const values = color?.match(/\d+(\.\d+)?/g);
+    return values?.length >= 3 ? values.slice(0, 3).map(Number) : null;
+}
+
+// Visible nodes in the server order, then those unknown to it (e.g.
+// added by an expansion), with their cluster
+function _rows(cy) {
+    const seen = new Set();
+    const nodes = [];
+    const clusters = [];
+    order.ids.forEach((id, i) => {
+        const node = cy.getElementById(id);
+        if (node.empty() || !node.isNode()) {
+            return;
+        }
+        seen.add(id);
+        if (node.visible()) {
+            nodes.push(node);
+            clusters.push(order.groups?.[i] ?? null);
+        }
+    });
+    cy.nodes().forEach((node) => {
+        if (!seen.has(node.id()) && node.visible()) {
+            nodes.push(node);
+            clusters.push(null);
+        }
+    });
+    return [nodes, clusters];
+}
+
+// First and last (excluded) rows of a bin
+function _range(bin) {
+    const { n, bins } = grid;
+    return [Math.ceil((bin * n) / bins), Math.ceil(((bin + 1) * n) / bins)];
+}
+
+function _label(node) {
+    return node.style("label") || node.id();
+}
+
+// Edge counts and colors of the cells
+function _cells(cy) {
+    const { bins, bin } = grid;
+    const counts = new Uint32Array(bins * bins);
+    const colors = new Uint16Array(bins * bins);
+    const palette = [DEFAULT_COLOR];
+    const paletteIndex = new Map();
+    cy.edges().forEach((edge) => {
+        const s = bin.get(edge.data("source"));
+        const t = bin.get(edge.data("target"));
+        if (s === undefined || t === undefined || !edge.visible()) {
+            return;
+        }
+        const label = edge.data("label");
+        let color = paletteIndex.get(label);
+        if (color === undefined) {
+            const rgb = _rgb(edge.style("line-color"));
+            color = rgb ? palette.push(rgb) - 1 : 0;
+            paletteIndex.set(label, color);
+        }
+        // undirected: both cells of the pair
+        counts[s * bins + t] += 1;
+        colors[s * bins + t] = color;
+        if (s !== t) {
+            counts[t * bins + s] += 1;
+            colors[t * bins + s] = color;
+        }
+    });
+    return { counts, colors, palette };
+}
+
+function _paintCells(ctx, cells) {
+    const { margin, size, bins, n } = grid;
+    const { counts, colors, palette } = cells;
+    // node pairs per cell
+    const pairs = (n / bins) ** 2;
+    const image = new ImageData(bins, bins);
+    for (let k = 0; k < counts.length; k++) {
+        if (!counts[k]) {
+            continue;
+        }
+        const [r, g, b] = palette[colors[k]];
+        const density = Math.min(1, counts[k] / pairs);
+        image.data[4 * k] = r;
+        image.data[4 * k + 1] = g;
+        image.data[4 * k + 2] = b;
+        image.data[4 * k + 3] =
+            255 * (MIN_ALPHA + (1 - MIN_ALPHA) * Math.sqrt(density));
+    }
+    offscreen = offscreen || document.createElement("canvas");
+    offscreen.width = bins;
+    offscreen.height = bins;
+    offscreen.getContext("2d").putImageData(image, 0, 0);
+    ctx.imageSmoothingEnabled = false;
+    ctx.drawImage(offscreen, margin, margin, size, size);
+}
+
+// Blocks of the clusters along the diagonal
+function _paintClusters(ctx, clusters, color) {
+    const { margin, size, n } = grid;
+    const step = size / n;
+    ctx.strokeStyle = color;
+    ctx.lineWidth = 1;
+    let start = 0;
+    for (let i = 1; i <= n; i++) {
+        if (i < n && clusters[i] === clusters[start]) {
+            continue;
+        }
+        if (clusters[start] !== null && (i - start) * step >= 2) {
+            const x = margin + start * step;
+            ctx.strokeRect(x, x, (i - start) * step, (i - start) * step);
+        }
+        start = i;
+    }
+}
+
+// Rows and columns of the selected nodes, cells of the selected edges
+function _paintSelection(ctx, cy, color) {
+    const { margin, size, bins, bin } = grid;
+    const step = size / bins;
+    ctx.fillStyle = color;
+    ctx.strokeStyle = color;
+    ctx.globalAlpha = 0.15;
+    cy.nodes(":selected").forEach((node) => {
+        const b = bin.get(node.id());
+        if (b !== undefined) {
+            ctx.fillRect(margin, margin + b * step, size, step);
+            ctx.fillRect(margin + b * step, margin, step, size);
+        }
+    });
+    ctx.globalAlpha = 1;
+    ctx.lineWidth = 2;
+    cy.edges(":selected").forEach((edge) => {
+        const s = bin.get(edge.data("source"));
+        const t = bin.get(edge.data("target"));
+        if (s !== undefined && t !== undefined) {
+            ctx.strokeRect(margin + t * step, margin + s * step, step, step);
+            ctx.strokeRect(margin + s * step, margin + t * step, step, step);
+        }
+    });
+}
+
+function _paintLabels(ctx, color) {
+    const { margin, size, n } = grid;
+    const step = size / n;
+    ctx.font = FONT;
+    ctx.fillStyle = color;
+    ctx.textAlign = "right";
+    ctx.textBaseline = "middle";
+    rows.forEach((node, i) => {
+        const label = _label(node);
+        const center = margin + (i + 0.5) * step;
+        ctx.fillText(label, margin - 4, center, margin - 8);
+        ctx.save();
+        ctx.translate(center, margin - 4);
+        ctx.rotate(-Math.PI / 2);
+        ctx.textAlign = "left";
+        ctx.fillText(label, 0, 0, margin - 8);
+        ctx.restore();
+    });
+}
+
+function _draw() {
+    frame = null;
+    const cy = getCyInstance();
+    const ratio = window.devicePixelRatio || 1;
+    const { clientWidth: width, clientHeight: height } = canvas;
+    canvas.width = width * ratio;
+    canvas.height = height * ratio;
+    const ctx = canvas.getContext("2d");
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    let clusters;
+    [rows, clusters] = _rows(cy);
+    const n = rows.length;
+    const side = Math.min(width, height);
+    if (n === 0 || side <= 0) {
+        grid = null;
+        return;
+    }
+    const labels = (side - LABEL_SIZE) / n >= MIN_LABEL_CELL;
+    const margin = labels ? LABEL_SIZE : 0;
+    const size = side - margin;
+    const bins = Math.max(1, Math.min(n, Math.floor(size * ratio)));
+    // bin of each node ID
+    const bin = new Map(
+        rows.map((node, i) => [node.id(), Math.floor((i * bins) / n)])
+    );
+    grid = { margin, size, bins, n, labels, bin };
+
+    const css = getComputedStyle(document.body);
+    const border = css.getPropertyValue("--neutral-3").trim();
+    const muted = css.getPropertyValue("--neutral-8").trim();
+    const text = css.getPropertyValue("--neutral-9").trim();
+    _paintCells(ctx, _cells(cy));
+    if (clusters.some((c) => c !== null)) {
+        _paintClusters(ctx, clusters, muted);
+    }
+    _paintSelection(ctx, cy, text);
+    if (labels) {
+        _paintLabels(ctx, text);
+    }
+    ctx.strokeStyle = border;
+    ctx.lineWidth = 1;
+    ctx.strokeRect(margin, margin, size, size);
+    // the headless instance doesn't render (e.g. for the first paint
+    // telemetry)
+    cy.emit("render");
+}
+
+function _schedule() {
+    if (canvas && frame === null) {
+        frame = requestAnimationFrame(_draw);
+    }
+}
+
+// Row and column bins under the pointer, a null bin for a label
+function _hit(e) {
+    if (!grid) {
+        return null;
+    }
+    const { margin, size, bins, labels } = grid;
+    const rect = canvas.getBoundingClientRect();
+    const x = e.clientX - rect.left - margin;
+    const y = e.clientY - rect.top - margin;
+    const step = size / bins;
+    const col = Math.floor(x / step);
+    const row = Math.floor(y / step);
+    if (x >= 0 && y >= 0 && row < bins && col < bins) {
+        return { row, col };
+    }
+    if (labels && x < 0 && x >= -margin && y >= 0 && row < bins) {
+        return { row, col: null };
+    }
+    if (labels && y < 0 && y >= -margin && x >= 0 && col < bins) {
+        return { row: null, col };
+    }
+    return null;
+}
+
+function _binNodes(cy, bin) {
+    const [start, end] = _range(bin);
+    return cy.collection(rows.slice(start, end));
+}
+
+// Elements of a hit: the node of a label, the edges of a cell
+function _targets(cy, hit) {
+    if (!hit) {
+        return cy.collection();
+    }
+    if (hit.row === null || hit.col === null) {
+        return _binNodes(cy, hit.row ?? hit.col);
+    }
+    return _binNodes(cy, hit.row)
+        .edgesWith(_binNodes(cy, hit.col))
+        .filter((edge) => edge.visible());
+}
+
+function _describe(cy, hit, targets) {
+    if (!hit) {
+        return "";
+    }
+    if (hit.row === null || hit.col === null) {
+        return targets.map(_label).join(", ");
+    }
+    const source = _binNodes(cy, hit.row);
+    const target = _binNodes(cy, hit.col);
+    const names = (nodes) =>
+        nodes.length === 1 ? _label(nodes[0]) : `${nodes.length} nodes`;
+    const count = targets.length;
+    return `${names(source)} – ${names(target)}: ${count} edge${
+        count === 1 ? "" : "s"
+    }`;
+}
+
+// Pointer events are mapped to the elements of the hit: selection and
+// the Cytoscape events the listeners of the component wait for
+function _onClick(e) {
+    const cy = getCyInstance();
+    const targets = _targets(cy, _hit(e));
+    if (!e.shiftKey) {
+        cy.$(":selected").difference(targets).unselect();
+    }
+    targets.select();
+    (targets.nonempty() ? targets.first() : cy).emit("tap click");
+}
+
+function _onDoubleClick(e) {
+    const cy = getCyInstance();
+    const targets = _targets(cy, _hit(e));
+    (targets.nonempty() ? targets.first() : cy).emit("dbltap dblclick");
+}
+
+function _onMove(e) {
+    const cy = getCyInstance();
+    const hit = e.type === "mouseleave" ? null : _hit(e);
+    const key = hit ? `${hit.row}:${hit.col}` : null;
+    if (key === hovered.key) {
+        return;
+    }
+    const targets = _targets(cy, hit);
+    hovered.target?.emit("mouseout");
+    hovered = { key, target: targets.nonempty() ? targets.first() : null };
+    hovered.target?.emit("mouseover");
+    canvas.title = _describe(cy, hit, targets);
+    canvas.style.cursor = targets.nonempty() ? "pointer" : "default";
+}
+
+/**
+ * Shows the matrix view, drawn again on every change of the elements
+ * of the Cytoscape instance (only defined once).
+ */
+function initMatrix(cy) {
+    canvas = document.getElementById(MATRIX_ID);
+    document.getElementById(CONTAINER_ID).setAttribute("data-view", "matrix");
+    cy.on(REDRAW_EVENTS, _schedule);
+    new ResizeObserver(_schedule).observe(canvas);
+    canvas.addEventListener("click", _onClick);
+    canvas.addEventListener("dblclick", _onDoubleClick);
+    canvas.addEventListener("mousemove", _onMove);
+    canvas.addEventListener("mouseleave", _onMove);
+}
+
+/**
+ * Updates the order of the rows and columns, and draws the matrix
+ * again (e.g. with a new style).
+ */
+function updateMatrix(options) {
+    if (!canvas) {
+        return;
+    }
+    const key = JSON.stringify(options);
+    if (key !== orderKey) {
+        orderKey = key;
+        order = { ids: options?.ids ?? [], groups: options?.groups ?? null };
+    }
+    _schedule();
+}
+
+export default updateMatrix;
+export { initMatrix };
@@ -1,5 +1,7 @@
 import State from "../utils/state";
 import { getCyInstance, debouncedSetValue, debounce } from "../utils/helpers";
+import { runLayout } from "../utils/layouts";
+import { isGroup } from "./groups";
 
 // Configs
 const IDS = {
@@ -9,6 +11,24 @@ const IDS = {
 const DELAYS = {
     default: 150,
 };
+// Depth and per-node fan-out limit reported with the expand action
+const expandOptions = {
+    depth: 1,
+    limit: null,
+};
+// Expansion only lays out the added nodes: they are placed around the
+// expanded node, then relaxed by a short force pass restricted to them
+// and their neighbors, with every other node locked in place. The pass
+// gets a few more iterations per node laid out, up to a cap.
+const ITERATIONS = {
+    min: 50,
+    perNode: 2,
+    max: 150,
+};
+const RADIAL = {
+    radius: 60,
+    spacing: 30,
+};
 const expandLayout = {
     name: "fcose",
     animationDuration: 500,
@@ -16,25 +36,64 @@ const expandLayout = {
     fit: false,
     nodeDimensionsIncludeLabels: true,
     uniformNodeDimensions: true,
-    numIter: 50,
     tile: false,
 };
 
+function _radialPositions(parent, nodes) {
+    const center = parent.position();
+    // face away from the nodes already connected to the parent
+    let dx = 0;
+    let dy = 0;
+    parent
+        .neighborhood("node")
+        .difference(nodes)
+        .forEach((n) => {
+            dx += n.position("x") - center.x;
+            dy += n.position("y") - center.y;
+        });
+    const full = dx === 0 && dy === 0;
+    const arc = full ? 2 * Math.PI : Math.PI;
+    const start = full ? 0 : Math.atan2(-dy, -dx) - arc / 2;
+    const count = nodes.length;
+    const step = full ? arc / count : arc / Math.max(count - 1, 1);
+    const offset = full || count > 1 ? 0 : arc / 2;
+    const radius = Math.max(RADIAL.radius, (count * RADIAL.spacing) / arc);
+    const positions = {};
+    nodes.forEach((n, i) => {
+        const angle = start + offset + i * step;
+        positions[n.id()] = {
+            x: center.x + radius * Math.cos(angle),
+            y: center.y + radius * Math.sin(angle),
+        };
+    });
+    return positions;
+}
+
 function animateNeighbors(parent, neighbors) {
-    const pos = parent.position();
+    const cy = getCyInstance();
+    parent.connectedEdges().addClass("highlight");
+    if (neighbors.empty()) {
+        return;
+    }
+    const positions = _radialPositions(parent, neighbors);
+    cy.batch(() => {
+        neighbors.forEach((n) => n.position(positions[n.id()]));
+        neighbors.addClass("highlight");
+    });
+    const local = neighbors.union(neighbors.neighborhood());
+    const numIter = Math.min(
+        ITERATIONS.min + ITERATIONS.perNode * local.nodes().length,
+        ITERATIONS.max
+    );
     const layout = {
         ...expandLayout,
-        fixedNodeConstraint: [
-            {
-                nodeId: parent.id(),
-                position: pos,
-            },
-        ],
+        numIter,
+        fixedNodeConstraint: local
+            .nodes()
+            .difference(neighbors)
+            .map((n) => ({ nodeId: n.id(), position: { ...n.position() } })),
     };
-    neighbors.position(pos);
-    neighbors.addClass("highlight");
-    parent.connectedEdges().addClass("highlight");
-    getCyInstance().layout(layout).run();
+    runLayout(local, layout);
 }
 
 function _handleRemove() {
@@ -57,10 +116,11 @@ function _handleRemove() {
 
 function _handleExpand() {
     const node = State.getState("selection").lastSelected?.filter("node");
-    if (node?.group() == "nodes") {
+    // groups are expanded in the browser, see groups.js
+    if (node?.group() == "nodes" && !isGroup(node)) {
         debouncedSetValue({
             action: "expand",
-            data: { node_ids: [node.id()] },
+            data: { node_ids: [node.id()], ...expandOptions },
             timestamp: Date.now(),
         });
         State.updateState("lastExpanded", node);
@@ -72,6 +132,11 @@ const nodeActionsHandlers = {
     expand: debounce(_handleExpand, DELAYS.default),
 };
 
+function setExpandOptions(depth, limit) {
+    expandOptions.depth = depth ?? 1;
+    expandOptions.limit = limit ?? null;
+}
+
 function initNodeActions(nodeActions) {
     if (nodeActions.length === 0) {
         const nodeActions = document.getElementById("nodeActions");
@@ -106,5 +171,5 @@ function initNodeActions(nodeActions) {
     }
 }
 
-export { animateNeighbors };
+export { animateNeighbors, setExpandOptions };
 export default initNodeActions;
@@ -0,0 +1,123 @@
+import { debouncedSetValue, getCyInstance } from "../utils/helpers";
+import { decodeElements } from "../utils/codec";
+import { time } from "../utils/telemetry";
+
+// Streamed elements (see streamlit_cytoscape/streaming.py). Each render
+// carries the elements pushed and the IDs evicted since the version
+// `base`, applied in one cy.batch(). An increment based on another
+// version than the rendered one (a render was skipped, or the component
+// was remounted) is not applied: the increments since the rendered
+// version are requested instead.
+
+// Constants / Configurations
+const SYNC_ACTION = "stream_sync";
+const OFFSET = 80;
+const GOLDEN_ANGLE = Math.PI * (3 - Math.sqrt(5));
+const FIXED_DATA = ["id", "source", "target"];
+
+// Rendered stream, and its version
+let stream = null;
+
+function _requestSync() {
+    debouncedSetValue({
+        action: SYNC_ACTION,
+        data: {
+            stream: stream?.id ?? null,
+            version: stream?.version ?? null,
+        },
+        timestamp: Date.now(),
+    });
+}
+
+// Adds the new elements and updates the data of the others, returns
+// the added elements
+function _upsert(cy, elements) {
+    const added = [];
+    elements.forEach((el) => {
+        const existing = cy.getElementById(String(el.data.id));
+        if (existing.nonempty() && existing.isEdge()) {
+            const moved =
+                existing.data("source") !== String(el.data.source) ||
+                existing.data("target") !== String(el.data.target);
+            if (moved) {
+                existing.remove();
+            }
+        }
+        if (existing.empty() || existing.removed()) {
+            added.push(el);
+            return;
+        }
+        const data = Object.entries(el.data).filter(
+            ([key]) => !FIXED_DATA.includes(key)
+        );
+        existing.data(Object.fromEntries(data));
+    });
+    return cy.add(added);
+}
+
+// New nodes are placed around a neighbor already in the graph, or in
+// the current view, until the layout is run again
+function _place(cy, nodes) {
+    const extent = cy.extent();
+    nodes.forEach((node, i) => {
+        const anchor = node.neighborhood("node").difference(nodes).first();
+        if (anchor.nonempty()) {
+            const { x, y } = anchor.position();
+            const angle = i * GOLDEN_ANGLE;
+            node.position({
+                x: x + OFFSET * Math.cos(angle),
+                y: y + OFFSET * Math.sin(angle),
+            });
+        } else {
+            node.position({
+                x: extent.x1 + Math.random() * extent.w,
+                y: extent.y1 + Math.random() * extent.h,
+            });
+        }
+    });
+}
+
+// Returns whether the elements changed
+function _apply(cy, { base, elements, evicted }) {
+    const { nodes, edges } = decodeElements(elements);
+    cy.batch(() => {
+        if (base === null) {
+            // whole window, replacing the elements
+            const ids = new Set(
+                [...nodes, ...edges].map((el) => String(el.data.id))
+            );
+            cy.elements()
+                .filter((el) => !ids.has(el.id()))
+                .remove();
+        } else {
+            evicted.forEach((id) => cy.getElementById(id).remove());
+        }
+        const added = _upsert(cy, [...nodes, ...edges]);
+        _place(cy, added.nodes());
+    });
+    return base === null || evicted.length + nodes.length + edges.length > 0;
+}
+
+/**
+ * Applies the increment of a stream, on every render. Returns whether
+ * the elements changed.
+ */
+function updateStream(payload) {
+    if (!payload) {
+        stream = null;
+        return false;
+    }
+    const { id, base, version } = payload;
+    if (base !== null && (stream?.id !== id || stream.version !== base)) {
+        _requestSync();
+        return false;
+    }
+    const unchanged = base === version;
+    stream = { id, version };
+    if (unchanged) {
+        return false;
+    }
+    return time("elements", () => _apply(getCyInstance(), payload));
+}
+
+export default updateStream;
@@ -0,0 +1,228 @@
+import State from "../utils/state";
+import { getCyInstance } from "../utils/helpers";
+import { setHidden } from "../utils/visibility";
+import { parseValue } from "../utils/values";
+
+// Temporal playback. Elements are visible at time t when
+// start <= t < end (a missing bound is unbounded). The elements are
+// indexed once per elements version, sorted by start and by end time,
+// so moving from t0 to t1 only visits the elements starting or ending
+// in between, found by binary search. Scrubbing and playing never
+// rerun the app.
+
+// Constants / Configurations
+const TIMELINE_ID = "timeline";
+const REASON = "timeline";
+const STEPS = 1000;
+const DAY = 86400000;
+
+let config = null;
+let signature = null;
+let index = null;
+let current = null;
+let frame = null;
+let lastFrame = null;
+
+function _signature(c) {
+    return c && `${c.start}:${c.end}:${c.dtype}`;
+}
+
+function _sorted(items, bound) {
+    const sorted = items
+        .filter((item) => Number.isFinite(item[bound]))
+        .sort((a, b) => a[bound] - b[bound]);
+    return {
+        keys: Float64Array.from(sorted, (item) => item[bound]),
+        items: sorted,
+    };
+}
+
+function _buildIndex(cy) {
+    const items = [];
+    cy.elements().forEach((el) => {
+        const start = parseValue(el.data(config.start), config.dtype);
+        const end = parseValue(el.data(config.end), config.dtype);
+        // elements without bounds are always visible
+        if (Number.isNaN(start) && Number.isNaN(end)) {
+            return;
+        }
+        items.push({
+            el,
+            start: Number.isNaN(start) ? -Infinity : start,
+            end: Number.isNaN(end) ? Infinity : end,
+        });
+    });
+    const starts = _sorted(items, "start");
+    const ends = _sorted(items, "end");
+    const bounds = [starts.keys[0], starts.keys[starts.keys.length - 1]];
+    bounds.push(ends.keys[0], ends.keys[ends.keys.length - 1]);
+    const finite = bounds.filter(Number.isFinite);
+    index = {
+        items,
+        starts,
+        ends,
+        min: finite.length ? Math.min(...finite) : 0,
+        max: finite.length ? Math.max(...finite) : 0,
+    };
+}
+
+// First position whose key is > bound
+function _bisect(keys, bound) {
+    let lo = 0;
+    let hi = keys.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        keys[mid] <= bound ? (lo = mid + 1) : (hi = mid);
+    }
+    return lo;
+}
+
+function _visible(item, t) {
+    return item.start <= t && t < item.end;
+}
+
+// Moves to time t, only updating the elements whose visibility may
+// have changed: those starting or ending in (min(t0, t), max(t0, t)]
+function _seek(cy, t) {
+    const show = [];
+    const hide = [];
+    const visit = (item) => (_visible(item, t) ? show : hide).push(item.el);
+    if (current === null) {
+        index.items.forEach(visit);
+    } else if (t !== current) {
+        const lo = Math.min(current, t);
+        const hi = Math.max(current, t);
+        [index.starts, index.ends].forEach(({ keys, items }) => {
+            for (let i = _bisect(keys, lo); i < keys.length; i++) {
+                if (keys[i] > hi) {
+                    break;
+                }
+                visit(items[i]);
+            }
+        });
+    }
+    current = t;
+    cy.batch(() => {
+        setHidden(cy.collection(hide), REASON, true);
+        setHidden(cy.collection(show), REASON, false);
+    });
+    _renderTime();
+    // only kept in state, reported with the next returned value
+    State.updateState("timeline", _format(t, true));
+}
+
+function _format(t, full) {
+    if (config.dtype !== "date") {
+        return full ? t : String(Math.round(t * 100) / 100);
+    }
+    const iso = new Date(t).toISOString();
+    if (full) {
+        return iso;
+    }
+    // dates only, unless the time of day is set
+    return t % DAY === 0
+        ? iso.slice(0, 10)
+        : iso.slice(0, 16).replace("T", " ");
+}
+
+function _renderTime() {
+    const timeline = document.getElementById(TIMELINE_ID);
+    const span = index.max - index.min;
+    const ratio = span ? (current - index.min) / span : 0;
+    timeline.querySelector(".timeline__slider").value = Math.round(
+        ratio * STEPS
+    );
+    timeline.querySelector(".timeline__label").innerText = _format(current);
+}
+
+function _play() {
+    const cy = getCyInstance();
+    // units of time per millisecond
+    const rate = (index.max - index.min) / (config.duration * 1000);
+    if (current >= index.max) {
+        _seek(cy, index.min);
+    }
+    const step = (now) => {
+        let t = current + (lastFrame === null ? 0 : now - lastFrame) * rate;
+        lastFrame = now;
+        if (t >= index.max) {
+            t = config.loop ? index.min : index.max;
+        }
+        _seek(cy, t);
+        if (t >= index.max) {
+            _pause();
+            return;
+        }
+        frame = requestAnimationFrame(step);
+    };
+    document.getElementById(TIMELINE_ID).setAttribute("data-playing", true);
+    frame = requestAnimationFrame(step);
+}
+
+function _pause() {
+    cancelAnimationFrame(frame);
+    frame = null;
+    lastFrame = null;
+    document.getElementById(TIMELINE_ID).setAttribute("data-playing", false);
+}
+
+function initTimeline() {
+    const timeline = document.getElementById(TIMELINE_ID);
+    const play = timeline.querySelector(".timeline__play");
+    const slider = timeline.querySelector(".timeline__slider");
+    play.addEventListener("click", () => {
+        if (index) {
+            frame === null ? _play() : _pause();
+        }
+    });
+    slider.addEventListener("input", () => {
+        if (index) {
+            _pause();
+            const ratio = Number(slider.value) / STEPS;
+            const t = index.min + ratio * (index.max - index.min);
+            _seek(getCyInstance(), t);
+        }
+    });
+}
+
+// Timeline update, on every render. Elements are only reindexed when
+// the elements or the bound attributes changed, and the time only
+// moves when the requested initial time changed.
+function updateTimeline(newConfig, elementsChanged) {
+    const cy = getCyInstance();
+    const timeline = document.getElementById(TIMELINE_ID);
+    const previous = config;
+    const reindex = elementsChanged || _signature(newConfig) !== signature;
+    config = newConfig || null;
+    signature = _signature(config);
+    if (!reindex && previous?.value === config?.value) {
+        return;
+    }
+    _pause();
+    if (reindex && index) {
+        // elements kept by an update keep their hidden reasons
+        const eles = cy.collection(index.items.map((item) => item.el));
+        setHidden(eles, REASON, false);
+        index = null;
+    }
+    timeline.setAttribute("data-visible", config !== null);
+    if (!config) {
+        current = null;
+        State.updateState("timeline", null);
+        return;
+    }
+    let time = current;
+    if (reindex) {
+        _buildIndex(cy);
+        current = null;
+    }
+    // a new requested time, or the initial one
+    if (previous?.value !== config.value || time === null) {
+        const value = parseValue(config.value, config.dtype);
+        time = Number.isNaN(value) ? index.min : value;
+    }
+    _seek(cy, time);
+}
+
+export { initTimeline };
+export default updateTimeline;
@@ -1,18 +1,27 @@
 import State from "../utils/state";
 import { debounce, getCyInstance } from "../utils/helpers";
+import { runLayout } from "../utils/layouts";
+import { buildIndex, search } from "../utils/search";
 
 // Constants / Configurations
 const IDS = {
     fullscreen: "toolbarFullscreen",
     refresh: "toolbarRefresh",
     export: "toolbarExport",
+    toolbar: "toolbar",
+    searchInput: "toolbarSearchInput",
+    searchResults: "toolbarSearchResults",
 };
 const DELAYS = {
     default: 150,
     fullscreen: 100,
     refresh: 200,
     export: 250,
+    search: 50,
+    focus: 400,
 };
+const FOCUS_ZOOM = 2;
+const PLACEHOLDER_SELECTOR = "[label='_MORE']";
 
 // Event Handlers
 const clickHandlers = {
@@ -26,7 +35,7 @@ const clickHandlers = {
 
     refresh: debounce(() => {
         const cy = getCyInstance();
-        cy.layout(State.getState("layout")).run();
+        runLayout(cy, State.getState("layout"));
     }, DELAYS.refresh),
 
     export: debounce(() => {
@@ -46,6 +55,142 @@ const clickHandlers = {
     }, DELAYS.export),
 };
 
+// Search: the index is built once per elements version, in a worker
+// when available. Results of an outdated index are dropped.
+const searchIndex = {
+    fields: null,
+    version: 0,
+    worker: undefined,
+    index: null,
+    results: [],
+    active: 0,
+};
+
+function _getWorker() {
+    if (searchIndex.worker === undefined) {
+        try {
+            searchIndex.worker = new Worker(
+                new URL("../utils/search.worker.js", import.meta.url)
+            );
+            searchIndex.worker.onmessage = ({ data }) => {
+                if (data.version === searchIndex.version) {
+                    _showResults(data.results);
+                }
+            };
+        } catch {
+            // e.g. workers blocked by the page, index on the main thread
+            searchIndex.worker = null;
+        }
+    }
+    return searchIndex.worker;
+}
+
+function _buildSearchIndex(cy, fields) {
+    const docs = cy
+        .nodes()
+        .not(PLACEHOLDER_SELECTOR)
+        .map((n) => [n.id(), fields.map((f) => n.data(f))]);
+    searchIndex.version += 1;
+    const worker = _getWorker();
+    if (worker) {
+        worker.postMessage({
+            type: "build",
+            version: searchIndex.version,
+            docs: docs,
+        });
+    } else {
+        searchIndex.index = buildIndex(docs);
+    }
+}
+
+function _showResults(results) {
+    const container = document.getElementById(IDS.searchResults);
+    searchIndex.results = results;
+    searchIndex.active = 0;
+    container.replaceChildren(
+        ...results.map((r, i) => {
+            const item = document.createElement("div");
+            item.className = "search__result";
+            item.innerText = r.value;
+            item.title = r.id;
+            item.setAttribute("data-active", i === 0);
+            // mousedown fires before the input loses focus
+            item.addEventListener("mousedown", (e) => {
+                e.preventDefault();
+                _focusNode(r.id);
+            });
+            return item;
+        })
+    );
+}
+
+function _focusNode(id) {
+    const cy = getCyInstance();
+    const node = cy.getElementById(id);
+    _showResults([]);
+    if (node.empty()) {
+        return;
+    }
+    cy.$(":selected").unselect();
+    node.select();
+    cy.animate({
+        center: { eles: node },
+        zoom: Math.max(cy.zoom(), FOCUS_ZOOM),
+        duration: DELAYS.focus,
+    });
+}
+
+const searchHandlers = {
+    input: debounce((e) => {
+        const query = e.target.value;
+        const worker = _getWorker();
+        if (worker) {
+            worker.postMessage({ type: "query", query: query });
+        } else {
+            _showResults(search(searchIndex.index, query));
+        }
+    }, DELAYS.search),
+
+    keydown: (e) => {
+        const { results, active } = searchIndex;
+        if (e.key === "Enter" && results.length) {
+            _focusNode(results[active].id);
+        } else if (e.key === "ArrowDown" || e.key === "ArrowUp") {
+            e.preventDefault();
+            const step = e.key === "ArrowDown" ? 1 : -1;
+            const next = (active + step + results.length) % results.length;
+            const items = document.getElementById(IDS.searchResults).children;
+            items[active]?.setAttribute("data-active", false);
+            items[next]?.setAttribute("data-active", true);
+            searchIndex.active = next || 0;
+        } else if (e.key === "Escape") {
+            e.target.value = "";
+            _showResults([]);
+        }
+        // keep graph shortcuts (e.g. delete node) off while typing
+        e.stopPropagation();
+    },
+
+    blur: () => _showResults([]),
+};
+
+// Search update, on every render
+function updateSearch(fields, elementsChanged) {
+    fields = fields || [];
+    const fieldsChanged =
+        JSON.stringify(fields) !== JSON.stringify(searchIndex.fields);
+    if (!fieldsChanged && !elementsChanged) {
+        return;
+    }
+    searchIndex.fields = fields;
+    document
+        .getElementById(IDS.toolbar)
+        .setAttribute("data-search", fields.length > 0);
+    if (fields.length) {
+        _buildSearchIndex(getCyInstance(), fields);
+    }
+}
+
 // Toolbar initialization
 function initToolbar() {
     document
@@ -57,6 +202,11 @@ function initToolbar() {
     document
         .getElementById(IDS.export)
         .addEventListener("click", clickHandlers.export);
+    const input = document.getElementById(IDS.searchInput);
+    input.addEventListener("input", searchHandlers.input);
+    input.addEventListener("keydown", searchHandlers.keydown);
+    input.addEventListener("blur", searchHandlers.blur);
 }
 
+export { updateSearch };
 export default initToolbar;
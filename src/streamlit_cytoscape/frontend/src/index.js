@@ -1,13 +1,34 @@
 import "./style.css";
 import { Streamlit } from "streamlit-component-lib";
 import State from "./utils/state.js";
-import { debounce } from "./utils/helpers.js";
+import { debounce, debouncedSetValue } from "./utils/helpers.js";
+import {
+    time,
+    record,
+    markFirstPaint,
+    markReceived,
+    hasPending,
+} from "./utils/telemetry.js";
+import { resolveElements, toCyElements } from "./utils/cache.js";
+import { decodeElements, inflateElements } from "./utils/codec.js";
 import initCyto, { graph } from "./components/graph.js";
-import initToolbar from "./components/toolbar.js";
+import initToolbar, { updateSearch } from "./components/toolbar.js";
 import initViewbar from "./components/viewbar.js";
-import initNodeActions, { animateNeighbors } from "./components/nodeActions.js";
-import initEdgeActions from "./components/edgeActions.js";
+import initNodeActions, {
+    animateNeighbors,
+    setExpandOptions,
+} from "./components/nodeActions.js";
+import initEdgeActions, {
+    collapseAllParallelEdges,
+} from "./components/edgeActions.js";
 import updateInfopanel, { initInfopanel } from "./components/infopanel.js";
+import updateLegend from "./components/legend.js";
+import updateFilters from "./components/filters.js";
+import updateTimeline, { initTimeline } from "./components/timeline.js";
+import { loadElements, cachePositions } from "./components/loader.js";
+import updateStream from "./components/stream.js";
+import updateMatrix, { initMatrix } from "./components/matrix.js";
+import initGroups, { groupElements, isGroup } from "./components/groups.js";
 
 // Constants / Configurations
 const CONTAINER_ID = "container";
@@ -19,38 +40,240 @@ State.subscribe("selection", updateInfopanel);
 State.subscribe("selection", graph.updateHighlight);
 State.subscribe("layout", graph.updateLayout);
 State.subscribe("style", graph.updateStyle);
+State.subscribe("query", graph.updateQuery);
 
 // Initialize variables for onRender
 let cy;
 let elements, newElements;
 let style, newStyle;
 let layout, newLayout;
+let query, newQuery;
+let telemetryTimer, telemetryInterval;
+// Progressive loading in progress, and the last render event received
+// meanwhile
+let loading = null;
+let pendingEvent = null;
+
+// Returns a getter of the elements to render and their version.
+// Registered datasets are versioned by their handle, plain elements
+// by content. Shared elements are only copied when actually rendered.
+function _getElements(args) {
+    if (args["stream"]) {
+        // streamed elements are updated incrementally, see updateStream
+        return [null, null];
+    }
+    const key = args["elementsKey"];
+    if (!key) {
+        return [
+            () => decodeElements(args["elements"]),
+            JSON.stringify(args["elements"]),
+        ];
+    }
+    if (key === elements && !args["elements"]) {
+        // unchanged, already rendered
+        return [null, elements];
+    }
+    const shared = resolveElements(key, args["elements"]);
+    return shared ? [() => toCyElements(shared), key] : [null, elements];
+}
+
+// Updates the folded counts (badges) of the displayed nodes, which
+// change with their expansion, see folding.py
+function _updateFolded(nodes) {
+    nodes.forEach((node) => {
+        const displayed = cy.getElementById(String(node.data.id));
+        // set to 0 rather than removed, as removing data does not
+        // update the style
+        const folded = node.data._folded ?? 0;
+        const current = displayed.data("_folded") ?? 0;
+        if (displayed.nonempty() && current !== folded) {
+            displayed.data("_folded", folded);
+        }
+    });
+}
+
+// Removes the displayed elements missing from the elements, e.g. an
+// expanded "load more" placeholder (see graph.py), except those made in
+// the browser: groups and their aggregate edges, collapsed parallel
+// edges
+function _removeMissing({ nodes, edges }) {
+    const ids = new Set([...nodes, ...edges].map((el) => String(el.data.id)));
+    cy.elements()
+        .filter(
+            (el) =>
+                !ids.has(el.id()) &&
+                !el.data("_isMetaEdge") &&
+                !el.data("_isGroupEdge") &&
+                !(el.isNode() && isGroup(el))
+        )
+        .remove();
+}
+
+// Periodic telemetry reports (opt-in, as each one reruns the app), only
+// sent when something other than reruns was measured since the last
+// report
+function _updateTelemetry(options) {
+    State.updateState("telemetry", options || null);
+    const interval = options?.interval ? options.interval * 1000 : null;
+    if (interval === telemetryInterval) {
+        return;
+    }
+    telemetryInterval = interval;
+    clearInterval(telemetryTimer);
+    if (interval) {
+        telemetryTimer = setInterval(() => {
+            if (hasPending()) {
+                debouncedSetValue({
+                    action: "telemetry",
+                    data: null,
+                    timestamp: Date.now(),
+                });
+            }
+        }, interval);
+    }
+}
+
+// Elements dependent updates, after the elements are (fully) loaded
+function _updateView(args, elementsChanged, styleChanged) {
+    // Query highlight update, reapplied (without refocusing) to new
+    // elements
+    const queryChanged = newQuery != query;
+    if (queryChanged || elementsChanged) {
+        query = newQuery;
+        const highlight = args["highlight"];
+        State.updateState(
+            "query",
+            highlight && {
+                ...highlight,
+                focus: highlight.focus && queryChanged,
+            }
+        );
+    }
+
+    // Range filters update, incremental unless the elements changed
+    updateFilters(args["filters"], elementsChanged);
+
+    // Search index update, rebuilt when the elements changed
+    updateSearch(args["searchFields"], elementsChanged);
+
+    // Timeline update, reindexed when the elements changed
+    updateTimeline(args["timeline"], elementsChanged);
+
+    // Legend update, after elements and style
+    updateLegend(args["legend"], elementsChanged || styleChanged);
+
+    // Matrix view order update, and drawing after elements and style
+    updateMatrix(args["matrix"]);
+
+    // Layout dynamic update
+    if (newLayout != layout) {
+        layout = newLayout;
+        State.updateState("layout", args["layout"]);
+    }
+}
+
+// Progressive loading of the first elements. The rest of the render is
+// applied once loaded, then the last render event received meanwhile
+// (also when loading failed).
+function _loadProgressively(args, getElements, styleChanged) {
+    elements = newElements;
+    const version = elements;
+    const start = performance.now();
+    loading = loadElements(cy, groupElements(getElements()), version);
+    loading
+        .then((positioned) => {
+            record("elements", performance.now() - start);
+            _loaded(args, positioned, version, styleChanged);
+        })
+        .catch((error) => {
+            // replaced by the next render of the elements
+            elements = null;
+            console.error("Progressive loading failed", error);
+        })
+        .finally(() => {
+            loading = null;
+            if (pendingEvent) {
+                const event = pendingEvent;
+                pendingEvent = null;
+                onRender(event);
+            }
+        });
+}
+
+// Rest of the render once the elements are loaded progressively
+function _loaded(args, positioned, version, styleChanged) {
+    if (args["collapseParallelEdges"]) {
+        collapseAllParallelEdges();
+    }
+    if (positioned) {
+        // preset or cached positions: the layout is not run
+        layout = newLayout;
+        State.updateState("layout", args["layout"], true);
+    } else {
+        // rerun the layout, and cache its positions
+        layout = null;
+        cy.one("layoutstop", () => cachePositions(cy, version));
+    }
+    _updateView(args, true, styleChanged);
+}
 
 // Streamlit render event handler
 function onRender(event) {
+    if (loading) {
+        pendingEvent = event;
+        return;
+    }
+    const renderStart = performance.now();
     const { args, theme } = event.detail;
-    newElements = JSON.stringify(args["elements"]);
+    let getElements;
+    [getElements, newElements] = _getElements(args);
     newStyle = JSON.stringify(args["style"]) + JSON.stringify(args["metaEdgeStyle"] || {}) + theme.base;
     newLayout = JSON.stringify(args["layout"]);
+    newQuery = JSON.stringify(args["highlight"]);
+    record("args", performance.now() - renderStart);
+    _updateTelemetry(args["telemetry"]);
     document.getElementById("container").style.height = args["height"];
 
-    // Update infopanel config on every render
+    const progressive = args["progressive"] || false;
+
+    // Update infopanel and expand configs on every render
     initInfopanel(args["hideUnderscoreAttrs"]);
+    setExpandOptions(args["expandDepth"], args["expandLimit"]);
 
     // Initialize once
     if (!cy) {
         document.getElementById("container").style.height = args["height"];
-        cy = initCyto(args["events"]);
-        cy.json({ elements: args["elements"] });
-        elements = newElements;
+        cy = initCyto(
+            args["events"],
+            args["renderer"],
+            theme.base,
+            args["view"]
+        );
+        if (args["view"] === "matrix") {
+            initMatrix(cy);
+        }
+        initGroups(args["groups"]);
+        markFirstPaint(cy);
+        if (getElements && !progressive) {
+            time("elements", () =>
+                cy.json({ elements: groupElements(getElements()) })
+            );
+            elements = newElements;
+        }
         initNodeActions(args["nodeActions"]);
+        // progressively loaded edges are collapsed once loaded
         initEdgeActions(
             args["edgeActions"] || [],
-            args["collapseParallelEdges"] || false,
+            (args["collapseParallelEdges"] || false) && !progressive,
             args["priorityEdgeLabel"] || null
         );
         initToolbar();
         initViewbar();
+        initTimeline();
+        // time from iframe navigation to the first rendered graph,
+        // also reported by telemetry
+        const startup = performance.measure("streamlit-cytoscape:startup");
+        record("startup", startup?.duration ?? performance.now());
 
         // ResizeObserver for multi-tab support - fit graph when container becomes visible
         const resizeObserver = new ResizeObserver(
@@ -64,28 +287,49 @@ function onRender(event) {
         );
         resizeObserver.observe(document.getElementById("cy"));
     }
+    // Streamed elements incremental update, in place of the elements
+    const streamChanged = updateStream(args["stream"]);
+    if (args["stream"]) {
+        elements = newElements;
+    }
     // Elements dynamic update
-    if (newElements != elements) {
+    const elementsChanged = newElements != elements;
+    // first elements of a progressive graph, loaded after the style
+    const loadsProgressively =
+        elementsChanged && progressive && cy.elements().empty();
+    if (elementsChanged && !loadsProgressively) {
         elements = newElements;
         const lastExpanded = State.getState("lastExpanded");
         if (lastExpanded === false) {
             // default behavior
-            cy.json({ elements: args["elements"] });
+            time("elements", () =>
+                cy.json({ elements: groupElements(getElements()) })
+            );
         } else {
-            // if last action === expand
-            const newNodes = cy
-                .add([
-                    ...args["elements"]["nodes"],
-                    ...args["elements"]["edges"],
-                ])
-                .filter("node");
+            // if last action === expand, only add the missing elements
+            // and remove the dropped ones
+            const newNodes = time("elements", () => {
+                const payload = getElements();
+                const { nodes, edges } = groupElements(payload, false);
+                _updateFolded(payload.nodes);
+                const added = [...nodes, ...edges].filter((el) =>
+                    cy.getElementById(String(el.data.id)).empty()
+                );
+                let addedNodes;
+                cy.batch(() => {
+                    _removeMissing(payload);
+                    addedNodes = cy.add(added).filter("node");
+                });
+                return addedNodes;
+            });
             animateNeighbors(lastExpanded, newNodes);
         }
     }
     State.updateState("lastExpanded", false);
 
     // Style dynamic update
-    if (newStyle != style) {
+    const styleChanged = newStyle != style;
+    if (styleChanged) {
         style = newStyle;
         State.updateState("style", {
             custom_style: args["style"],
@@ -94,11 +338,12 @@ function onRender(event) {
         });
     }
 
-    // Layout dynamic update
-    if (newLayout != layout) {
-        layout = newLayout;
-        State.updateState("layout", args["layout"]);
+    if (loadsProgressively) {
+        _loadProgressively(args, getElements, styleChanged);
+    } else {
+        _updateView(args, elementsChanged || streamChanged, styleChanged);
     }
+    record("render", performance.now() - renderStart);
 
     setTimeout(() => {
         Streamlit.setFrameHeight();
@@ -116,8 +361,16 @@ document.addEventListener("fullscreenchange", function () {
 setTimeout(() => {
     Streamlit.setFrameHeight();
 }, SETFRAME_DELAY);
-Streamlit.events.addEventListener(
-    Streamlit.RENDER_EVENT,
-    debounce(onRender, RENDER_DEBOUNCE)
-);
+// not debounced, for event round trip timings
+Streamlit.events.addEventListener(Streamlit.RENDER_EVENT, markReceived);
+// packed elements (compact=True) are inflated before render, in the
+// order the events were received
+const debouncedRender = debounce(onRender, RENDER_DEBOUNCE);
+let inflated = Promise.resolve();
+Streamlit.events.addEventListener(Streamlit.RENDER_EVENT, (event) => {
+    inflated = inflated
+        .then(() => inflateElements(event.detail.args))
+        .then(() => debouncedRender(event))
+        .catch((error) => console.error("Invalid elements payload", error));
+});
 Streamlit.setComponentReady();
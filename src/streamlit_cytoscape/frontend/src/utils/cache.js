@@ -0,0 +1,102 @@
+// Elements registered in Python under a dataset handle are shared by
+// every component iframe of the page. The first iframe receiving a
+// handle stores the deserialized elements on the parent window, the
+// others (and remounted ones) read them from there. The store is
+// bounded: when the elements of a handle Python already delivered are
+// evicted (or the page was reloaded), they are requested again.
+
+import { debouncedSetValue } from "./helpers";
+import { decodeElements } from "./codec";
+
+// Constants / Configurations
+const STORE_NAME = "__streamlitCytoscapeDatasets";
+const MAX_DATASETS = 8;
+const RESYNC_ACTION = "dataset_sync";
+
+// Handle requested again, until its elements are received
+let requested = null;
+
+function _getStore() {
+    try {
+        if (!window.parent[STORE_NAME]) {
+            window.parent[STORE_NAME] = new Map();
+        }
+        return window.parent[STORE_NAME];
+    } catch {
+        // cross-origin parent (e.g. frontend dev server)
+        if (!window[STORE_NAME]) {
+            window[STORE_NAME] = new Map();
+        }
+        return window[STORE_NAME];
+    }
+}
+
+function _requestResync(key) {
+    if (requested === key) {
+        return;
+    }
+    requested = key;
+    debouncedSetValue({
+        action: RESYNC_ACTION,
+        data: { handle: key },
+        timestamp: Date.now(),
+    });
+}
+
+function _freeze(elements) {
+    ["nodes", "edges"].forEach((group) => {
+        (elements[group] || []).forEach((el) => Object.freeze(el.data));
+        Object.freeze(elements[group] || []);
+    });
+    return Object.freeze(elements);
+}
+
+/**
+ * Returns the shared elements of a dataset handle. `elements` is the
+ * payload received with the handle, it is null when Python already
+ * delivered the handle to this component instance. Returns null, and
+ * requests the payload, when the handle is not in the store anymore.
+ */
+function resolveElements(key, elements) {
+    const store = _getStore();
+    if (elements) {
+        if (requested === key) {
+            requested = null;
+        }
+        if (!store.has(key)) {
+            store.set(key, _freeze(decodeElements(elements)));
+        }
+        // re-insert to keep the most recently used datasets last
+        const shared = store.get(key);
+        store.delete(key);
+        store.set(key, shared);
+        while (store.size > MAX_DATASETS) {
+            store.delete(store.keys().next().value);
+        }
+        return shared;
+    }
+    if (!store.has(key)) {
+        _requestResync(key);
+        return null;
+    }
+    return store.get(key);
+}
+
+/**
+ * Copies shared elements into the objects handed to cytoscape, which
+ * mutates element data (e.g. id coercion) and must not write to the
+ * shared, frozen data.
+ */
+function toCyElements(elements) {
+    const copy = (el) => ({
+        ...el,
+        data: { ...el.data },
+        ...(el.position && { position: { ...el.position } }),
+    });
+    return {
+        nodes: (elements["nodes"] || []).map(copy),
+        edges: (elements["edges"] || []).map(copy),
+    };
+}
+
+export { resolveElements, toCyElements };
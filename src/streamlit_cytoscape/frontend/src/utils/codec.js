@@ -0,0 +1,113 @@
+// Decoder of the compact wire format of the elements (see
+// streamlit_cytoscape/encoding.py)
+
+const COMPACT_FORMAT = "compact";
+
+// Returns a getter of the values of a column, by row
+function _column(column, strings) {
+    let get;
+    if (column.range) {
+        const [prefix, start] = column.range;
+        get = (i) => `${prefix}${start + i}`;
+    } else if (column.strings) {
+        const values = column.strings;
+        get = (i) =>
+            typeof values[i] === "number" ? strings[values[i]] : values[i];
+    } else if (column.codes) {
+        const { codes, dictionary } = column;
+        get = (i) => (codes[i] < 0 ? null : dictionary[codes[i]]);
+    } else {
+        get = (i) => column.values[i];
+    }
+    if (!column.rows) {
+        return get;
+    }
+    // sparse column, null out of the listed rows
+    const rows = new Map(column.rows.map((row, i) => [row, i]));
+    return (i) => (rows.has(i) ? get(rows.get(i)) : null);
+}
+
+function _decodeGroup(group, strings, init) {
+    const entries = (columns) =>
+        Object.entries(columns).map(([k, c]) => [k, _column(c, strings)]);
+    const data = entries(group.data);
+    const fields = entries(group.fields);
+    const elements = new Array(group.length);
+    for (let i = 0; i < group.length; i++) {
+        const el = { data: init(i) };
+        data.forEach(([key, get]) => {
+            const value = get(i);
+            if (value !== null && value !== undefined) el.data[key] = value;
+        });
+        fields.forEach(([key, get]) => {
+            const value = get(i);
+            if (value !== null && value !== undefined) el[key] = value;
+        });
+        elements[i] = el;
+    }
+    return elements;
+}
+
+/**
+ * Returns cytoscape elements ({nodes, edges}) from a payload in the
+ * compact format, other payloads are returned as is.
+ */
+function decodeElements(payload) {
+    if (payload?.format !== COMPACT_FORMAT) {
+        return payload;
+    }
+    const strings = payload.strings ?? [];
+    const getId = _column(payload.ids, strings);
+    const ids = Array.from({ length: payload.nodes.length }, (_, i) =>
+        getId(i)
+    );
+    const node = (v) => (typeof v === "number" ? ids[v] : v);
+    const { id, source, target } = payload.edges.data;
+    const sources = _column(source, strings);
+    const targets = _column(target, strings);
+    // edge IDs made of their source and target IDs
+    const separator = id?.join;
+    const skipped = ["source", "target"];
+    if (separator !== undefined) {
+        skipped.push("id");
+    }
+    const edges = {
+        ...payload.edges,
+        data: Object.fromEntries(
+            Object.entries(payload.edges.data).filter(
+                ([key]) => !skipped.includes(key)
+            )
+        ),
+    };
+    return {
+        nodes: _decodeGroup(payload.nodes, strings, (i) => ({ id: ids[i] })),
+        edges: _decodeGroup(edges, strings, (i) => {
+            const data = {
+                source: node(sources(i)),
+                target: node(targets(i)),
+            };
+            if (separator !== undefined) {
+                data.id = `${data.source}${separator}${data.target}`;
+            }
+            return data;
+        }),
+    };
+}
+
+/**
+ * Inflates the packed elements of the render arguments (bytes of the
+ * deflated compact payload, see pack_elements), in place.
+ */
+async function inflateElements(args) {
+    const packed = args["elements"];
+    if (!(packed instanceof Uint8Array)) {
+        return args;
+    }
+    const stream = new Blob([packed])
+        .stream()
+        .pipeThrough(new DecompressionStream("deflate"));
+    args["elements"] = JSON.parse(await new Response(stream).text());
+    return args;
+}
+
+export { decodeElements, inflateElements };
@@ -0,0 +1,140 @@
+// Fruchterman-Reingold force directed iterations over typed arrays,
+// the model of streamlit_cytoscape/layout_pool.py: positions are in
+// units of the ideal edge length, nodes repel each other (a random
+// sample of them above EXACT_LIMIT nodes, scaled to the graph size),
+// edges pull their nodes together and a weak gravity keeps components
+// together. The temperature (largest move of an iteration) cools
+// down over the planned iterations.
+// Pure functions, run in the refinement worker (or inline as fallback).
+
+// Constants / Configurations
+const EXACT_LIMIT = 2000;
+const SAMPLE_SIZE = 500;
+const GRAVITY = 0.05;
+const FINAL_TEMPERATURE = 0.01;
+
+// Seeded pseudo random numbers in [0, 1) (mulberry32)
+function _random(seed) {
+    let state = seed >>> 0;
+    return () => {
+        state = (state + 0x6d2b79f5) >>> 0;
+        let t = state;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+/**
+ * Returns the state of a layout of `n` nodes from their positions
+ * (x and y interleaved) and the node indexes of the edges, for
+ * `iterations` iterations starting at `temperature`.
+ */
+function createForce(positions, source, target, iterations, temperature) {
+    const n = positions.length / 2;
+    const x = new Float64Array(n);
+    const y = new Float64Array(n);
+    for (let i = 0; i < n; i++) {
+        x[i] = positions[2 * i];
+        y[i] = positions[2 * i + 1];
+    }
+    const start = temperature ?? Math.sqrt(n) / 5;
+    return {
+        n,
+        x,
+        y,
+        source,
+        target,
+        temperature: start,
+        cooling: (FINAL_TEMPERATURE / start) ** (1 / Math.max(iterations, 1)),
+        random: _random(n),
+        dx: new Float64Array(n),
+        dy: new Float64Array(n),
+    };
+}
+
+function _repel(state) {
+    const { n, x, y, dx, dy, random } = state;
+    let others = null;
+    let factor = 1;
+    if (n > EXACT_LIMIT) {
+        others = new Uint32Array(SAMPLE_SIZE);
+        for (let k = 0; k < SAMPLE_SIZE; k++) {
+            others[k] = Math.floor(random() * n);
+        }
+        factor = n / SAMPLE_SIZE;
+    }
+    const count = others ? others.length : n;
+    for (let i = 0; i < n; i++) {
+        let fx = 0;
+        let fy = 0;
+        for (let k = 0; k < count; k++) {
+            const j = others ? others[k] : k;
+            const ex = x[i] - x[j];
+            const ey = y[i] - y[j];
+            const d2 = ex * ex + ey * ey;
+            if (d2 > 1e-9) {
+                fx += ex / d2;
+                fy += ey / d2;
+            }
+        }
+        dx[i] = factor * fx;
+        dy[i] = factor * fy;
+    }
+}
+
+function _attract(state) {
+    const { x, y, dx, dy, source, target } = state;
+    for (let e = 0; e < source.length; e++) {
+        const s = source[e];
+        const t = target[e];
+        if (s === t) {
+            continue;
+        }
+        const ex = x[s] - x[t];
+        const ey = y[s] - y[t];
+        const length = Math.sqrt(ex * ex + ey * ey);
+        dx[s] -= ex * length;
+        dy[s] -= ey * length;
+        dx[t] += ex * length;
+        dy[t] += ey * length;
+    }
+}
+
+/**
+ * Runs `iterations` iterations of the layout, in place.
+ */
+function stepForce(state, iterations) {
+    const { n, x, y, dx, dy } = state;
+    for (let it = 0; it < iterations; it++) {
+        _repel(state);
+        _attract(state);
+        for (let i = 0; i < n; i++) {
+            const radius = (Math.sqrt(x[i] * x[i] + y[i] * y[i]) * GRAVITY) / n;
+            dx[i] -= x[i] * radius;
+            dy[i] -= y[i] * radius;
+            const length = Math.max(
+                Math.sqrt(dx[i] * dx[i] + dy[i] * dy[i]),
+                1e-9
+            );
+            const step = Math.min(length, state.temperature) / length;
+            x[i] += dx[i] * step;
+            y[i] += dy[i] * step;
+        }
+        state.temperature *= state.cooling;
+    }
+}
+
+/**
+ * Returns the positions, x and y interleaved.
+ */
+function forcePositions(state) {
+    const positions = new Float64Array(2 * state.n);
+    for (let i = 0; i < state.n; i++) {
+        positions[2 * i] = state.x[i];
+        positions[2 * i + 1] = state.y[i];
+    }
+    return positions;
+}
+
+export { createForce, stepForce, forcePositions };
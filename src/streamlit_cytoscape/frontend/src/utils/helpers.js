@@ -1,4 +1,6 @@
 import { Streamlit } from "streamlit-component-lib";
+import State from "./state";
+import { markSent, report } from "./telemetry";
 
 function debounce(func, wait) {
     let timeout;
@@ -17,12 +19,41 @@ function getCyInstance() {
     return cy;
 }
 
+// Labels hidden from the legend, by group ("nodes:PERSON" keys)
+function _hiddenLabels(hidden) {
+    const labels = { nodes: [], edges: [] };
+    hidden.forEach((key) => {
+        const i = key.indexOf(":");
+        labels[key.slice(0, i)].push(key.slice(i + 1));
+    });
+    return labels;
+}
+
 function setStreamlitValue({ action, data, timestamp } = {}) {
-    Streamlit.setComponentValue({
+    const value = {
         action: action,
         data: data,
         timestamp: timestamp,
-    });
+    };
+    // legend toggles and timeline moves don't rerun the app, their
+    // state is sent along with the next returned value
+    const hidden = State.getState("legend");
+    if (hidden) {
+        value.hidden_labels = _hiddenLabels(hidden);
+    }
+    const time = State.getState("timeline");
+    if (time !== null) {
+        value.timeline = time;
+    }
+    const groups = State.getState("groups");
+    if (groups) {
+        value.collapsed_groups = groups;
+    }
+    if (State.getState("telemetry")) {
+        value.telemetry = report(getCyInstance());
+    }
+    markSent();
+    Streamlit.setComponentValue(value);
 }
 
 const debouncedSetValue = debounce(setStreamlitValue, 100);
@@ -0,0 +1,71 @@
+import cytoscape from "cytoscape";
+import { record } from "./telemetry";
+
+// Layout extensions are split into their own chunks and registered
+// the first time a layout needs them
+const EXTENSIONS = {
+    fcose: () =>
+        import(/* webpackChunkName: "layout-fcose" */ "cytoscape-fcose"),
+    cola: () =>
+        import(/* webpackChunkName: "layout-cola" */ "cytoscape-cola"),
+    dagre: () =>
+        import(/* webpackChunkName: "layout-dagre" */ "cytoscape-dagre"),
+    refine: () => import(/* webpackChunkName: "layout-refine" */ "./refine"),
+};
+const loaded = {};
+let generation = 0;
+
+function loadLayout(name) {
+    if (!EXTENSIONS[name]) {
+        return Promise.resolve();
+    }
+    if (!loaded[name]) {
+        loaded[name] = EXTENSIONS[name]()
+            .then((module) => cytoscape.use(module.default))
+            .catch((err) => {
+                delete loaded[name];
+                throw err;
+            });
+    }
+    return loaded[name];
+}
+
+// Applies the size-aware defaults of a named layout (see
+// streamlit_cytoscape/layouts.py) on the number of nodes laid out
+function _sizeOptions(target, options) {
+    const { sizeDefaults, ...rest } = options;
+    const count = target.nodes().length;
+    (sizeDefaults ?? [])
+        .filter((tier) => count >= tier.minNodes)
+        .forEach((tier) => Object.assign(rest, tier.options));
+    return rest;
+}
+
+/**
+ * Runs a layout on the whole graph (cy) or on a collection once its
+ * extension is loaded. Whole graph layouts superseded while loading
+ * are skipped, so the last requested layout always wins.
+ */
+function runLayout(target, options) {
+    const isGraph = target.instanceString() === "core";
+    const current = isGraph ? ++generation : generation;
+    return loadLayout(options.name)
+        .then(() => {
+            if (isGraph && current !== generation) {
+                return null;
+            }
+            const layout = target.layout(_sizeOptions(target, options));
+            // until layoutstop, animations included
+            const start = performance.now();
+            layout.one("layoutstop", () => {
+                record("layout", performance.now() - start);
+            });
+            layout.run();
+            return layout;
+        })
+        .catch((err) => {
+            console.error(`Failed to load layout "${options.name}".`, err);
+        });
+}
+
+export { loadLayout, runLayout };
@@ -0,0 +1,235 @@
+// "refine" layout: nodes are placed right away by a cheap layout (or
+// kept at their given, cached or server computed positions), so the
+// graph is displayed and interactive at once. A force directed layout
+// then refines the positions in a worker, in a few rounds, and nodes
+// are animated toward the positions of each round. layoutready is
+// emitted once the first positions are set, layoutstop after the last
+// round.
+
+import { createForce, stepForce, forcePositions } from "./force";
+
+// Constants / Configurations
+const SCALE = 80; // pixels per unit of ideal edge length
+const DEFAULTS = {
+    initial: "auto",
+    rounds: 5,
+    iterations: 30,
+    animationDuration: 500,
+    fit: true,
+    padding: 20,
+};
+// start temperature when refining positions already set, relative to
+// the one of a random start
+const PRESET_TEMPERATURE = 0.2;
+
+// Worker shared by the layouts, undefined until needed and null if
+// unavailable (refinement then runs on the main thread)
+let worker;
+let active = null;
+let ids = 0;
+
+function _getWorker() {
+    if (worker === undefined) {
+        try {
+            worker = new Worker(
+                new URL("./refine.worker.js", import.meta.url)
+            );
+            worker.onmessage = ({ data }) => {
+                if (active?.id === data.id) {
+                    active._onRound(data.round, data.positions);
+                }
+            };
+        } catch {
+            worker = null;
+        }
+    }
+    return worker;
+}
+
+// Whether the nodes were placed before (nodes added without a
+// position all stand at the origin)
+function _positioned(nodes) {
+    const { x, y } = nodes.first().position();
+    return nodes.some((n) => n.position("x") !== x || n.position("y") !== y);
+}
+
+// Grid (default) or circle positions, one edge length apart
+function _initialPositions(nodes, initial) {
+    const n = nodes.length;
+    if (initial === "circle") {
+        const radius = (n * SCALE) / (2 * Math.PI);
+        return nodes.map((node, i) => ({
+            x: radius * Math.cos((2 * Math.PI * i) / n),
+            y: radius * Math.sin((2 * Math.PI * i) / n),
+        }));
+    }
+    const columns = Math.ceil(Math.sqrt(n));
+    return nodes.map((node, i) => ({
+        x: (i % columns) * SCALE,
+        y: Math.floor(i / columns) * SCALE,
+    }));
+}
+
+function RefineLayout(options) {
+    this.options = { ...DEFAULTS, ...options };
+}
+
+RefineLayout.prototype.run = function () {
+    const { cy, eles, initial, rounds, iterations } = this.options;
+    const nodes = eles.nodes();
+    this.id = ++ids;
+    this.nodes = nodes;
+    this.onLayout = this.onUser = null;
+    this.autoFit = this.options.fit;
+    this.running = true;
+    this.emit("layoutstart");
+
+    const preset =
+        initial === "preset" ||
+        (initial === "auto" && nodes.nonempty() && _positioned(nodes));
+    if (!preset) {
+        const positions = _initialPositions(nodes, initial);
+        cy.batch(() => nodes.forEach((n, i) => n.position(positions[i])));
+    }
+    this._fit();
+    this.emit("layoutready");
+    if (nodes.length < 2 || rounds < 1) {
+        this._finish();
+        return this;
+    }
+
+    // a layout run meanwhile (e.g. refresh) stops the refinement, and
+    // the viewport stops following the nodes once the user moves it
+    this.onLayout = (e) => e.layout !== this && this.stop();
+    this.onUser = () => (this.autoFit = false);
+    cy.on("layoutstart", this.onLayout);
+    cy.on("tapstart", this.onUser);
+    cy.container()?.addEventListener("wheel", this.onUser);
+
+    const index = new Map(nodes.map((n, i) => [n.id(), i]));
+    const edges = eles
+        .edges()
+        .filter((e) => index.has(e.source().id()))
+        .filter((e) => index.has(e.target().id()));
+    const source = Int32Array.from(edges, (e) => index.get(e.source().id()));
+    const target = Int32Array.from(edges, (e) => index.get(e.target().id()));
+    const positions = new Float64Array(2 * nodes.length);
+    nodes.forEach((n, i) => {
+        positions[2 * i] = n.position("x") / SCALE;
+        positions[2 * i + 1] = n.position("y") / SCALE;
+    });
+    const temperature = preset
+        ? (Math.sqrt(nodes.length) / 5) * PRESET_TEMPERATURE
+        : undefined;
+
+    active = this;
+    const w = _getWorker();
+    if (w) {
+        w.postMessage(
+            {
+                type: "start",
+                id: this.id,
+                positions,
+                source,
+                target,
+                rounds,
+                iterations,
+                temperature,
+            },
+            [positions.buffer, source.buffer, target.buffer]
+        );
+    } else {
+        const state = createForce(
+            positions,
+            source,
+            target,
+            rounds * iterations,
+            temperature
+        );
+        const round = (r) => {
+            if (active !== this) {
+                return;
+            }
+            stepForce(state, iterations);
+            this._onRound(r, forcePositions(state));
+            if (r + 1 < rounds) {
+                setTimeout(() => round(r + 1));
+            }
+        };
+        setTimeout(() => round(0));
+    }
+    return this;
+};
+
+// Animates the nodes toward the positions of a round
+RefineLayout.prototype._onRound = function (round, positions) {
+    const { cy, animationDuration, rounds } = this.options;
+    const last = round + 1 >= rounds;
+    const from = this.nodes.map((n) => ({ ...n.position() }));
+    const start = performance.now();
+    cancelAnimationFrame(this.frame);
+    const frame = (now) => {
+        const t = animationDuration
+            ? Math.min(1, (now - start) / animationDuration)
+            : 1;
+        const ease = t * (2 - t);
+        cy.batch(() => {
+            this.nodes.forEach((node, i) => {
+                if (node.grabbed() || node.removed()) {
+                    return;
+                }
+                const x = positions[2 * i] * SCALE;
+                const y = positions[2 * i + 1] * SCALE;
+                node.position({
+                    x: from[i].x + (x - from[i].x) * ease,
+                    y: from[i].y + (y - from[i].y) * ease,
+                });
+            });
+        });
+        this._fit();
+        if (t < 1) {
+            this.frame = requestAnimationFrame(frame);
+        } else if (last) {
+            this._finish();
+        }
+    };
+    this.frame = requestAnimationFrame(frame);
+};
+
+RefineLayout.prototype._fit = function () {
+    if (this.autoFit) {
+        this.options.cy.fit(this.nodes, this.options.padding);
+    }
+};
+
+RefineLayout.prototype._finish = function () {
+    if (!this.running) {
+        return;
+    }
+    this.running = false;
+    const { cy } = this.options;
+    if (active === this) {
+        active = null;
+        worker?.postMessage({ type: "stop", id: this.id });
+    }
+    if (this.onLayout) {
+        // without a handler, every listener of the event is removed
+        cy.removeListener("layoutstart", this.onLayout);
+        cy.removeListener("tapstart", this.onUser);
+        cy.container()?.removeEventListener("wheel", this.onUser);
+        this.onLayout = this.onUser = null;
+    }
+    this.emit("layoutstop");
+};
+
+RefineLayout.prototype.stop = function () {
+    cancelAnimationFrame(this.frame);
+    this._finish();
+    return this;
+};
+
+function registerRefine(cytoscape) {
+    cytoscape("layout", "refine", RefineLayout);
+}
+
+export default registerRefine;
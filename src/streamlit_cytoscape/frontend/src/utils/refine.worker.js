@@ -0,0 +1,36 @@
+// Refines a layout off the main thread, posting the positions after
+// each round. Rounds run as separate tasks, so a newer layout (or a
+// stop) received meanwhile cancels the remaining rounds.
+
+import { createForce, stepForce, forcePositions } from "./force";
+
+let current = null;
+
+function _round(id, state, round, rounds, iterations) {
+    if (current !== id) {
+        return;
+    }
+    stepForce(state, iterations);
+    const positions = forcePositions(state);
+    self.postMessage({ id, round, positions }, [positions.buffer]);
+    if (round + 1 < rounds) {
+        setTimeout(() => _round(id, state, round + 1, rounds, iterations));
+    }
+}
+
+self.onmessage = ({ data }) => {
+    if (data.type === "start") {
+        const { id, positions, source, target, rounds, iterations } = data;
+        current = id;
+        const state = createForce(
+            positions,
+            source,
+            target,
+            rounds * iterations,
+            data.temperature
+        );
+        setTimeout(() => _round(id, state, 0, rounds, iterations));
+    } else if (data.type === "stop" && data.id === current) {
+        current = null;
+    }
+};
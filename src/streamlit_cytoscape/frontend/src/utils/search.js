@@ -0,0 +1,183 @@
+// Search index over node data fields. Values are lowercased and
+// indexed by trigram (packed in a number, 16 bits per character), so
+// substring queries only verify the values sharing the query's rarest
+// trigram. Queries shorter than a trigram match word prefixes, found
+// by binary search over the sorted words.
+// Pure functions, run in the search worker (or inline as fallback).
+
+// Constants / Configurations
+const GRAM = 3;
+const MAX_RESULTS = 10;
+const WORD_SEPARATOR = /[^\p{L}\p{N}]+/u;
+// Match ranks, lower is better
+const RANK = {
+    exact: 0,
+    prefix: 1,
+    word: 2,
+    substring: 3,
+};
+
+function _normalize(value) {
+    return String(value).toLowerCase().trim();
+}
+
+function _gram(text, i) {
+    return (
+        text.charCodeAt(i) * 0x100000000 +
+        text.charCodeAt(i + 1) * 0x10000 +
+        text.charCodeAt(i + 2)
+    );
+}
+
+function _grams(text) {
+    const grams = new Set();
+    for (let i = 0; i + GRAM <= text.length; i++) {
+        grams.add(_gram(text, i));
+    }
+    return grams;
+}
+
+// docs: [[id, [value, ...]], ...] with one value per indexed field
+function buildIndex(docs) {
+    const ids = [];
+    const values = [];
+    const texts = [];
+    const owners = [];
+    const postings = new Map();
+    const words = [];
+    docs.forEach(([id, fields]) => {
+        const doc = ids.length;
+        ids.push(id);
+        fields.forEach((value) => {
+            if (value === null || value === undefined || value === "") {
+                return;
+            }
+            const entry = texts.length;
+            const text = _normalize(value);
+            values.push(String(value));
+            texts.push(text);
+            owners.push(doc);
+            for (let i = 0; i + GRAM <= text.length; i++) {
+                const g = _gram(text, i);
+                const entries = postings.get(g);
+                if (!entries) {
+                    postings.set(g, [entry]);
+                } else if (entries[entries.length - 1] !== entry) {
+                    entries.push(entry);
+                }
+            }
+            text.split(WORD_SEPARATOR).forEach((w) => {
+                if (w) {
+                    words.push([w, entry]);
+                }
+            });
+        });
+    });
+    words.sort((a, b) => (a[0] < b[0] ? -1 : a[0] > b[0] ? 1 : 0));
+    const grams = new Map();
+    postings.forEach((entries, g) => grams.set(g, Int32Array.from(entries)));
+    return {
+        ids,
+        values,
+        texts,
+        owners: Int32Array.from(owners),
+        grams,
+        words: words.map((w) => w[0]),
+        wordEntries: Int32Array.from(words, (w) => w[1]),
+    };
+}
+
+function _rank(text, query) {
+    if (text === query) {
+        return RANK.exact;
+    }
+    if (text.startsWith(query)) {
+        return RANK.prefix;
+    }
+    const i = text.indexOf(query);
+    if (i < 0) {
+        return null;
+    }
+    return WORD_SEPARATOR.test(text[i - 1]) ? RANK.word : RANK.substring;
+}
+
+function _candidates(index, query) {
+    if (query.length >= GRAM) {
+        // entries of the rarest trigram, none if a trigram is missing
+        let rarest = null;
+        for (const g of _grams(query)) {
+            const entries = index.grams.get(g);
+            if (!entries) {
+                return [];
+            }
+            if (!rarest || entries.length < rarest.length) {
+                rarest = entries;
+            }
+        }
+        return rarest;
+    }
+    // short query: entries having a word starting with it
+    const { words, wordEntries } = index;
+    let lo = 0;
+    let hi = words.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        words[mid] < query ? (lo = mid + 1) : (hi = mid);
+    }
+    const entries = [];
+    for (let i = lo; i < words.length && words[i].startsWith(query); i++) {
+        entries.push(wordEntries[i]);
+    }
+    return entries;
+}
+
+function _better(a, b) {
+    return a.rank < b.rank || (a.rank === b.rank && a.length < b.length);
+}
+
+// Returns the best matching nodes: [{id, value}], ranked by match
+// type, then by shorter value. Only the top results are kept while
+// scanning, so broad queries don't sort every match.
+function search(index, query) {
+    query = _normalize(query);
+    if (!index || !query) {
+        return [];
+    }
+    const top = [];
+    for (const entry of _candidates(index, query)) {
+        const text = index.texts[entry];
+        const last = top[MAX_RESULTS - 1];
+        if (last && last.rank === RANK.exact && text.length >= last.length) {
+            continue;
+        }
+        const rank = _rank(text, query);
+        if (rank === null) {
+            continue;
+        }
+        const match = { rank, length: text.length, entry };
+        if (last && !_better(match, last)) {
+            continue;
+        }
+        // a node matching on several fields keeps its best match
+        const doc = index.owners[entry];
+        const i = top.findIndex((m) => index.owners[m.entry] === doc);
+        if (i >= 0) {
+            if (!_better(match, top[i])) {
+                continue;
+            }
+            top.splice(i, 1);
+        }
+        let j = top.length;
+        while (j > 0 && _better(match, top[j - 1])) {
+            j--;
+        }
+        top.splice(j, 0, match);
+        top.length = Math.min(top.length, MAX_RESULTS);
+    }
+    return top.map((m) => ({
+        id: index.ids[index.owners[m.entry]],
+        value: index.values[m.entry],
+    }));
+}
+
+export { buildIndex, search };
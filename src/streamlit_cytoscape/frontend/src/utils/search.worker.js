@@ -0,0 +1,22 @@
+// Builds the search index off the main thread and answers queries.
+// Messages are handled in order, so queries always see the latest
+// index; results of an outdated index version are dropped by the
+// caller.
+
+import { buildIndex, search } from "./search";
+
+let index = null;
+let version = null;
+
+self.onmessage = ({ data }) => {
+    if (data.type === "build") {
+        index = buildIndex(data.docs);
+        version = data.version;
+    } else if (data.type === "query") {
+        self.postMessage({
+            version: version,
+            query: data.query,
+            results: search(index, data.query),
+        });
+    }
+};
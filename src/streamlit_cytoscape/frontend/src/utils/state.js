@@ -15,6 +15,11 @@ class StateManager {
             layout: null,
             lastExpanded: false,
             collapsedEdges: {},
+            legend: null,
+            query: null,
+            telemetry: null,
+            timeline: null,
+            groups: null,
         };
         this.observers = {
             selection: [],
@@ -22,6 +27,11 @@ class StateManager {
             layout: [],
             lastExpanded: [],
             collapsedEdges: [],
+            legend: [],
+            query: [],
+            telemetry: [],
+            timeline: [],
+            groups: [],
         };
         StateManager.instance = this;
         return this;
@@ -29,9 +39,11 @@ class StateManager {
     getState(name) {
         return this.state[name];
     }
-    updateState(name, value) {
+    updateState(name, value, silent = false) {
         this.state[name] = value;
-        this.notify(name);
+        if (!silent) {
+            this.notify(name);
+        }
     }
     subscribe(name, observer) {
         this.observers[name].push(observer);
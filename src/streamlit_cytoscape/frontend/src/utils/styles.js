@@ -41,6 +41,30 @@ const fixedEdgeStyles = {
     "curve-style": "bezier",
 };
 
+const fixedPlaceholderStyles = {
+    "background-opacity": 0,
+    "border-width": 0.8,
+    "border-style": "dashed",
+    "text-valign": "center",
+    "text-margin-y": 0,
+};
+
+const fixedGroupStyles = {
+    "shape": "round-rectangle",
+    "background-opacity": 0.15,
+    "border-width": 0.8,
+    "border-style": "dashed",
+    "font-size": 5,
+    "text-valign": "top",
+    "text-margin-y": -2,
+    "padding": 10,
+};
+
+const fixedFoldedStyles = {
+    "border-width": 2,
+    "border-style": "double",
+};
+
 const fixedNodeHStyles = {
     "outline-width": 0.6,
     "font-weight": "bold",
@@ -91,6 +115,54 @@ function _getDefault(theme) {
                 "text-background-color": COLOR[theme].line,
             },
         },
+        // "load more" placeholders of capped node expansions
+        {
+            selector: "node[label='_MORE']",
+            style: {
+                ...fixedPlaceholderStyles,
+                "label": "data(name)",
+                "color": COLOR[theme].font,
+                "border-color": COLOR[theme].line,
+            },
+        },
+        {
+            selector: "edge[label='_MORE']",
+            style: {
+                "line-style": "dashed",
+            },
+        },
+        // compound node groups, see groups.js
+        {
+            selector: "node[label='_GROUP']",
+            style: {
+                ...fixedGroupStyles,
+                "label": "data(name)",
+                "color": COLOR[theme].font,
+                "border-color": COLOR[theme].line,
+                "background-color": COLOR[theme].line,
+            },
+        },
+        {
+            selector: "node[label='_GROUP'][?_collapsed]",
+            style: {
+                "label": (node) =>
+                    `${node.data("name")} (${node.data("_groupSize")})`,
+                "width": "mapData(_groupSize, 1, 1000, 30, 90)",
+                "height": "mapData(_groupSize, 1, 1000, 30, 90)",
+                "background-opacity": 0.6,
+                "text-valign": "center",
+                "text-margin-y": 0,
+            },
+        },
+        {
+            selector: "edge[?_isGroupEdge]",
+            style: {
+                "label": "data(_edgeCount)",
+                "width": "mapData(_edgeCount, 1, 100, 1, 8)",
+                "line-style": "dashed",
+                "target-arrow-shape": "none",
+            },
+        },
     ];
 }
 
@@ -111,10 +183,40 @@ function _getMetaEdge() {
     ];
 }
 
+// Badges of the nodes with folded leaves (see folding.py): their
+// count appended to the caption of each custom node style. Applied
+// after custom styles, like meta-edges.
+function getFolded(theme, customStyle) {
+    const captions = customStyle
+        .filter(({ selector }) => selector.startsWith("node"))
+        .map(({ selector, style }) => ({
+            selector,
+            field: /^data\((.+)\)$/.exec(style.label || "")?.[1],
+        }))
+        .filter(({ field }) => field);
+    return [
+        {
+            selector: "node[_folded > 0]",
+            style: {
+                ...fixedFoldedStyles,
+                "label": (node) => `+${node.data("_folded")}`,
+                "border-color": COLOR[theme].font,
+            },
+        },
+        ...captions.map(({ selector, field }) => ({
+            selector: `${selector}[_folded > 0]`,
+            style: {
+                label: (node) =>
+                    `${node.data(field) ?? ""} +${node.data("_folded")}`,
+            },
+        })),
+    ];
+}
+
 function _getHighlight(theme) {
     return [
         {
-            selector: "node:selected, node.highlight",
+            selector: "node:selected, node.highlight, node.queried",
             style: {
                 ...fixedNodeHStyles,
                 "color": COLOR[theme].fontHighlight,
@@ -123,7 +225,7 @@ function _getHighlight(theme) {
             },
         },
         {
-            selector: "edge:selected, edge.highlight",
+            selector: "edge:selected, edge.highlight, edge.queried",
             style: {
                 ...fixedEdgeHStyles,
                 "color": COLOR[theme].fontHighlight,
@@ -132,6 +234,13 @@ function _getHighlight(theme) {
                 "text-background-color": COLOR[theme].highlight,
             },
         },
+        // elements out of a query result
+        {
+            selector: ".faded",
+            style: {
+                opacity: 0.2,
+            },
+        },
     ];
 }
 
@@ -148,4 +257,5 @@ const STYLES = {
     },
 };
 
+export { getFolded };
 export default STYLES;
@@ -0,0 +1,104 @@
+// Performance telemetry: phase timings (in milliseconds), element
+// counts and JS heap size, reported to Python when enabled. Timings
+// are aggregated per phase since the previous report, so a report is
+// a window of the frontend activity.
+
+// Phases measured on every rerun, which don't call for a report alone
+const PASSIVE = new Set(["args", "render", "roundTrip"]);
+
+let phases = {};
+let pending = false;
+let seq = 0;
+let sentAt = null;
+let painted = false;
+
+function record(phase, ms) {
+    if (!phases[phase]) {
+        phases[phase] = { count: 0, total: 0, max: 0, last: 0 };
+    }
+    const p = phases[phase];
+    p.count++;
+    p.total += ms;
+    p.max = Math.max(p.max, ms);
+    p.last = ms;
+    pending = pending || !PASSIVE.has(phase);
+}
+
+// Runs fn and records its duration under `phase`
+function time(phase, fn) {
+    const start = performance.now();
+    try {
+        return fn();
+    } finally {
+        record(phase, performance.now() - start);
+    }
+}
+
+// Time from the iframe navigation to the first painted graph frame
+function markFirstPaint(cy) {
+    cy.one("render", () => {
+        requestAnimationFrame(() => {
+            if (!painted) {
+                painted = true;
+                record("firstPaint", performance.now());
+            }
+        });
+    });
+}
+
+// Event round trip: from a value sent to the next render event
+function markSent() {
+    sentAt = performance.now();
+}
+
+function markReceived() {
+    if (sentAt !== null) {
+        record("roundTrip", performance.now() - sentAt);
+        sentAt = null;
+    }
+}
+
+// True when something other than reruns was measured since the last
+// report, so idle apps are not rerun by periodic reports
+function hasPending() {
+    return pending;
+}
+
+function _round(ms) {
+    return Math.round(ms * 100) / 100;
+}
+
+// Returns the report of the phases measured since the previous one
+function report(cy) {
+    const timings = {};
+    Object.entries(phases).forEach(([phase, p]) => {
+        timings[phase] = {
+            count: p.count,
+            total: _round(p.total),
+            max: _round(p.max),
+            last: _round(p.last),
+        };
+    });
+    phases = {};
+    pending = false;
+    return {
+        seq: ++seq,
+        timestamp: Date.now(),
+        phases: timings,
+        nodes: cy ? cy.nodes().length : 0,
+        edges: cy ? cy.edges().length : 0,
+        renderer: cy?.container().getAttribute("data-renderer") ?? null,
+        // non-standard, Chromium only
+        heap: performance.memory?.usedJSHeapSize ?? null,
+    };
+}
+
+export {
+    record,
+    time,
+    markFirstPaint,
+    markSent,
+    markReceived,
+    hasPending,
+    report,
+};
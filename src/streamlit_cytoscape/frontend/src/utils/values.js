@@ -0,0 +1,10 @@
+// Numeric or date attribute values, as numbers (dates as epoch
+// milliseconds). Missing or invalid values are NaN.
+function parseValue(value, dtype) {
+    if (value === null || value === undefined || value === "") {
+        return NaN;
+    }
+    return dtype === "date" ? Date.parse(value) : Number(value);
+}
+
+export { parseValue };
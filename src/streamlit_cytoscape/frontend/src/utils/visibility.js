@@ -0,0 +1,41 @@
+// Elements can be hidden for several reasons at once (e.g. a legend
+// toggle and a range filter). Each element keeps its reasons in its
+// scratch data and is displayed again once none is left, so features
+// hiding elements don't override each other.
+
+// Constants / Configurations
+const SCRATCH_KEY = "_hiddenBy";
+
+function _reasons(el) {
+    let reasons = el.scratch(SCRATCH_KEY);
+    if (!reasons) {
+        reasons = new Set();
+        el.scratch(SCRATCH_KEY, reasons);
+    }
+    return reasons;
+}
+
+// Adds (hidden = true) or removes the `reason` of the elements, and
+// only updates the display of those whose visibility changed.
+function setHidden(eles, reason, hidden) {
+    if (!eles.length) {
+        return;
+    }
+    const toHide = [];
+    const toShow = [];
+    eles.forEach((el) => {
+        const reasons = _reasons(el);
+        const before = reasons.size > 0;
+        hidden ? reasons.add(reason) : reasons.delete(reason);
+        if (before !== reasons.size > 0) {
+            (hidden ? toHide : toShow).push(el);
+        }
+    });
+    const cy = eles.cy();
+    cy.batch(() => {
+        cy.collection(toHide).style("display", "none");
+        cy.collection(toShow).style("display", "element");
+    });
+}
+
+export { setHidden };
@@ -21,6 +21,7 @@ var config = {
     ],
     output: {
         filename: "[name].[contenthash].bundle.js",
+        chunkFilename: "[name].[contenthash].chunk.js",
         path: path.resolve(__dirname, "build"),
         clean: true,
     },
@@ -43,6 +44,17 @@ var config = {
 };
 
 module.exports = (env, argv) => {
+    // `npm run analyze` writes a bundle size report and stats to build/
+    if (env.analyze) {
+        config.plugins.push(
+            new BundleAnalyzerPlugin({
+                analyzerMode: "static",
+                reportFilename: "bundle-report.html",
+                generateStatsFile: true,
+                openAnalyzer: false,
+            })
+        );
+    }
     if (argv.mode == "development") {
         config.devtool = "inline-source-map";
         config.devServer = {
@@ -57,12 +69,15 @@ module.exports = (env, argv) => {
                     vendor: {
                         test: /[\\/]node_modules[\\/]/,
                         name: "vendors",
-                        chunks: "all",
+                        chunks: "initial",
                     },
                 },
             },
         };
     } else if (argv.mode == "production") {
+        // Named groups only take modules of initial chunks, so layout
+        // extensions (and their dependencies) loaded with import() stay
+        // in their own lazily loaded chunks
         config.optimization = {
             runtimeChunk: "single",
             splitChunks: {
@@ -71,22 +86,22 @@ module.exports = (env, argv) => {
                     streamlit: {
                         test: /[\\/]node_modules[\\/]streamlit-component-lib/,
                         name: "streamlit-component-lib",
-                        chunks: "all",
+                        chunks: "initial",
                     },
                     cyotscape: {
-                        test: /[\\/]node_modules[\\/]cytoscape/,
+                        test: /[\\/]node_modules[\\/]cytoscape[\\/]/,
                         name: "cytoscape",
-                        chunks: "all",
+                        chunks: "initial",
                     },
                     apache_arrow: {
                         test: /[\\/]node_modules[\\/]apache-arrow/,
                         name: "apache-arrow",
-                        chunks: "all",
+                        chunks: "initial",
                     },
                     vendor: {
                         test: /[\\/]node_modules[\\/]/,
                         name: "vendors",
-                        chunks: "all",
+                        chunks: "initial",
                         enforce: true,
                     },
                 },
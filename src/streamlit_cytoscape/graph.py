@@ -0,0 +1,337 @@
+"""
+Compact adjacency index over graph elements for server side graph
+operations (e.g. handling node expansion) without scanning the
+elements list on every interaction.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+from streamlit_cytoscape.datasets import _fingerprint
+
+PLACEHOLDER_PREFIX = "_more:"
+PLACEHOLDER_LABEL = "_MORE"
+
+
+class GraphIndex:
+    def __init__(
+        self,
+        elements: Dict[str, Any],
+        weight: Optional[str] = None,
+    ) -> None:
+        """
+        Build a CSR (compressed sparse row) adjacency index of the
+        graph elements. Edges are indexed in both directions and edges
+        with a missing source or target node are ignored. Building
+        the index is linear in the number of elements, so it should
+        be built once and cached (e.g. with `st.cache_resource`).
+
+        Parameters
+        ----------
+        elements : dict
+            Graph elements data including nodes and edges, in the
+            same format accepted by `streamlit_cytoscape()`.
+        weight : Optional[str], default None
+            Name of the numeric edge attribute used as edge weight.
+            If not provided, or missing on an edge, a weight of 1 is
+            used.
+
+        Example
+        -------
+        >>> index = GraphIndex(elements, weight="amount")
+        >>> index.neighborhood(["n1"], depth=2, limit=20)
+        """
+        self.weight = weight
+        self.nodes: List[Dict[str, Any]] = list(elements.get("nodes", []))
+        self.ids: List[str] = [str(n["data"]["id"]) for n in self.nodes]
+        self.positions: Dict[str, int] = {
+            _id: i for i, _id in enumerate(self.ids)
+        }
+
+        self.edges: List[Dict[str, Any]] = []
+        source, target, weights = [], [], []
+        for e in elements.get("edges", []):
+            data = e["data"]
+            s = self.positions.get(str(data["source"]))
+            t = self.positions.get(str(data["target"]))
+            if s is None or t is None:
+                continue
+            self.edges.append(e)
+            source.append(s)
+            target.append(t)
+            w = data.get(weight) if weight else None
+            weights.append(1.0 if w is None else float(w))
+
+        n = len(self.nodes)
+        self.source = np.asarray(source, dtype=np.int64)
+        self.target = np.asarray(target, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+
+        edge_range = np.arange(len(self.edges), dtype=np.int64)
+        rows = np.concatenate([self.source, self.target])
+        cols = np.concatenate([self.target, self.source])
+        edge_index = np.concatenate([edge_range, edge_range])
+        order = np.argsort(rows, kind="stable")
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=self.indptr[1:])
+        self.indices = cols[order]
+        self.edge_index = edge_index[order]
+        self.degree = np.diff(self.indptr)
+        self.weighted_degree = np.bincount(
+            rows, weights=self.weights[edge_index], minlength=n
+        )
+        self._fingerprint: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node_id: Any) -> bool:
+        return str(node_id) in self.positions
+
+    def position(self, node_id: Any) -> int:
+        if str(node_id) not in self.positions:
+            raise KeyError(f"Node '{node_id}' not found in the graph")
+        return self.positions[str(node_id)]
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Content hash of the indexed elements and weight attribute,
+        computed once.
+        """
+        if self._fingerprint is None:
+            elements = {"nodes": self.nodes, "edges": self.edges}
+            self._fingerprint = f"{_fingerprint(elements)}:{self.weight}"
+        return self._fingerprint
+
+    def gather(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized gather of the CSR rows of the nodes at `positions`.
+        Returns the neighbors and, for each of them, the position of
+        the node it is adjacent to.
+        """
+        return gather(self.indptr, self.indices, positions)
+
+    def ranked_neighbors(
+        self,
+        i: int,
+        rank_by: Literal["degree", "weight"] = "degree",
+    ) -> np.ndarray:
+        """
+        Returns the distinct neighbors of the node at position `i`,
+        ordered by decreasing degree or connecting edge weight.
+        """
+        start, end = self.indptr[i], self.indptr[i + 1]
+        neighbors = self.indices[start:end]
+        if rank_by == "weight":
+            score = self.weights[self.edge_index[start:end]]
+        elif rank_by == "degree":
+            score = self.degree[neighbors]
+        else:
+            raise ValueError(f"Unknown rank_by '{rank_by}'")
+        neighbors = neighbors[np.lexsort((neighbors, -score))]
+        _, first = np.unique(neighbors, return_index=True)
+        neighbors = neighbors[np.sort(first)]
+        return neighbors[neighbors != i]
+
+    def subgraph(
+        self, node_ids: Optional[Iterable[Any]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Returns the elements of the given nodes and of the edges
+        between them. Unknown IDs are ignored. If `node_ids` is not
+        provided, all elements are returned.
+        """
+        if node_ids is None:
+            return {"nodes": list(self.nodes), "edges": list(self.edges)}
+        positions = sorted(
+            {self.positions[str(i)] for i in node_ids if str(i) in self}
+        )
+        seen = np.zeros(len(self), dtype=bool)
+        seen[positions] = True
+        return self._elements(positions, seen, [])
+
+    def neighborhood(
+        self,
+        node_ids: Iterable[Any],
+        depth: int = 1,
+        limit: Optional[int] = None,
+        rank_by: Literal["degree", "weight"] = "degree",
+        visible: Optional[Iterable[Any]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Breadth first k-hop neighborhood of the given nodes with a
+        per-node fan-out limit. Meant to handle the 'expand' node
+        action, whose data carries the `node_ids`, `depth` and
+        `limit` to pass on.
+
+        Parameters
+        ----------
+        node_ids : Iterable
+            IDs of the nodes to expand. IDs of "load more" placeholder
+            nodes load the next page of neighbors of their node.
+        depth : int, default 1
+            Number of hops to expand.
+        limit : Optional[int], default None
+            Maximum number of neighbors added per expanded node. Nodes
+            with more neighbors get the top ranked ones and a
+            "load more" placeholder node (labeled '_MORE') holding the
+            number of remaining neighbors in '_remaining'. If not
+            provided, all neighbors are added.
+        rank_by : Literal['degree', 'weight'], default 'degree'
+            Neighbors ranking, by decreasing node degree or by
+            decreasing weight of the connecting edge.
+        visible : Optional[Iterable], default None
+            IDs of the nodes already displayed. They are not expanded
+            or counted towards the limits, and edges between them and
+            the added nodes are included.
+
+        Returns
+        -------
+        dict
+            Elements of the expanded nodes, the added nodes and
+            placeholders, and the edges connecting them to each other
+            and to visible nodes.
+        """
+        seen = np.zeros(len(self), dtype=bool)
+        for _id in visible or []:
+            if str(_id) in self.positions:
+                seen[self.positions[str(_id)]] = True
+
+        frontier: List[int] = []
+        placeholders: List[Dict[str, Any]] = []
+        added: List[int] = []
+        for _id in node_ids:
+            _id = str(_id)
+            if _id.startswith(PLACEHOLDER_PREFIX):
+                # "load more": next page of the placeholder's node
+                node_id, offset = _id.split(":", 1)[1].rsplit(":", 1)
+                i = self.position(node_id)
+                seen[i] = True
+                page = self._page(i, int(offset), limit, rank_by, seen)
+                added.extend(page["nodes"])
+                placeholders.extend(page["placeholders"])
+                continue
+            i = self.position(_id)
+            seen[i] = True
+            frontier.append(i)
+        seeds = list(frontier)
+
+        for _ in range(depth):
+            next_frontier: List[int] = []
+            for i in frontier:
+                page = self._page(i, 0, limit, rank_by, seen)
+                next_frontier.extend(page["nodes"])
+                placeholders.extend(page["placeholders"])
+            added.extend(next_frontier)
+            frontier = next_frontier
+
+        return self._elements(seeds + added, seen, placeholders)
+
+    def _page(
+        self,
+        i: int,
+        offset: int,
+        limit: Optional[int],
+        rank_by: Literal["degree", "weight"],
+        seen: np.ndarray,
+    ) -> Dict[str, Any]:
+        """
+        Adds (marks as seen) the first `limit` not yet seen ranked
+        neighbors of `i` from `offset`, a position in the ranking.
+        Seen neighbors are skipped before the page is cut, so they
+        don't take its slots.
+        """
+        ranked = self.ranked_neighbors(i, rank_by)[offset:]
+        unseen = np.flatnonzero(~seen[ranked])
+        cut = len(unseen) if limit is None else limit
+        page = ranked[unseen[:cut]]
+        seen[page] = True
+        placeholders = []
+        if cut < len(unseen):
+            # the next page starts after the last node of this one
+            end = offset + int(unseen[cut - 1]) + 1
+            remaining = len(unseen) - cut
+            placeholders.append(self._placeholder(i, end, remaining))
+        return {"nodes": page.tolist(), "placeholders": placeholders}
+
+    def _placeholder(
+        self, i: int, offset: int, remaining: int
+    ) -> Dict[str, Any]:
+        node_id = self.ids[i]
+        placeholder_id = f"{PLACEHOLDER_PREFIX}{node_id}:{offset}"
+        return {
+            "data": {
+                "id": placeholder_id,
+                "label": PLACEHOLDER_LABEL,
+                "name": f"{remaining} more",
+                "_parent": node_id,
+                "_remaining": remaining,
+            },
+            "edge": {
+                "data": {
+                    "id": f"{placeholder_id}:edge",
+                    "source": node_id,
+                    "target": placeholder_id,
+                    "label": PLACEHOLDER_LABEL,
+                }
+            },
+        }
+
+    def _elements(
+        self,
+        positions: List[int],
+        seen: np.ndarray,
+        placeholders: List[Dict[str, Any]],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Materializes nodes and the edges between them and seen nodes.
+        """
+        rows = []
+        for i in positions:
+            row = slice(self.indptr[i], self.indptr[i + 1])
+            rows.append(self.edge_index[row][seen[self.indices[row]]])
+        edges: Set[int] = set()
+        if rows:
+            edges = set(np.unique(np.concatenate(rows)).tolist())
+        return {
+            "nodes": [self.nodes[i] for i in positions]
+            + [{"data": p["data"]} for p in placeholders],
+            "edges": [self.edges[e] for e in sorted(edges)]
+            + [p["edge"] for p in placeholders],
+        }
+
+
+def gather(
+    indptr: np.ndarray, indices: np.ndarray, positions: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the concatenated CSR rows at `positions` and the row each
+    value comes from, without a Python loop over the rows.
+    """
+    starts = indptr[positions]
+    counts = indptr[positions + 1] - starts
+    offsets = np.arange(counts.sum()) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    return indices[np.repeat(starts, counts) + offsets], np.repeat(
+        positions, counts
+    )
+
+
+def is_placeholder(node_id: Any) -> bool:
+    """
+    Returns True if `node_id` is the ID of a "load more" placeholder
+    node added by `GraphIndex.neighborhood`.
+    """
+    return str(node_id).startswith(PLACEHOLDER_PREFIX)
@@ -0,0 +1,465 @@
+"""
+Server side layouts shared by every session of the Streamlit server.
+Layouts of a `GraphIndex` are computed with NumPy in worker processes.
+Concurrent requests for the same graph fingerprint and layout options
+are coalesced into one job, and the node positions are kept in a size
+bounded LRU cache, optionally persisted to disk. The layout cost is
+then paid once per graph version instead of once per user.
+
+The positioned elements are displayed with the 'preset' layout:
+
+    >>> elements = layout_elements(index, "force")
+    >>> streamlit_cytoscape(elements, {"name": "preset"}, key="graph")
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from streamlit_cytoscape.datasets import _fingerprint
+from streamlit_cytoscape.graph import GraphIndex
+
+LAYOUTS = ("force", "circle")
+# pixels per unit of ideal edge length
+SCALE = 80.0
+# nodes above which the force layout repels from a sample of the nodes
+EXACT_LIMIT = 2000
+SAMPLE_SIZE = 500
+# pairwise distances computed at once by the force layout
+CHUNK = 2_000_000
+# entry point of the worker processes
+WORKER_MODULE = "streamlit_cytoscape.layout_worker"
+
+logger = logging.getLogger(__name__)
+
+_default_pool: Optional["LayoutPool"] = None
+_default_lock = threading.Lock()
+
+
+def circle_layout(n: int) -> np.ndarray:
+    """
+    Nodes evenly spaced on a circle.
+    """
+    angle = 2 * np.pi * np.arange(n) / max(n, 1)
+    radius = max(n, 1) / (2 * np.pi)
+    return np.column_stack([np.cos(angle), np.sin(angle)]) * radius
+
+
+def force_layout(
+    n: int,
+    source: np.ndarray,
+    target: np.ndarray,
+    iterations: int = 100,
+    gravity: float = 0.05,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Fruchterman-Reingold force directed layout, in units of the ideal
+    edge length. Repulsion is computed between all pairs of nodes in
+    chunks, or for graphs above `EXACT_LIMIT` nodes against a random
+    sample of the nodes per iteration, scaled to the graph size. A
+    weak gravity keeps disconnected components together.
+    """
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(-1, 1, (n, 2)) * np.sqrt(max(n, 1))
+    if n < 2:
+        return pos
+    loops = source == target
+    source, target = source[~loops], target[~loops]
+    temperature = np.sqrt(n) / 5
+    cooling = (0.01 / temperature) ** (1 / max(iterations, 1))
+    x, y = pos[:, 0].copy(), pos[:, 1].copy()
+    for _ in range(iterations):
+        if n > EXACT_LIMIT:
+            sample = rng.choice(n, SAMPLE_SIZE, replace=False)
+            ox, oy, factor = x[sample], y[sample], n / SAMPLE_SIZE
+        else:
+            ox, oy, factor = x, y, 1.0
+        dx, dy = np.empty(n), np.empty(n)
+        chunk = max(1, CHUNK // len(ox))
+        for start in range(0, n, chunk):
+            rows = slice(start, start + chunk)
+            cx = x[rows, None] - ox[None, :]
+            cy = y[rows, None] - oy[None, :]
+            inv = 1 / np.maximum(cx * cx + cy * cy, 1e-9)
+            dx[rows] = factor * (cx * inv).sum(1)
+            dy[rows] = factor * (cy * inv).sum(1)
+        ex, ey = x[source] - x[target], y[source] - y[target]
+        length = np.sqrt(ex * ex + ey * ey)
+        for d, e in ((dx, ex * length), (dy, ey * length)):
+            d -= np.bincount(source, weights=e, minlength=n)
+            d += np.bincount(target, weights=e, minlength=n)
+        radius = np.sqrt(x * x + y * y) * gravity / n
+        dx -= x * radius
+        dy -= y * radius
+        length = np.maximum(np.sqrt(dx * dx + dy * dy), 1e-9)
+        step = np.minimum(length, temperature) / length
+        x += dx * step
+        y += dy * step
+        temperature *= cooling
+    pos = np.column_stack([x, y])
+    return pos - pos.mean(0)
+
+
+def _run(
+    layout: str,
+    n: int,
+    source: np.ndarray,
+    target: np.ndarray,
+    options: Dict[str, Any],
+) -> np.ndarray:
+    """
+    Pool job: positions of the nodes in pixels.
+    """
+    if layout == "circle":
+        pos = circle_layout(n)
+    else:
+        pos = force_layout(n, source, target, **options)
+    return pos * SCALE
+
+
+class _Worker:
+    def __init__(self) -> None:
+        """
+        A worker process, started from `WORKER_MODULE` so it never
+        imports the running Streamlit script, running the jobs of one
+        pool thread.
+        """
+        # the package directory of this process, e.g. in development
+        path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [path, *filter(None, [env.get("PYTHONPATH")])]
+        )
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", WORKER_MODULE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+        )
+
+    def run(self, job: Tuple[Any, ...]) -> np.ndarray:
+        """
+        Runs `_run(*job)` in the worker process. Raises
+        `BrokenProcessPool` if the process terminated.
+        """
+        stdin, stdout = self.process.stdin, self.process.stdout
+        assert stdin is not None and stdout is not None
+        try:
+            pickle.dump(job, stdin)
+            stdin.flush()
+            ok, result = pickle.load(stdout)
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            raise BrokenProcessPool(
+                "A layout worker terminated abruptly"
+            ) from e
+        if not ok:
+            raise result
+        return result
+
+    def stop(self) -> None:
+        # workers exit once their jobs pipe is closed
+        try:
+            if self.process.stdin is not None:
+                self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class LayoutPool:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_bytes: int = 64 * 2**20,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Pool of worker processes computing node positions, shared by
+        the sessions of the server. Use `get_layout_pool()` for the
+        default pool of the process, or create one with
+        `st.cache_resource`.
+
+        Parameters
+        ----------
+        max_workers : Optional[int], default None
+            Number of worker processes, started when first needed.
+            Defaults to the number of CPUs. A worker that terminated
+            (e.g. killed) is restarted, and its job retried once.
+        max_bytes : int, default 64 MiB
+            Size of the positions kept in memory. Once exceeded, the
+            least recently used layouts are evicted first.
+        cache_dir : Optional[str], default None
+            Directory where computed positions are persisted, and
+            read from when not in memory (e.g. after a restart).
+
+        Example
+        -------
+        >>> @st.cache_resource
+        ... def layout_pool():
+        ...     return LayoutPool(max_workers=2, cache_dir=".layouts")
+        >>> elements = layout_pool().elements(index, "force")
+        """
+        self.max_workers = max_workers
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._size = 0
+        self._jobs: Dict[str, "Future[np.ndarray]"] = {}
+        # each thread of the executor runs its jobs in its worker
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
+        self._workers: Set[_Worker] = set()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        graph: Union[GraphIndex, Dict[str, Any]],
+        layout: str = "force",
+        **options: Any,
+    ) -> "Future[np.ndarray]":
+        """
+        Returns a future of the node positions (in pixels, in the
+        order of the index nodes), resolved right away when cached.
+        Requests for a graph and layout options already being
+        computed share its job.
+
+        Parameters
+        ----------
+        graph : Union[GraphIndex, dict]
+            A `GraphIndex`, or graph elements in the same format
+            accepted by `streamlit_cytoscape()`.
+        layout : str, default 'force'
+            'force' (Fruchterman-Reingold) or 'circle'.
+        **options
+            Options of the layout: `iterations`, `gravity` and
+            `seed` for 'force'.
+        """
+        if layout not in LAYOUTS:
+            raise ValueError(f"layout must be one of {LAYOUTS}")
+        key = _cache_key(graph, layout, options)
+        with self._lock:
+            positions = self._get(key)
+            if positions is not None:
+                self.hits += 1
+                return _resolved(positions)
+            if key in self._jobs:
+                self.coalesced += 1
+                return self._jobs[key]
+            self.misses += 1
+            index = (
+                graph if isinstance(graph, GraphIndex) else GraphIndex(graph)
+            )
+            job = self._executor_().submit(
+                self._call,
+                (layout, len(index), index.source, index.target, options),
+            )
+            # resolved once cached and persisted
+            future: "Future[np.ndarray]" = Future()
+            self._jobs[key] = future
+        job.add_done_callback(lambda job: self._done(key, job, future))
+        return future
+
+    def positions(
+        self,
+        graph: Union[GraphIndex, Dict[str, Any]],
+        layout: str = "force",
+        timeout: Optional[float] = None,
+        **options: Any,
+    ) -> np.ndarray:
+        """
+        Waits for the node positions, see `submit()`.
+        """
+        return self.submit(graph, layout, **options).result(timeout)
+
+    def elements(
+        self,
+        graph: Union[GraphIndex, Dict[str, Any]],
+        layout: str = "force",
+        timeout: Optional[float] = None,
+        **options: Any,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Waits for the node positions and returns the elements with a
+        'position', to display with the 'preset' layout.
+        """
+        if not isinstance(graph, GraphIndex):
+            graph = GraphIndex(graph)
+        positions = self.positions(graph, layout, timeout, **options)
+        nodes = [
+            {**node, "position": {"x": x, "y": y}}
+            for node, (x, y) in zip(graph.nodes, positions.tolist())
+        ]
+        return {"nodes": nodes, "edges": graph.edges}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            workers, self._workers = self._workers, set()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for worker in workers:
+            worker.stop()
+
+    def _executor_(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.max_workers or os.cpu_count() or 1,
+                thread_name_prefix="layout_pool",
+            )
+        return self._executor
+
+    def _call(self, job: Tuple[Any, ...]) -> np.ndarray:
+        """
+        Runs a job in the worker of the calling executor thread. A
+        worker that terminated is replaced, and the job retried once.
+        """
+        try:
+            return self._worker().run(job)
+        except BrokenProcessPool:
+            self._drop_worker()
+            with self._lock:
+                if self._executor is None:
+                    # shut down
+                    raise
+            logger.warning("Layout worker terminated, restarting it")
+            return self._worker().run(job)
+
+    def _worker(self) -> _Worker:
+        worker = getattr(self._local, "worker", None)
+        if worker is None:
+            worker = self._local.worker = _Worker()
+            with self._lock:
+                self._workers.add(worker)
+        return worker
+
+    def _drop_worker(self) -> None:
+        worker, self._local.worker = self._local.worker, None
+        with self._lock:
+            self._workers.discard(worker)
+        worker.stop()
+
+    def _done(
+        self,
+        key: str,
+        job: "Future[np.ndarray]",
+        future: "Future[np.ndarray]",
+    ) -> None:
+        error = job.exception() if not job.cancelled() else None
+        if job.cancelled() or error is not None:
+            with self._lock:
+                self._jobs.pop(key, None)
+            future.set_exception(error or CancelledError())
+            return
+        positions = job.result()
+        self._persist(key, positions)
+        with self._lock:
+            self._jobs.pop(key, None)
+            self._put(key, positions)
+        future.set_result(positions)
+
+    def _get(self, key: str) -> Optional[np.ndarray]:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        positions = self._load(key)
+        if positions is not None:
+            self._put(key, positions)
+        return positions
+
+    def _put(self, key: str, positions: np.ndarray) -> None:
+        positions.setflags(write=False)
+        self._cache[key] = positions
+        self._size += positions.nbytes
+        while self._size > self.max_bytes and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._size -= evicted.nbytes
+
+    def _path(self, key: str) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.npy")
+
+    def _load(self, key: str) -> Optional[np.ndarray]:
+        path = self._path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            return np.load(path)
+        except (OSError, ValueError):
+            return None
+
+    def _persist(self, key: str, positions: np.ndarray) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        # written under another name first: readers never see a
+        # partial file
+        partial = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(partial, "wb") as f:
+                np.save(f, positions)
+            os.replace(partial, path)
+        except OSError as e:
+            logger.warning(f"Layout not persisted to {path}: {e}")
+
+
+def _cache_key(
+    graph: Union[GraphIndex, Dict[str, Any]],
+    layout: str,
+    options: Dict[str, Any],
+) -> str:
+    if isinstance(graph, GraphIndex):
+        fingerprint = graph.fingerprint
+    else:
+        fingerprint = f"{_fingerprint(graph)}:None"
+    return f"{fingerprint}:{layout}:{json.dumps(options, sort_keys=True)}"
+
+
+def _resolved(positions: np.ndarray) -> "Future[np.ndarray]":
+    future: "Future[np.ndarray]" = Future()
+    future.set_result(positions)
+    return future
+
+
+def get_layout_pool() -> LayoutPool:
+    """
+    Returns the default layout pool of the server process.
+    """
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = LayoutPool()
+        return _default_pool
+
+
+def layout_elements(
+    graph: Union[GraphIndex, Dict[str, Any]],
+    layout: str = "force",
+    timeout: Optional[float] = None,
+    **options: Any,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Returns the elements with the positions computed by the default
+    layout pool, see `LayoutPool.elements()`.
+    """
+    return get_layout_pool().elements(graph, layout, timeout, **options)
@@ -0,0 +1,39 @@
+"""
+Entry point of the layout pool worker processes, started as
+`python -m streamlit_cytoscape.layout_worker`. Streamlit runs the app
+script as the __main__ module, which workers started by
+multiprocessing import on start (running the script again), so
+workers are started from this module instead. Jobs are read from
+stdin and their results written to stdout, pickled, one at a time.
+"""
+
+import pickle
+import sys
+from typing import Any, Tuple
+
+
+def main() -> None:
+    # the results stream is kept apart from what imports may print
+    results = sys.stdout.buffer
+    sys.stdout = sys.stderr
+    jobs = sys.stdin.buffer
+
+    from streamlit_cytoscape.layout_pool import _run
+
+    while True:
+        try:
+            job = pickle.load(jobs)
+        except EOFError:
+            # the pool closed the pipe
+            return
+        result: Tuple[bool, Any]
+        try:
+            result = (True, _run(*job))
+        except Exception as e:
+            result = (False, e)
+        pickle.dump(result, results)
+        results.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 For full options see https://js.cytoscape.org/#layouts
 """
 
+from typing import Any, Dict, List
+
 DEFAULT_ATTRS = {
     "padding": 20,
     "animationDuration": 500,
@@ -53,4 +55,105 @@ LAYOUTS = {
         **DEFAULT_ATTRS,
         "name": "dagre",
     },
+    "refine": {
+        **DEFAULT_ATTRS,
+        "name": "refine",
+        "initial": "auto",
+        "rounds": 5,
+        "iterations": 30,
+    },
+}
+
+# Number of nodes from which the defaults of larger graphs apply to the
+# named layouts. Below each threshold, the defaults of the smaller size
+# keep the layouts within the time budget of tests/test_layouts.py.
+SIZE_THRESHOLDS = {
+    "medium": 300,
+    "large": 1000,
+}
+
+# Defaults overriding those of LAYOUTS from each size on, cumulatively:
+# no animation and no label-aware node sizes, fewer iterations, faster
+# cooling and draft quality for the force directed layouts
+SIZE_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "medium": {
+        "nodeDimensionsIncludeLabels": False,
+    },
+    "large": {
+        "animate": False,
+    },
+}
+LAYOUT_SIZE_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "cose": {
+        "medium": {"numIter": 50, "coolingFactor": 0.87},
+        "large": {"numIter": 30, "coolingFactor": 0.8},
+    },
+    "fcose": {
+        "medium": {"numIter": 1000, "uniformNodeDimensions": True},
+        "large": {"quality": "draft", "numIter": 500, "packComponents": False},
+    },
+    "cola": {
+        "medium": {"maxSimulationTime": 2000},
+        "large": {"maxSimulationTime": 1000, "avoidOverlap": False},
+    },
+    "grid": {
+        "large": {"avoidOverlap": False},
+    },
+    "concentric": {
+        "large": {"avoidOverlap": False},
+    },
+    "breadthfirst": {
+        "large": {"avoidOverlap": False},
+    },
+    "refine": {
+        "large": {"rounds": 3, "iterations": 20},
+    },
 }
+
+
+def _size_tiers(name: str) -> List[Dict[str, Any]]:
+    """
+    Size-aware defaults of a named layout, sent to the frontend which
+    applies them on the number of nodes laid out: the options of each
+    tier whose `minNodes` is reached, in order.
+    """
+    tiers = []
+    for size, threshold in sorted(
+        SIZE_THRESHOLDS.items(), key=lambda item: item[1]
+    ):
+        if threshold <= 0:
+            raise ValueError(f"SIZE_THRESHOLDS['{size}'] must be positive")
+        options = {
+            **SIZE_DEFAULTS.get(size, {}),
+            **LAYOUT_SIZE_DEFAULTS.get(name, {}).get(size, {}),
+        }
+        if options:
+            tiers.append({"minNodes": threshold, "options": options})
+    return tiers
+
+
+def adaptive_layout(name: str, n_nodes: int) -> Dict[str, Any]:
+    """
+    Returns the options of a named layout for a graph of `n_nodes`
+    nodes, as applied by `streamlit_cytoscape()` when the layout is
+    given by name.
+
+    Parameters
+    ----------
+    name : str
+        Name of the layout, a key of `LAYOUTS`.
+    n_nodes : int
+        Number of nodes laid out.
+
+    Example
+    -------
+    >>> adaptive_layout("cose", 5000)["numIter"]
+    30
+    """
+    if name not in LAYOUTS:
+        raise ValueError(f"Unknown layout '{name}'")
+    options = dict(LAYOUTS[name])
+    for tier in _size_tiers(name):
+        if n_nodes >= tier["minNodes"]:
+            options.update(tier["options"])
+    return options
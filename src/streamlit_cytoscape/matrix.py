@@ -0,0 +1,170 @@
+"""
+Row and column orderings of the adjacency matrix view. With
+`view="matrix"`, the component draws the elements as an adjacency
+matrix on a canvas, in an order computed here with NumPy over the CSR
+arrays of a `GraphIndex`: by label, by degree, or by cluster so dense
+clusters form blocks along the diagonal.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from streamlit_cytoscape.caching import LRUCache
+from streamlit_cytoscape.datasets import _fingerprint
+from streamlit_cytoscape.graph import GraphIndex
+
+# graph elements, or a function returning them
+Graph = Union[GraphIndex, Dict[str, Any], Callable[[], Dict[str, Any]]]
+# ordered node IDs, and their cluster
+Ordering = Tuple[List[str], Optional[List[int]]]
+
+ORDERS = ("label", "degree", "cluster")
+# computed orderings kept per process, by graph version and order
+CACHE_SIZE = 16
+_cache: "LRUCache[Ordering]" = LRUCache(CACHE_SIZE)
+
+
+def label_order(index: GraphIndex) -> np.ndarray:
+    """
+    Node positions sorted by label, then by ID.
+    """
+    labels = np.array([str(n["data"].get("label", "")) for n in index.nodes])
+    return np.lexsort((np.array(index.ids), labels))
+
+
+def degree_order(index: GraphIndex) -> np.ndarray:
+    """
+    Node positions by decreasing degree, ties in the order of the
+    nodes.
+    """
+    return np.lexsort((np.arange(len(index)), -index.degree))
+
+
+def clusters(
+    index: GraphIndex, iterations: int = 20, seed: int = 0
+) -> np.ndarray:
+    """
+    Cluster of each node, by label propagation: every node takes the
+    most frequent cluster among itself and its neighbors, ties broken
+    at random, until no cluster changes. Clusters are numbered by
+    decreasing size.
+    """
+    n = len(index)
+    rng = np.random.default_rng(seed)
+    labels = np.arange(n, dtype=np.int64)
+    nodes = np.concatenate(
+        [np.repeat(np.arange(n), index.degree), np.arange(n)]
+    )
+    neighbors = np.concatenate([index.indices, np.arange(n)])
+    for _ in range(iterations):
+        pairs, counts = np.unique(
+            nodes * n + labels[neighbors], return_counts=True
+        )
+        node, label = pairs // n, pairs % n
+        # the last pair of each node has the highest score
+        score = counts + rng.random(len(counts)) * 0.5
+        order = np.lexsort((score, node))
+        last = order[np.r_[node[order][1:] != node[order][:-1], True]]
+        updated = labels.copy()
+        updated[node[last]] = label[last]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    _, inverse, sizes = np.unique(
+        labels, return_inverse=True, return_counts=True
+    )
+    rank = np.empty(len(sizes), dtype=np.int64)
+    rank[np.lexsort((np.arange(len(sizes)), -sizes))] = np.arange(len(sizes))
+    return rank[inverse]
+
+
+def cluster_order(index: GraphIndex) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Node positions grouped by cluster (largest first), by decreasing
+    degree within a cluster. Returns the positions and the cluster of
+    each of them.
+    """
+    cluster = clusters(index)
+    order = np.lexsort((np.arange(len(index)), -index.degree, cluster))
+    return order, cluster[order]
+
+
+def matrix_order(
+    graph: Union[GraphIndex, Dict[str, Any]],
+    order: str = "cluster",
+) -> List[str]:
+    """
+    Returns the node IDs in the order of the rows (and columns) of
+    the adjacency matrix view.
+
+    Parameters
+    ----------
+    graph : Union[GraphIndex, dict]
+        A `GraphIndex`, or graph elements in the same format accepted
+        by `streamlit_cytoscape()`.
+    order : str, default 'cluster'
+        'label', 'degree' (decreasing) or 'cluster' (label
+        propagation clusters, largest first, then by degree).
+
+    Example
+    -------
+    >>> matrix_order(elements, "degree")[:3]
+    ['n12', 'n3', 'n7']
+    """
+    if isinstance(graph, GraphIndex):
+        key = graph.fingerprint
+    else:
+        key = _fingerprint(graph)
+    # a copy, the cached ordering being shared by the sessions
+    return list(_ordering(graph, order, key)[0])
+
+
+def _ordering(graph: Graph, order: str, key: str) -> Ordering:
+    """
+    Ordered node IDs, and their cluster for the 'cluster' order,
+    cached by `key` (a version of the graph) and order. `graph` can
+    be a function returning the elements, only called when needed.
+    """
+    if order not in ORDERS:
+        raise ValueError(f"order must be one of {ORDERS}")
+    cached = _cache.get((key, order))
+    if cached is not None:
+        return cached
+    if callable(graph):
+        graph = graph()
+    index = graph if isinstance(graph, GraphIndex) else GraphIndex(graph)
+    groups = None
+    if order == "label":
+        positions = label_order(index)
+    elif order == "degree":
+        positions = degree_order(index)
+    else:
+        positions, cluster = cluster_order(index)
+        groups = cluster.tolist()
+    ids = [index.ids[i] for i in positions.tolist()]
+    _cache.put((key, order), (ids, groups))
+    return ids, groups
+
+
+def _matrix_args(
+    graph: Graph,
+    order: str,
+    key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Returns the matrix view arguments: the order name, the ordered
+    node IDs and, for the 'cluster' order, their cluster. `key`
+    identifies the version of the graph (e.g. a dataset handle),
+    saving the content hash of the elements.
+    """
+    if key is None:
+        if callable(graph):
+            graph = graph()
+        key = (
+            graph.fingerprint
+            if isinstance(graph, GraphIndex)
+            else _fingerprint(graph)
+        )
+    ids, groups = _ordering(graph, order, key)
+    return {"order": order, "ids": ids, "groups": groups}
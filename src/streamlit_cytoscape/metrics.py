@@ -0,0 +1,239 @@
+"""
+Vectorized node metrics over a `GraphIndex`, for data-driven styling.
+Metrics are computed with NumPy on the CSR arrays of the index, cached
+by graph fingerprint, and written to the nodes data so `NodeStyle`
+sizes and colors can be bound to them with `mapData`.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from streamlit_cytoscape.caching import LRUCache
+from streamlit_cytoscape.datasets import _fingerprint
+from streamlit_cytoscape.graph import GraphIndex, gather
+
+METRICS = ("degree", "weighted_degree", "pagerank", "core")
+# computed metrics kept per process, by fingerprint and options
+CACHE_SIZE = 16
+_cache: "LRUCache[NodeMetrics]" = LRUCache(CACHE_SIZE)
+
+
+class NodeMetrics:
+    def __init__(self, index: GraphIndex, values: Dict[str, np.ndarray]):
+        """
+        Node metrics of a graph, in the order of the index nodes. Use
+        `compute_metrics()` to get them.
+        """
+        self.index = index
+        self.values = values
+
+    def __getitem__(self, metric: str) -> np.ndarray:
+        return self.values[metric]
+
+    def elements(self, prefix: str = "_") -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Returns the elements with each metric added to the nodes data,
+        under the metric name with `prefix` (e.g. '_pagerank'). Node
+        dicts are shallow copies, the index elements are unchanged.
+        """
+        columns = {
+            prefix + name: values.tolist()
+            for name, values in self.values.items()
+        }
+        nodes = []
+        for i, node in enumerate(self.index.nodes):
+            data = dict(node["data"])
+            for key, values in columns.items():
+                data[key] = values[i]
+            nodes.append({**node, "data": data})
+        return {"nodes": nodes, "edges": list(self.index.edges)}
+
+    def map_data(
+        self,
+        metric: str,
+        low: Union[int, float, str],
+        high: Union[int, float, str],
+        prefix: str = "_",
+    ) -> str:
+        """
+        Returns a cytoscape `mapData` expression mapping the metric
+        range of the graph to [low, high], for use as a `NodeStyle`
+        size or color.
+
+        Example
+        -------
+        >>> metrics = compute_metrics(index, ["pagerank"])
+        >>> NodeStyle(
+        ...     "PERSON",
+        ...     color=metrics.map_data("pagerank", "#ccc", "#000"),
+        ...     size=metrics.map_data("pagerank", 15, 45),
+        ... )
+        """
+        values = self.values[metric]
+        lo = float(values.min()) if len(values) else 0.0
+        hi = float(values.max()) if len(values) else 0.0
+        if hi <= lo:
+            # cytoscape requires a non-empty data range
+            hi = lo + 1
+        return f"mapData({prefix}{metric}, {lo}, {hi}, {low}, {high})"
+
+
+def degree(index: GraphIndex) -> np.ndarray:
+    """
+    Number of edges of each node (parallel edges included).
+    """
+    return index.degree
+
+
+def weighted_degree(index: GraphIndex) -> np.ndarray:
+    """
+    Sum of the index weights of the edges of each node.
+    """
+    return index.weighted_degree
+
+
+def pagerank(
+    index: GraphIndex,
+    damping: float = 0.85,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+    directed: bool = True,
+) -> np.ndarray:
+    """
+    PageRank of each node by power iteration, with edge weights from
+    the index. Each iteration is a weighted bincount over the edges.
+    Dangling nodes spread their rank uniformly.
+    """
+    n = len(index)
+    if n == 0:
+        return np.zeros(0)
+    source, target, weights = index.source, index.target, index.weights
+    if not directed:
+        source, target = (
+            np.concatenate([source, target]),
+            np.concatenate([target, source]),
+        )
+        weights = np.concatenate([weights, weights])
+    out_weight = np.bincount(source, weights=weights, minlength=n)
+    dangling = out_weight == 0
+    share = np.divide(
+        weights,
+        out_weight[source],
+        out=np.zeros_like(weights),
+        where=out_weight[source] > 0,
+    )
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        spread = np.bincount(target, weights=rank[source] * share, minlength=n)
+        leaked = rank[dangling].sum() / n
+        updated = (1 - damping) / n + damping * (spread + leaked)
+        done = np.abs(updated - rank).sum() < n * tol
+        rank = updated
+        if done:
+            break
+    return rank
+
+
+def core_number(index: GraphIndex) -> np.ndarray:
+    """
+    k-core number of each node, ignoring edge directions, parallel
+    edges and self loops. Nodes are peeled by increasing degree, each
+    round removing every node at or below the current core level at
+    once.
+    """
+    n = len(index)
+    pairs = np.stack(
+        [
+            np.minimum(index.source, index.target),
+            np.maximum(index.source, index.target),
+        ]
+    )
+    pairs = np.unique(pairs[:, pairs[0] != pairs[1]], axis=1)
+    # CSR adjacency of the simple graph
+    rows = np.concatenate([pairs[0], pairs[1]])
+    cols = np.concatenate([pairs[1], pairs[0]])
+    indices = cols[np.argsort(rows, kind="stable")]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+    deg = np.diff(indptr)
+    core = np.zeros(n, dtype=np.int64)
+    alive = np.ones(n, dtype=bool)
+    k = 0
+    while alive.any():
+        k = max(k, int(deg[alive].min()))
+        peel = np.flatnonzero(alive & (deg <= k))
+        while len(peel):
+            core[peel] = k
+            alive[peel] = False
+            neighbors, _ = gather(indptr, indices, peel)
+            deg -= np.bincount(neighbors, minlength=n)
+            peel = np.flatnonzero(alive & (deg <= k))
+    return core
+
+
+def compute_metrics(
+    graph: Union[GraphIndex, Dict[str, Any]],
+    metrics: Sequence[str] = METRICS,
+    weight: Optional[str] = None,
+    damping: float = 0.85,
+) -> NodeMetrics:
+    """
+    Compute node metrics of a graph in one vectorized pass. Results
+    are cached by graph fingerprint (content hash), so the same graph
+    is only analyzed once per server process.
+
+    Parameters
+    ----------
+    graph : Union[GraphIndex, dict]
+        A `GraphIndex`, or graph elements in the same format accepted
+        by `streamlit_cytoscape()`.
+    metrics : Sequence[str], default METRICS
+        Metrics to compute, among 'degree', 'weighted_degree',
+        'pagerank' (directed) and 'core' (k-core number).
+    weight : Optional[str], default None
+        Name of the numeric edge attribute used as edge weight, when
+        `graph` is a dict. A `GraphIndex` uses its own weights.
+    damping : float, default 0.85
+        PageRank damping factor.
+
+    Returns
+    -------
+    NodeMetrics
+        The metrics by name, in the order of the nodes. Use
+        `.elements()` to get the elements with the metrics in their
+        data, and `.map_data()` to bind styles to them.
+
+    Example
+    -------
+    >>> metrics = compute_metrics(elements, ["degree", "pagerank"])
+    >>> node_styles = [
+    ...     NodeStyle("PERSON", size=metrics.map_data("degree", 15, 45))
+    ... ]
+    >>> streamlit_cytoscape(metrics.elements(), node_styles=node_styles)
+    """
+    unknown = set(metrics) - set(METRICS)
+    if unknown:
+        raise ValueError(f"Unknown metrics {sorted(unknown)}")
+    if isinstance(graph, GraphIndex):
+        index = graph
+        fingerprint = index.fingerprint
+    else:
+        fingerprint = f"{_fingerprint(graph)}:{weight}"
+    key = (fingerprint, tuple(metrics), damping)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    if not isinstance(graph, GraphIndex):
+        index = GraphIndex(graph, weight=weight)
+    functions = {
+        "degree": lambda: degree(index),
+        "weighted_degree": lambda: weighted_degree(index),
+        "pagerank": lambda: pagerank(index, damping=damping),
+        "core": lambda: core_number(index),
+    }
+    result = NodeMetrics(index, {m: functions[m]() for m in metrics})
+    _cache.put(key, result)
+    return result
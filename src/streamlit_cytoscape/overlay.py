@@ -0,0 +1,231 @@
+"""
+Per-session views of a shared base graph. The base graph (a
+`GraphIndex`) is loaded once per server process, e.g. with
+`st.cache_resource`, and never modified. Each session only keeps an
+overlay of the IDs it removed, added or revealed by expansion.
+"""
+
+import uuid
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set
+
+import numpy as np
+
+from streamlit_cytoscape.folding import _folding, _with_counts
+from streamlit_cytoscape.graph import GraphIndex, is_placeholder
+
+FOLDS = ("leaves", "chains")
+
+
+class GraphOverlay:
+    def __init__(
+        self,
+        base: GraphIndex,
+        node_ids: Optional[Iterable[Any]] = None,
+        fold: Optional[Literal["leaves", "chains"]] = None,
+    ) -> None:
+        """
+        Define a copy-on-write view of a shared base graph. The
+        overlay can be passed to `streamlit_cytoscape()` in place of
+        the elements, and its memory grows with the session's edits
+        rather than with the size of the base graph.
+
+        Parameters
+        ----------
+        base : GraphIndex
+            The shared, immutable base graph.
+        node_ids : Optional[Iterable], default None
+            IDs of the base nodes initially shown. If not provided,
+            the whole base graph is shown.
+        fold : Optional[Literal['leaves', 'chains']], default None
+            If set, leaves ('leaves'), or also the chains and trees
+            hanging off the graph ('chains'), are initially hidden,
+            folded into the node they hang off, see
+            `streamlit_cytoscape.folding`. Displayed nodes with hidden
+            folded nodes have their count in '_folded', shown as a
+            badge, and expanding them shows the folded nodes.
+
+        Example
+        -------
+        >>> @st.cache_resource
+        ... def load_base():
+        ...     return GraphIndex(load_elements())
+        >>> if "view" not in st.session_state:
+        ...     st.session_state.view = GraphOverlay(load_base(), ["a"])
+        >>> streamlit_cytoscape(st.session_state.view, key="graph")
+        """
+        if fold is not None and fold not in FOLDS:
+            raise ValueError(f"fold must be one of {FOLDS}")
+        self.base = base
+        self.fold = fold
+        self.initial: Optional[Set[str]] = (
+            None if node_ids is None else {str(i) for i in node_ids}
+        )
+        self.shown: Set[str] = set()
+        self.removed: Set[str] = set()
+        self.added: Dict[str, Dict[str, Any]] = {}
+        self.added_edges: Dict[str, Dict[str, Any]] = {}
+        self.id = uuid.uuid4().hex
+        self.version = 0
+
+    @property
+    def handle(self) -> str:
+        """
+        Identifies the current state of the overlay, it changes with
+        every edit.
+        """
+        return f"overlay:{self.id}:{self.version}"
+
+    def node_ids(self) -> Set[str]:
+        """
+        Returns the IDs of the base nodes currently shown.
+        """
+        if self.fold is None:
+            initial = (
+                set(self.base.ids) if self.initial is None else self.initial
+            )
+        else:
+            # folded nodes are initially hidden, from the folding cached
+            # per base graph version rather than a per session copy
+            folding = _folding(self.base, self.fold == "chains")[1]
+            folded = folding[0] >= 0
+            if self.initial is None:
+                kept = np.flatnonzero(~folded).tolist()
+                initial = {self.base.ids[i] for i in kept}
+            else:
+                initial = {
+                    _id
+                    for _id in self.initial
+                    if _id not in self.base
+                    or not folded[self.base.position(_id)]
+                }
+        return (initial | self.shown) - self.removed
+
+    def elements(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Materializes the elements of the overlay: the shown base nodes
+        with the base edges between them, plus the added elements.
+        """
+        unchanged = not (self.shown or self.removed or self.fold)
+        if self.initial is None and unchanged:
+            elements = self.base.subgraph()
+        else:
+            elements = self.base.subgraph(self.node_ids())
+        if self.fold is not None:
+            elements = self._with_folded_counts(elements)
+        nodes = elements["nodes"] + list(self.added.values())
+        node_ids = {str(n["data"]["id"]) for n in self.added.values()}
+        node_ids |= self.node_ids()
+        edges = elements["edges"] + [
+            e
+            for e in self.added_edges.values()
+            if str(e["data"]["source"]) in node_ids
+            and str(e["data"]["target"]) in node_ids
+        ]
+        return {"nodes": nodes, "edges": edges}
+
+    def expand(
+        self,
+        node_ids: Iterable[Any],
+        depth: int = 1,
+        limit: Optional[int] = None,
+        rank_by: Literal["degree", "weight"] = "degree",
+    ) -> None:
+        """
+        Shows the neighborhood of the given nodes, see
+        `GraphIndex.neighborhood`. "Load more" placeholder nodes are
+        kept as added elements and replaced when expanded.
+        """
+        node_ids = [str(i) for i in node_ids]
+        for _id in node_ids:
+            if is_placeholder(_id):
+                self._discard(_id)
+        expansion = self.base.neighborhood(
+            [i for i in node_ids if i in self.base or is_placeholder(i)],
+            depth=depth,
+            limit=limit,
+            rank_by=rank_by,
+            visible=self.node_ids(),
+        )
+        for n in expansion["nodes"]:
+            _id = str(n["data"]["id"])
+            if is_placeholder(_id):
+                self.added[_id] = n
+            else:
+                self.shown.add(_id)
+                self.removed.discard(_id)
+        for e in expansion["edges"]:
+            if is_placeholder(e["data"]["target"]):
+                self.added_edges[str(e["data"]["id"])] = e
+        self.version += 1
+
+    def remove(self, node_ids: Iterable[Any]) -> None:
+        """
+        Hides the given nodes and their edges.
+        """
+        for _id in map(str, node_ids):
+            if _id in self.base:
+                self.shown.discard(_id)
+                self.removed.add(_id)
+            else:
+                self._discard(_id)
+        self.version += 1
+
+    def add(self, elements: Dict[str, Any]) -> None:
+        """
+        Adds session specific elements which are not part of the base
+        graph. Base nodes listed in `elements` are shown instead.
+        """
+        for n in elements.get("nodes", []):
+            _id = str(n["data"]["id"])
+            if _id in self.base:
+                self.shown.add(_id)
+                self.removed.discard(_id)
+            else:
+                self.added[_id] = n
+        for e in elements.get("edges", []):
+            self.added_edges[str(e["data"]["id"])] = e
+        self.version += 1
+
+    def handle_action(self, value: Optional[Dict[str, Any]]) -> bool:
+        """
+        Applies a 'remove' or 'expand' node action returned by the
+        component. Returns True if the value was such an action.
+
+        Example
+        -------
+        >>> def on_change():
+        ...     st.session_state.graph.handle_action(
+        ...         st.session_state["graph_key"]
+        ...     )
+        """
+        action = (value or {}).get("action")
+        data = (value or {}).get("data") or {}
+        if action == "remove":
+            self.remove(data["node_ids"])
+        elif action == "expand":
+            self.expand(
+                data["node_ids"],
+                depth=data.get("depth") or 1,
+                limit=data.get("limit"),
+            )
+        else:
+            return False
+        return True
+
+    def _with_folded_counts(
+        self, elements: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        folding = _folding(self.base, self.fold == "chains")[1]
+        displayed = np.zeros(len(self.base), dtype=bool)
+        for node in elements["nodes"]:
+            displayed[self.base.position(node["data"]["id"])] = True
+        return _with_counts(self.base, elements, folding, displayed)
+
+    def _discard(self, node_id: str) -> None:
+        self.added.pop(node_id, None)
+        self.added_edges = {
+            k: e
+            for k, e in self.added_edges.items()
+            if node_id
+            not in (str(e["data"]["source"]), str(e["data"]["target"]))
+        }
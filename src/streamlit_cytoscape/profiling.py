@@ -0,0 +1,260 @@
+"""
+Opt-in profiling of `streamlit_cytoscape()` calls. Each profiled call
+records the time spent in its phases and the serialized size of its
+arguments, by group:
+
+- phases: 'styles' (style, legend, filter and event dumps), 'args'
+  (elements payload and arguments building), 'serialize' (JSON
+  encoding of each argument group, only done when profiling) and
+  'component' (the Streamlit component call, which marshals the
+  arguments again and sends them).
+- groups: 'elements', 'style', 'layout', 'events' and 'other'.
+
+Calls are profiled inside a `profile()` block, when a hook is
+registered with `add_hook()`, or when process wide counters are
+enabled with `enable_counters()`. Counters can be scraped in the
+Prometheus text format with `prometheus_text()`. When none is active,
+calls are not instrumented.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+PHASES = ("styles", "args", "serialize", "component")
+GROUPS = {
+    "elements": ("elements", "elementsKey", "stream"),
+    "style": ("style", "metaEdgeStyle", "legend"),
+    "layout": ("layout",),
+    "events": ("events",),
+}
+PREFIX = "streamlit_cytoscape"
+# name, type, help and label of the exported metrics
+EXPORTED = (
+    ("calls_total", "counter", "Profiled calls.", None),
+    (
+        "phase_seconds_total",
+        "counter",
+        "Seconds spent per phase of the calls.",
+        "phase",
+    ),
+    (
+        "payload_bytes_total",
+        "counter",
+        "Serialized argument bytes per group.",
+        "group",
+    ),
+    (
+        "payload_bytes_max",
+        "gauge",
+        "Largest serialized argument group of a call, in bytes.",
+        "group",
+    ),
+)
+
+
+class CallProfile:
+    def __init__(self, key: Optional[str]) -> None:
+        """
+        Timings (in seconds) and serialized argument sizes (in bytes)
+        of one `streamlit_cytoscape()` call.
+        """
+        self.key = key
+        self.timings: Dict[str, float] = {}
+        self.sizes: Dict[str, int] = {}
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.timings.values())
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.sizes.values())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+
+    def measure(self, args: Dict[str, Any]) -> None:
+        """
+        Records the JSON size of the component arguments by group.
+        """
+        with self.phase("serialize"):
+            groups = {arg: g for g, names in GROUPS.items() for arg in names}
+            for arg, value in args.items():
+                group = groups.get(arg, "other")
+                if isinstance(value, bytes):
+                    # sent as is (e.g. packed elements)
+                    size = len(value)
+                else:
+                    size = len(json.dumps(value).encode())
+                self.sizes[group] = self.sizes.get(group, 0) + size
+
+    def __repr__(self) -> str:
+        return (
+            f"CallProfile(key={self.key!r}, "
+            f"time={self.total_time * 1000:.1f}ms, "
+            f"bytes={self.total_bytes})"
+        )
+
+
+ProfileHook = Callable[[CallProfile], None]
+
+# profiles collected by the profile() blocks of the current context
+_collectors: ContextVar[Tuple[List[CallProfile], ...]] = ContextVar(
+    "streamlit_cytoscape_profile_collectors", default=()
+)
+_hooks: List[ProfileHook] = []
+_lock = threading.Lock()
+_counters_enabled = False
+# (key, metric, label) -> value
+_counters: Dict[Tuple[str, str, str], float] = {}
+
+
+@contextmanager
+def profile() -> Iterator[List[CallProfile]]:
+    """
+    Profile the `streamlit_cytoscape()` calls made in the block, by the
+    current script run only.
+
+    Example
+    -------
+    >>> with profile() as calls:
+    ...     streamlit_cytoscape(elements, key="graph")
+    >>> calls[0].sizes["elements"], calls[0].timings["args"]
+    """
+    calls: List[CallProfile] = []
+    token = _collectors.set(_collectors.get() + (calls,))
+    try:
+        yield calls
+    finally:
+        _collectors.reset(token)
+
+
+def add_hook(hook: ProfileHook) -> None:
+    """
+    Register a callback called with the `CallProfile` of every
+    `streamlit_cytoscape()` call of the process, from any session.
+    """
+    with _lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook: ProfileHook) -> None:
+    with _lock:
+        _hooks.remove(hook)
+
+
+def enable_counters(enabled: bool = True) -> None:
+    """
+    Enable (or disable) the process wide counters returned by
+    `prometheus_text()`.
+    """
+    global _counters_enabled
+    _counters_enabled = enabled
+
+
+def reset_counters() -> None:
+    with _lock:
+        _counters.clear()
+
+
+def _start(key: Optional[str]) -> Optional[CallProfile]:
+    """
+    Returns the profile of a call, None if profiling is inactive.
+    """
+    if _collectors.get() or _hooks or _counters_enabled:
+        return CallProfile(key)
+    return None
+
+
+def _phase(call: Optional[CallProfile], name: str) -> ContextManager[None]:
+    return call.phase(name) if call is not None else nullcontext()
+
+
+def _finish(call: CallProfile) -> None:
+    for calls in _collectors.get():
+        calls.append(call)
+    if _counters_enabled:
+        _count(call)
+    with _lock:
+        hooks = list(_hooks)
+    for hook in hooks:
+        hook(call)
+
+
+def _count(call: CallProfile) -> None:
+    key = call.key or ""
+    with _lock:
+        _add(key, "calls_total", "", 1)
+        for name, seconds in call.timings.items():
+            _add(key, "phase_seconds_total", name, seconds)
+        for group, size in call.sizes.items():
+            _add(key, "payload_bytes_total", group, size)
+            largest = (key, "payload_bytes_max", group)
+            _counters[largest] = max(_counters.get(largest, 0), size)
+
+
+def _add(key: str, metric: str, label: str, value: float) -> None:
+    _counters[(key, metric, label)] = (
+        _counters.get((key, metric, label), 0) + value
+    )
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def prometheus_text() -> str:
+    """
+    Returns the counters in the Prometheus text exposition format,
+    labeled by component key, e.g. to be served by a scraping
+    endpoint or written to a textfile collector.
+
+    Example
+    -------
+    >>> enable_counters()
+    >>> print(prometheus_text())
+    # HELP streamlit_cytoscape_calls_total Profiled calls.
+    # TYPE streamlit_cytoscape_calls_total counter
+    streamlit_cytoscape_calls_total{key="graph"} 12
+    ...
+    """
+    with _lock:
+        counters = sorted(_counters.items())
+    lines = []
+    for metric, kind, help_text, label in EXPORTED:
+        name = f"{PREFIX}_{metric}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for (key, m, value_label), value in counters:
+            if m != metric:
+                continue
+            labels = f'key="{_escape(key)}"'
+            if label:
+                labels += f',{label}="{_escape(value_label)}"'
+            lines.append(f"{name}{{{labels}}} {_number(value)}")
+    return "\n".join(lines) + "\n"
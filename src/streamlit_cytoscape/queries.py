@@ -0,0 +1,298 @@
+"""
+Path and neighborhood queries over a `GraphIndex`. Queries run on the
+CSR arrays of the index and return a `Highlight`, which
+`streamlit_cytoscape()` applies to the displayed graph in a single
+batch, without resending the elements.
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from streamlit_cytoscape.graph import GraphIndex
+
+
+class Highlight:
+    def __init__(
+        self,
+        node_ids: Iterable[Any] = (),
+        edge_ids: Iterable[Any] = (),
+        paths: Optional[List[List[str]]] = None,
+        focus: bool = True,
+        fade: bool = True,
+    ) -> None:
+        """
+        Define elements to highlight in the graph, e.g. the result of
+        a query. Pass it as the `highlight` argument of
+        `streamlit_cytoscape()`; elements missing from the displayed
+        graph are ignored.
+
+        Parameters
+        ----------
+        node_ids : Iterable, default ()
+            IDs of the nodes to highlight.
+        edge_ids : Iterable, default ()
+            IDs of the edges to highlight.
+        paths : Optional[List[List[str]]], default None
+            Node IDs of the paths found by the query, if any. Not
+            sent to the frontend.
+        focus : bool, default True
+            If True, the viewport is animated to fit the highlighted
+            elements.
+        fade : bool, default True
+            If True, the other elements are faded out.
+
+        Example
+        -------
+        >>> result = shortest_path(index, "a", "b")
+        >>> streamlit_cytoscape(elements, highlight=result, key="g")
+        """
+        self.node_ids = [str(i) for i in node_ids]
+        self.edge_ids = [str(i) for i in edge_ids]
+        self.paths = paths or []
+        self.focus = focus
+        self.fade = fade
+
+    def __bool__(self) -> bool:
+        return bool(self.node_ids or self.edge_ids)
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "nodes": self.node_ids,
+            "edges": self.edge_ids,
+            "focus": self.focus,
+            "fade": self.fade,
+        }
+
+
+def _edges_between(index: GraphIndex, i: int, j: int) -> np.ndarray:
+    row = slice(index.indptr[i], index.indptr[i + 1])
+    return np.unique(index.edge_index[row][index.indices[row] == j])
+
+
+def _paths_highlight(
+    index: GraphIndex, paths: List[List[int]], **kwargs: Any
+) -> Highlight:
+    nodes: Dict[int, None] = {}
+    edges: Set[int] = set()
+    for path in paths:
+        nodes.update(dict.fromkeys(path))
+        for i, j in zip(path, path[1:]):
+            edges.update(_edges_between(index, i, j).tolist())
+    return Highlight(
+        [index.ids[i] for i in nodes],
+        [index.edges[e]["data"]["id"] for e in sorted(edges)],
+        paths=[[index.ids[i] for i in path] for path in paths],
+        **kwargs,
+    )
+
+
+def _bfs_parents(index: GraphIndex, source: int, target: int) -> np.ndarray:
+    """
+    Level by level breadth first search, each level expanded with
+    vectorized CSR gathers. Returns the parent of each reached node
+    (-1 if not reached), stopping at the level reaching `target`.
+    """
+    parent = np.full(len(index), -1, dtype=np.int64)
+    parent[source] = source
+    frontier = np.array([source], dtype=np.int64)
+    while len(frontier) and parent[target] < 0:
+        neighbors, origins = index.gather(frontier)
+        new = parent[neighbors] < 0
+        neighbors, first = np.unique(neighbors[new], return_index=True)
+        parent[neighbors] = origins[new][first]
+        frontier = neighbors
+    return parent
+
+
+def _dijkstra_parents(
+    index: GraphIndex, source: int, target: int
+) -> np.ndarray:
+    dist = np.full(len(index), np.inf)
+    parent = np.full(len(index), -1, dtype=np.int64)
+    dist[source] = 0.0
+    parent[source] = source
+    heap = [(0.0, source)]
+    while heap:
+        d, i = heapq.heappop(heap)
+        if i == target:
+            break
+        if d > dist[i]:
+            continue
+        row = slice(index.indptr[i], index.indptr[i + 1])
+        weights = index.weights[index.edge_index[row]]
+        for j, w in zip(index.indices[row].tolist(), weights.tolist()):
+            if w < 0:
+                raise ValueError("Edge weights must be non-negative")
+            if d + w < dist[j]:
+                dist[j] = d + w
+                parent[j] = i
+                heapq.heappush(heap, (d + w, j))
+    return parent
+
+
+def shortest_path(
+    index: GraphIndex,
+    source: Any,
+    target: Any,
+    weighted: bool = False,
+    **kwargs: Any,
+) -> Highlight:
+    """
+    Shortest path between two nodes, ignoring edge directions.
+
+    Parameters
+    ----------
+    index : GraphIndex
+        Index of the graph to query.
+    source : Any
+        ID of the first node.
+    target : Any
+        ID of the second node.
+    weighted : bool, default False
+        If False, the path with the fewest edges is returned
+        (breadth first search). If True, the path minimizing the sum
+        of the index weights is returned (Dijkstra).
+    **kwargs
+        `focus` and `fade` options of the returned `Highlight`.
+
+    Returns
+    -------
+    Highlight
+        The nodes and edges of the path, empty if the nodes are not
+        connected. Parallel edges along the path are all included.
+    """
+    s, t = index.position(source), index.position(target)
+    if weighted:
+        parent = _dijkstra_parents(index, s, t)
+    else:
+        parent = _bfs_parents(index, s, t)
+    if parent[t] < 0:
+        return Highlight(**kwargs)
+    path = [t]
+    while path[-1] != s:
+        path.append(int(parent[path[-1]]))
+    return _paths_highlight(index, [path[::-1]], **kwargs)
+
+
+def simple_paths(
+    index: GraphIndex,
+    source: Any,
+    target: Any,
+    max_length: int,
+    limit: Optional[int] = None,
+    **kwargs: Any,
+) -> Highlight:
+    """
+    All simple paths (without repeated nodes) between two nodes with
+    at most `max_length` edges, ignoring edge directions.
+
+    Parameters
+    ----------
+    index : GraphIndex
+        Index of the graph to query.
+    source : Any
+        ID of the first node.
+    target : Any
+        ID of the second node.
+    max_length : int
+        Maximum number of edges of a path.
+    limit : Optional[int], default None
+        Maximum number of paths returned. The number of simple paths
+        grows exponentially with `max_length` on dense graphs, so
+        setting a limit is recommended.
+    **kwargs
+        `focus` and `fade` options of the returned `Highlight`.
+
+    Returns
+    -------
+    Highlight
+        The nodes and edges of the paths, with the paths (shortest
+        first) in `paths`.
+    """
+    s, t = index.position(source), index.position(target)
+    # nodes farther than the remaining length from the target are
+    # pruned using their hop distance to it
+    distance = _hop_distances(index, t, max_length)
+    paths: List[List[int]] = []
+    path = [s]
+    on_path = {s}
+    stack = [iter(_distinct_neighbors(index, s).tolist())]
+    while stack and (limit is None or len(paths) < limit):
+        j = next(stack[-1], None)
+        if j is None:
+            stack.pop()
+            on_path.discard(path.pop())
+            continue
+        if j in on_path or distance[j] > max_length - len(path):
+            continue
+        if j == t:
+            paths.append(path + [t])
+            continue
+        path.append(j)
+        on_path.add(j)
+        stack.append(iter(_distinct_neighbors(index, j).tolist()))
+    paths.sort(key=len)
+    return _paths_highlight(index, paths, **kwargs)
+
+
+def _distinct_neighbors(index: GraphIndex, i: int) -> np.ndarray:
+    row = slice(index.indptr[i], index.indptr[i + 1])
+    return np.unique(index.indices[row])
+
+
+def _hop_distances(index: GraphIndex, source: int, depth: int) -> np.ndarray:
+    """
+    Hop distances from `source` up to `depth`, larger values for
+    nodes farther away.
+    """
+    distance = np.full(len(index), depth + 1, dtype=np.int64)
+    distance[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    for d in range(1, depth + 1):
+        if not len(frontier):
+            break
+        neighbors = np.unique(index.gather(frontier)[0])
+        frontier = neighbors[distance[neighbors] > d]
+        distance[frontier] = d
+    return distance
+
+
+def common_neighbors(
+    index: GraphIndex, node_ids: Iterable[Any], **kwargs: Any
+) -> Highlight:
+    """
+    Nodes adjacent to all the given nodes, ignoring edge directions.
+
+    Parameters
+    ----------
+    index : GraphIndex
+        Index of the graph to query.
+    node_ids : Iterable
+        IDs of the nodes, at least two.
+    **kwargs
+        `focus` and `fade` options of the returned `Highlight`.
+
+    Returns
+    -------
+    Highlight
+        The given nodes, their common neighbors and the edges
+        between them.
+    """
+    positions = [index.position(i) for i in node_ids]
+    if len(positions) < 2:
+        raise ValueError("common_neighbors requires at least two nodes")
+    shared = _distinct_neighbors(index, positions[0])
+    for i in positions[1:]:
+        shared = np.intersect1d(shared, _distinct_neighbors(index, i))
+    common = [j for j in shared.tolist() if j not in positions]
+    edges: Set[int] = set()
+    for i in positions:
+        for j in common:
+            edges.update(_edges_between(index, i, j).tolist())
+    return Highlight(
+        [index.ids[i] for i in positions + common],
+        [index.edges[e]["data"]["id"] for e in sorted(edges)],
+        **kwargs,
+    )
@@ -0,0 +1,358 @@
+"""
+Representative samples of huge graphs, to display something
+meaningful right away. Samples are connected subgraphs of a target
+size, grown from a start node (by default the node of highest degree)
+over the CSR arrays of a `GraphIndex` with NumPy, and reproducible for
+a given seed. Graphs whose start component is smaller than the target
+size are sampled whole.
+
+Passing the sampled IDs to a `GraphOverlay` of the full graph keeps
+the rest of it reachable with the 'expand' node action:
+
+    >>> node_ids = sample_nodes(index, 500, "forest_fire", seed=1)
+    >>> st.session_state.view = GraphOverlay(index, node_ids)
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from streamlit_cytoscape.caching import LRUCache
+from streamlit_cytoscape.datasets import _fingerprint
+from streamlit_cytoscape.graph import GraphIndex
+from streamlit_cytoscape.metrics import METRICS, compute_metrics
+
+METHODS = ("random_walk", "forest_fire", "stratified", "top_k")
+# options accepted by each method
+OPTIONS: Dict[str, Tuple[str, ...]] = {
+    "random_walk": ("restart", "walkers"),
+    "forest_fire": ("burn",),
+    "stratified": (),
+    "top_k": (),
+}
+# computed samples kept per process, by graph version and options
+CACHE_SIZE = 16
+_cache: "LRUCache[Tuple[str, ...]]" = LRUCache(CACHE_SIZE)
+
+
+def bfs_tree(index: GraphIndex, start: int) -> np.ndarray:
+    """
+    Breadth first search tree from the node at position `start`,
+    ignoring edge directions, one vectorized step per level. Returns
+    the parent of each node (the start being its own parent), -1 for
+    the nodes of other components.
+    """
+    parent = np.full(len(index), -1, dtype=np.int64)
+    parent[start] = start
+    frontier = np.array([start], dtype=np.int64)
+    while len(frontier):
+        neighbors, owners = index.gather(frontier)
+        new = parent[neighbors] < 0
+        neighbors, owners = neighbors[new], owners[new]
+        neighbors, first = np.unique(neighbors, return_index=True)
+        parent[neighbors] = owners[first]
+        frontier = neighbors
+    return parent
+
+
+def _connect(
+    candidates: np.ndarray, parent: np.ndarray, start: int, size: int
+) -> np.ndarray:
+    """
+    Adds the candidates in order, each with the nodes of its tree path
+    to `start` not added yet, until `size` nodes are added.
+    """
+    included = np.zeros(len(parent), dtype=bool)
+    included[start] = True
+    order = [start]
+    for node in candidates.tolist():
+        path = []
+        while not included[node]:
+            path.append(node)
+            node = int(parent[node])
+        if len(order) + len(path) > size:
+            continue
+        included[path] = True
+        order.extend(reversed(path))
+        if len(order) == size:
+            break
+    return np.asarray(order, dtype=np.int64)
+
+
+def _grow(
+    index: GraphIndex,
+    order: List[int],
+    included: np.ndarray,
+    size: int,
+    rng: np.random.Generator,
+) -> None:
+    """
+    Adds random neighbors of the sampled nodes until `size` nodes are
+    sampled, in place (fallback of stalled walks and fires).
+    """
+    while len(order) < size:
+        neighbors, _ = index.gather(np.asarray(order, dtype=np.int64))
+        neighbors = np.unique(neighbors[~included[neighbors]])
+        if not len(neighbors):
+            return
+        new = rng.permutation(neighbors)[: size - len(order)]
+        included[new] = True
+        order.extend(new.tolist())
+
+
+def random_walk_sample(
+    index: GraphIndex,
+    size: int,
+    start: int,
+    seed: int = 0,
+    restart: float = 0.15,
+    walkers: int = 32,
+) -> np.ndarray:
+    """
+    Nodes visited by random walkers moving in lockstep from `start`,
+    each jumping back to it with probability `restart` at every step,
+    in the order of their first visit.
+    """
+    rng = np.random.default_rng(seed)
+    included = np.zeros(len(index), dtype=bool)
+    included[start] = True
+    order = [start]
+    if not len(index.indices):
+        return np.asarray(order, dtype=np.int64)
+    position = np.full(walkers, start, dtype=np.int64)
+    # steps without new nodes before growing the sample directly
+    patience = max(100, 10 * size // walkers)
+    stale = 0
+    while len(order) < size and stale < patience:
+        degree = index.degree[position]
+        offset = (rng.random(walkers) * degree).astype(np.int64)
+        step = index.indices[
+            np.minimum(index.indptr[position] + offset, len(index.indices) - 1)
+        ]
+        step = np.where(degree > 0, step, start)
+        step = np.where(rng.random(walkers) < restart, start, step)
+        new = step[~included[step]]
+        new, first = np.unique(new, return_index=True)
+        new = new[np.argsort(first)][: size - len(order)]
+        included[new] = True
+        order.extend(new.tolist())
+        stale = 0 if len(new) else stale + 1
+        # walkers stay on sampled nodes, so the sample is connected
+        position = np.where(included[step], step, position)
+    _grow(index, order, included, size, rng)
+    return np.asarray(order, dtype=np.int64)
+
+
+def forest_fire_sample(
+    index: GraphIndex,
+    size: int,
+    start: int,
+    seed: int = 0,
+    burn: float = 0.7,
+) -> np.ndarray:
+    """
+    Forest fire sampling: the fire spreads from `start`, each burning
+    node burning a geometrically distributed number of its unburnt
+    neighbors (on average burn / (1 - burn)). When the fire dies out,
+    it restarts from a random burnt node with unburnt neighbors.
+    """
+    rng = np.random.default_rng(seed)
+    included = np.zeros(len(index), dtype=bool)
+    included[start] = True
+    order = [start]
+    frontier = np.array([start], dtype=np.int64)
+    quota = np.zeros(len(index), dtype=np.int64)
+    while len(order) < size:
+        quota[frontier] = rng.geometric(1 - burn, len(frontier)) - 1
+        if not len(frontier):
+            burnt = np.asarray(order, dtype=np.int64)
+            neighbors, owners = index.gather(burnt)
+            owners = np.unique(owners[~included[neighbors]])
+            if not len(owners):
+                break
+            # a restarted fire burns at least one node
+            frontier = owners[rng.integers(len(owners), size=1)]
+            quota[frontier] = max(rng.geometric(1 - burn) - 1, 1)
+        neighbors, owners = index.gather(frontier)
+        unburnt = ~included[neighbors]
+        neighbors, owners = neighbors[unburnt], owners[unburnt]
+        # random neighbors of each node, up to its quota
+        ranked = np.lexsort((rng.random(len(neighbors)), owners))
+        neighbors, owners = neighbors[ranked], owners[ranked]
+        starts = np.ones(len(owners), dtype=bool)
+        starts[1:] = owners[1:] != owners[:-1]
+        rank = np.arange(len(owners)) - np.maximum.accumulate(
+            np.where(starts, np.arange(len(owners)), 0)
+        )
+        neighbors = neighbors[rank < quota[owners]]
+        new, first = np.unique(neighbors, return_index=True)
+        new = new[np.argsort(first)][: size - len(order)]
+        included[new] = True
+        order.extend(new.tolist())
+        frontier = new
+    return np.asarray(order, dtype=np.int64)
+
+
+def stratified_sample(
+    index: GraphIndex,
+    size: int,
+    start: int,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Degree stratified sampling: the reachable nodes are binned by
+    degree on a log2 scale, and each bin is sampled in proportion to
+    its size. Sampled nodes are connected through their shortest path
+    to `start`, whose nodes count towards the size.
+    """
+    rng = np.random.default_rng(seed)
+    parent = bfs_tree(index, start)
+    reachable = np.flatnonzero(parent >= 0)
+    strata = np.log2(index.degree[reachable] + 1).astype(np.int64)
+    shuffled = rng.permutation(len(reachable))
+    # random rank of each node within its stratum, as a fraction of
+    # the stratum: interleaves the strata in proportion to their size
+    ranked = shuffled[np.argsort(strata[shuffled], kind="stable")]
+    counts = np.bincount(strata)
+    offsets = np.cumsum(counts) - counts
+    fraction = np.empty(len(reachable))
+    fraction[ranked] = (
+        np.arange(len(reachable)) - offsets[strata[ranked]]
+    ) / counts[strata[ranked]]
+    candidates = reachable[np.lexsort((shuffled, fraction))]
+    return _connect(candidates, parent, start, size)
+
+
+def top_k_sample(
+    index: GraphIndex,
+    size: int,
+    scores: np.ndarray,
+    start: int,
+) -> np.ndarray:
+    """
+    Nodes of highest score, connected through their shortest path to
+    `start`, whose nodes count towards the size.
+    """
+    parent = bfs_tree(index, start)
+    reachable = np.flatnonzero(parent >= 0)
+    candidates = reachable[
+        np.lexsort((reachable, -scores[reachable]))
+    ]
+    return _connect(candidates, parent, start, size)
+
+
+def sample_nodes(
+    graph: Union[GraphIndex, Dict[str, Any]],
+    size: int,
+    method: str = "forest_fire",
+    seed: int = 0,
+    start: Optional[Any] = None,
+    metric: Union[str, Sequence[float]] = "pagerank",
+    **options: Any,
+) -> List[str]:
+    """
+    Returns the IDs of the nodes of a connected, representative
+    sample of the graph, in the order they were sampled.
+
+    Parameters
+    ----------
+    graph : Union[GraphIndex, dict]
+        A `GraphIndex`, or graph elements in the same format accepted
+        by `streamlit_cytoscape()`.
+    size : int
+        Target number of nodes. The whole component of the start
+        node is sampled if it is smaller.
+    method : str, default 'forest_fire'
+        'random_walk', 'forest_fire', 'stratified' (by degree) or
+        'top_k' (nodes of highest `metric`, with the paths between
+        them).
+    seed : int, default 0
+        Seed of the random choices, for reproducible samples.
+    start : Optional[Any], default None
+        ID of the node the sample grows from. Defaults to the node of
+        highest degree, or of highest `metric` for 'top_k'.
+    metric : Union[str, Sequence[float]], default 'pagerank'
+        'top_k' ranking: a metric of `streamlit_cytoscape.metrics`,
+        or the score of each node in the order of the index nodes.
+    **options
+        Options of the method: `restart` and `walkers` for
+        'random_walk', `burn` for 'forest_fire'. Other options raise
+        a ValueError.
+
+    Example
+    -------
+    >>> node_ids = sample_nodes(index, 500, "random_walk", seed=1)
+    >>> streamlit_cytoscape(index.subgraph(node_ids), key="preview")
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}")
+    unknown = set(options) - set(OPTIONS[method])
+    if unknown:
+        raise ValueError(
+            f"Unknown options {sorted(unknown)} for method '{method}', "
+            f"accepted options: {list(OPTIONS[method])}"
+        )
+    if size < 1:
+        raise ValueError("size must be positive")
+    if isinstance(metric, str) and metric not in METRICS:
+        raise ValueError(f"metric must be one of {METRICS}")
+    if isinstance(graph, GraphIndex):
+        index, fingerprint = graph, graph.fingerprint
+    else:
+        index, fingerprint = GraphIndex(graph), _fingerprint(graph)
+    if not len(index):
+        return []
+    ranking = metric if isinstance(metric, str) else None
+    key = (
+        fingerprint,
+        method,
+        size,
+        seed,
+        None if start is None else str(start),
+        ranking if method == "top_k" else None,
+        tuple(sorted(options.items())),
+    )
+    cacheable = method != "top_k" or ranking is not None
+    cached = _cache.get(key) if cacheable else None
+    if cached is not None:
+        # a copy, the cached sample being shared by the sessions
+        return list(cached)
+
+    if method == "top_k":
+        if isinstance(metric, str):
+            scores = compute_metrics(index, [metric])[metric]
+        else:
+            scores = np.asarray(metric, dtype=np.float64)
+            if scores.shape != (len(index),):
+                raise ValueError("metric must have one score per node")
+    else:
+        scores = index.degree
+    first = int(np.argmax(scores)) if start is None else index.position(start)
+
+    if method == "random_walk":
+        order = random_walk_sample(index, size, first, seed, **options)
+    elif method == "forest_fire":
+        order = forest_fire_sample(index, size, first, seed, **options)
+    elif method == "stratified":
+        order = stratified_sample(index, size, first, seed)
+    else:
+        order = top_k_sample(index, size, scores, first)
+    node_ids = [index.ids[i] for i in order.tolist()]
+    if cacheable:
+        _cache.put(key, tuple(node_ids))
+    return node_ids
+
+
+def sample_elements(
+    graph: Union[GraphIndex, Dict[str, Any]],
+    size: int,
+    method: str = "forest_fire",
+    seed: int = 0,
+    **options: Any,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Returns the elements of a sample of the graph: the sampled nodes
+    and the edges between them, see `sample_nodes()`.
+    """
+    index = graph if isinstance(graph, GraphIndex) else GraphIndex(graph)
+    return index.subgraph(sample_nodes(index, size, method, seed, **options))
@@ -0,0 +1,321 @@
+"""
+Append-only element streams for live graphs. Batches of elements are
+pushed to an `ElementStream` (e.g. by a background thread, or drained
+from a queue or a generator on fragment reruns) which keeps a bounded
+window of the latest elements. Keyed component instances only receive
+the elements added and evicted since the version they last received,
+applied in the browser in one `cy.batch()`.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from queue import Empty, Queue
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import streamlit as st
+
+from streamlit_cytoscape.encoding import encode_elements
+
+SYNC_ACTION = "stream_sync"
+STATE_KEY = "_streamlit_cytoscape_streams"
+# evicted IDs remembered to compute increments, older versions get the
+# whole window again
+HISTORY = 100000
+
+
+class _Entry(NamedTuple):
+    group: str
+    element: Dict[str, Any]
+    version: int
+    arrival: float
+
+
+class ElementStream:
+    def __init__(
+        self,
+        max_elements: Optional[int] = None,
+        window: Optional[float] = None,
+    ) -> None:
+        """
+        Define a live, append-only stream of elements. The stream can
+        be passed to `streamlit_cytoscape()` in place of the elements
+        (requires a key): the browser only receives the elements
+        pushed or evicted since its last update. Pushing an element
+        whose ID is already in the stream updates its data and makes
+        it the latest element. The stream can be shared between
+        sessions, e.g. with `st.cache_resource`, and pushed to from
+        other threads.
+
+        Parameters
+        ----------
+        max_elements : Optional[int], default None
+            Number of elements (nodes and edges) kept. Once exceeded,
+            the oldest elements are evicted first.
+        window : Optional[float], default None
+            Seconds elements are kept after being pushed. Older
+            elements are evicted first, on push and on render.
+
+        Evicting a node evicts its edges. If neither bound is set,
+        every element is kept.
+
+        Example
+        -------
+        >>> stream = ElementStream(max_elements=5000, window=600)
+        >>> @cytoscape_fragment(run_every=1)
+        ... def live_graph():
+        ...     stream.consume(events_queue)
+        ...     streamlit_cytoscape(stream, key="live")
+        """
+        if max_elements is not None and max_elements <= 0:
+            raise ValueError("max_elements must be positive")
+        if window is not None and window <= 0:
+            raise ValueError("window must be positive")
+        self.max_elements = max_elements
+        self.window = window
+        self.id = uuid.uuid4().hex
+        self.version = 0
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._incident: Dict[str, Set[str]] = {}
+        # (version, id) of the evicted elements
+        self._evicted: Deque[Tuple[int, str]] = deque()
+        # first version increments can be computed from
+        self._since = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, elements: Dict[str, Any]) -> None:
+        """
+        Appends a batch of elements ({"nodes": [...], "edges": [...]}).
+        Edges must connect nodes of the stream or of the batch.
+        """
+        nodes = elements.get("nodes", [])
+        edges = elements.get("edges", [])
+        with self._lock:
+            self._validate(nodes, edges)
+            self.version += 1
+            now = time.monotonic()
+            for n in nodes:
+                self._add("nodes", n, now)
+            for e in edges:
+                self._add("edges", e, now)
+            self._evict(now, pushed=True)
+
+    def consume(
+        self,
+        source: Union["Queue[Dict[str, Any]]", Iterable[Dict[str, Any]]],
+        max_batches: Optional[int] = None,
+    ) -> int:
+        """
+        Pushes the batches of a queue, without waiting for new ones,
+        or of an iterable (e.g. a generator, pulled until exhausted
+        unless `max_batches` is set). Returns the number of batches
+        pushed.
+        """
+        batches: Iterator[Dict[str, Any]]
+        if isinstance(source, Queue):
+            batches = _drain(source)
+        else:
+            batches = iter(source)
+        count = 0
+        while max_batches is None or count < max_batches:
+            batch = next(batches, None)
+            if batch is None:
+                break
+            self.push(batch)
+            count += 1
+        return count
+
+    def elements(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Returns the elements currently kept, oldest first.
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            return _group(self._entries.values())
+
+    def changes(
+        self, since: Optional[int]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Optional[List[str]]]:
+        """
+        Returns the elements pushed since the version `since`, and
+        the IDs evicted since then. The evicted IDs are None when the
+        increment cannot be computed (`since` is None or too old):
+        the elements are then all the elements kept.
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            if since is None or since < self._since:
+                return _group(self._entries.values()), None
+            pushed = []
+            for _id in reversed(self._entries):
+                entry = self._entries[_id]
+                if entry.version <= since:
+                    break
+                pushed.append(entry)
+            evicted = [_id for v, _id in self._evicted if v > since]
+            return _group(reversed(pushed)), evicted
+
+    def __contains__(self, _id: Any) -> bool:
+        return str(_id) in self._entries
+
+    def _validate(
+        self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]]
+    ) -> None:
+        node_ids = set()
+        for group, batch in (("nodes", nodes), ("edges", edges)):
+            for el in batch:
+                _id = str(el["data"]["id"])
+                entry = self._entries.get(_id)
+                other = _id in node_ids if group == "edges" else False
+                if other or (entry is not None and entry.group != group):
+                    raise ValueError(f"'{_id}' is both a node and an edge")
+                if group == "nodes":
+                    node_ids.add(_id)
+        for e in edges:
+            for end in (e["data"]["source"], e["data"]["target"]):
+                if str(end) not in node_ids and str(end) not in self:
+                    raise ValueError(
+                        f"Edge '{e['data']['id']}' references the "
+                        f"unknown node '{end}'"
+                    )
+
+    def _add(self, group: str, element: Dict[str, Any], now: float) -> None:
+        _id = str(element["data"]["id"])
+        previous = self._entries.pop(_id, None)
+        self._entries[_id] = _Entry(group, element, self.version, now)
+        if group == "edges":
+            if previous is not None:
+                self._unlink(_id, previous.element)
+            data = element["data"]
+            for end in (data["source"], data["target"]):
+                self._incident.setdefault(str(end), set()).add(_id)
+
+    def _unlink(self, _id: str, edge: Dict[str, Any]) -> None:
+        for end in (edge["data"]["source"], edge["data"]["target"]):
+            self._incident.get(str(end), set()).discard(_id)
+
+    def _evict(self, now: float, pushed: bool = False) -> None:
+        """
+        Evicts the oldest elements beyond the bounds. Evictions outside
+        of a push make a new version.
+        """
+        expired = None if self.window is None else now - self.window
+        bump = not pushed
+        while self._entries:
+            _id, oldest = next(iter(self._entries.items()))
+            too_many = (
+                self.max_elements is not None
+                and len(self._entries) > self.max_elements
+            )
+            if not too_many and (expired is None or oldest.arrival >= expired):
+                break
+            if bump:
+                self.version += 1
+                bump = False
+            self._remove(_id)
+
+    def _remove(self, _id: str) -> None:
+        entry = self._entries.pop(_id, None)
+        if entry is None:
+            return
+        if entry.group == "nodes":
+            for edge_id in self._incident.pop(_id, set()):
+                self._remove(edge_id)
+        else:
+            self._unlink(_id, entry.element)
+        self._evicted.append((self.version, _id))
+        while len(self._evicted) > HISTORY:
+            self._since = self._evicted.popleft()[0]
+
+
+def _stream_args(
+    stream: ElementStream, key: Optional[str], compact: bool
+) -> Dict[str, Any]:
+    """
+    Returns the increment of the stream for the keyed component
+    instance: the elements pushed and the IDs evicted since the
+    version it last received. `base` is None when the increment is
+    the whole window, replacing the elements of the graph.
+    """
+    if key is None:
+        raise ValueError("streamed elements require a component key")
+    states = st.session_state.setdefault(STATE_KEY, {})
+    state = states.get(key)
+    if state is None or state["stream"] != stream.id:
+        state = states[key] = {
+            "stream": stream.id,
+            "version": None,
+            "sync": None,
+            "value": None,
+        }
+    # the browser missed an increment (e.g. remounted component) and
+    # requested the ones since its version
+    value = st.session_state.get(key)
+    if (
+        isinstance(value, dict)
+        and value.get("action") == SYNC_ACTION
+        and value.get("timestamp") != state["sync"]
+    ):
+        state["sync"] = value.get("timestamp")
+        data = value.get("data") or {}
+        synced = data.get("stream") == stream.id
+        state["version"] = data.get("version") if synced else None
+    with stream._lock:
+        elements, evicted = stream.changes(state["version"])
+        version = stream.version
+    base = state["version"] if evicted is not None else None
+    state["version"] = version
+    return {
+        "id": stream.id,
+        "base": base,
+        "version": version,
+        "elements": encode_elements(elements) if compact else elements,
+        "evicted": evicted or [],
+    }
+
+
+def _handle_sync(value: Any, key: Optional[str]) -> Any:
+    """
+    Sync requests are not returned: the last other value is returned
+    instead.
+    """
+    if key is None or not isinstance(value, dict):
+        return value
+    state = st.session_state.get(STATE_KEY, {}).get(key)
+    if state is None:
+        return value
+    if value.get("action") == SYNC_ACTION:
+        return state["value"]
+    state["value"] = value
+    return value
+
+
+def _drain(queue: "Queue[Dict[str, Any]]") -> Iterator[Dict[str, Any]]:
+    while True:
+        try:
+            yield queue.get_nowait()
+        except Empty:
+            return
+
+
+def _group(entries: Iterable[_Entry]) -> Dict[str, List[Dict[str, Any]]]:
+    elements: Dict[str, List[Dict[str, Any]]] = {"nodes": [], "edges": []}
+    for entry in entries:
+        elements[entry.group].append(entry.element)
+    return elements
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
 
 class NodeStyle:
@@ -9,6 +9,7 @@ class NodeStyle:
         caption: Optional[str] = None,
         icon: Optional[str] = None,
         custom_styles: Optional[Dict[str, Any]] = None,
+        size: Optional[Union[int, float, str]] = None,
     ) -> None:
         """
         Define a custom style of a node in the graph based on label.
@@ -35,6 +36,11 @@ class NodeStyle:
             valid styles beyond the basic options provided by the
             constructor. For detailed information on available
             styles, visit: https://js.cytoscape.org/#style
+        size: Optional[Union[int, float, str]]
+            Width and height of the node. Like `color`, it can be
+            bound to a data attribute with a `mapData` expression,
+            e.g. from `NodeMetrics.map_data()`. If not provided, the
+            default node size 20 is used.
 
         Example
         -------
@@ -54,13 +60,17 @@ class NodeStyle:
         self.caption = caption
         self.icon = icon
         self.custom_styles = custom_styles
+        self.size = size
 
     def dump(self) -> Dict[str, Any]:
         selector = f"node[label='{self.label}']"
-        style = {}
+        style: Dict[str, Any] = {}
 
         if self.color:
             style["background-color"] = self.color
+        if self.size is not None:
+            style["width"] = self.size
+            style["height"] = self.size
         if self.caption:
             style["label"] = f"data({self.caption})"
         if self.icon:
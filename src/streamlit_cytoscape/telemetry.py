@@ -0,0 +1,103 @@
+"""
+Frontend performance telemetry. When enabled, the component times its
+phases in the browser (startup, arguments parsing, elements update,
+style, layout, first paint, event round trips) and reports them along
+with element counts and the JS heap size, with the values returned by
+user interactions (and periodically if an interval is set, each
+periodic report rerunning the app). Reports are logged to the
+'streamlit_cytoscape.telemetry' logger and passed to an optional hook.
+
+A report is a dict like:
+
+    {
+        "key": "graph",
+        "seq": 3,
+        "timestamp": 1700000000000,
+        "phases": {
+            "elements": {"count": 1, "total": 41.2, "max": 41.2,
+                         "last": 41.2},
+            "layout": {...},
+        },
+        "nodes": 1200,
+        "edges": 3400,
+        "renderer": "webgl",
+        "heap": 48213904,
+    }
+
+with timings in milliseconds, aggregated per phase since the previous
+report, and `heap` None outside Chromium browsers.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Optional, Union
+
+import streamlit as st
+
+TELEMETRY_ACTION = "telemetry"
+STATE_KEY = "_streamlit_cytoscape_telemetry"
+
+TelemetryHook = Callable[[Dict[str, Any]], None]
+
+logger = logging.getLogger(__name__)
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    One line summary of a report, e.g.
+    'graph: 1200 nodes, 3400 edges, heap 46.0 MB, elements 41.2 ms
+    (max 41.2, n=1), layout 820.5 ms (max 820.5, n=1)'. Phase timings
+    are averages.
+    """
+    parts = [f"{report.get('nodes')} nodes, {report.get('edges')} edges"]
+    if report.get("heap") is not None:
+        parts.append(f"heap {report['heap'] / 2**20:.1f} MB")
+    for phase, t in report.get("phases", {}).items():
+        mean = t["total"] / t["count"] if t["count"] else 0.0
+        parts.append(
+            f"{phase} {mean:.1f} ms (max {t['max']:.1f}, n={t['count']})"
+        )
+    return f"{report.get('key')}: " + ", ".join(parts)
+
+
+def _telemetry_args(
+    telemetry: Union[bool, TelemetryHook],
+    interval: Optional[float],
+    key: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    if not telemetry:
+        return None
+    if key is None:
+        raise ValueError("telemetry requires a component key")
+    if interval is not None and interval <= 0:
+        raise ValueError("telemetry_interval must be positive")
+    return {"interval": interval}
+
+
+def _handle_value(
+    value: Any,
+    key: Optional[str],
+    telemetry: Union[bool, TelemetryHook],
+) -> Any:
+    """
+    Consumes the telemetry report of a returned value, once per report
+    as values are returned again on every rerun. Periodic reports are
+    not returned: the last other value is returned instead.
+    """
+    if not telemetry or key is None or not isinstance(value, dict):
+        return value
+    states = st.session_state.setdefault(STATE_KEY, {})
+    state = states.setdefault(key, {"report": None, "value": None})
+    report = value.get("telemetry")
+    if report is not None:
+        report_id = (report.get("seq"), report.get("timestamp"))
+        if report_id != state["report"]:
+            state["report"] = report_id
+            report = {"key": key, **report}
+            logger.info(format_report(report))
+            if callable(telemetry):
+                telemetry(report)
+    if value.get("action") == TELEMETRY_ACTION:
+        return state["value"]
+    value = {k: v for k, v in value.items() if k != "telemetry"}
+    state["value"] = value
+    return value
@@ -0,0 +1,77 @@
+from datetime import date
+from typing import Any, Dict, Literal, Optional
+
+from streamlit_cytoscape.filters import Bound, _bound
+
+
+class Timeline:
+    def __init__(
+        self,
+        start: str = "start",
+        end: str = "end",
+        dtype: Optional[Literal["number", "date"]] = None,
+        value: Bound = None,
+        duration: float = 10.0,
+        loop: bool = False,
+    ) -> None:
+        """
+        Define a temporal playback of the elements. An element is
+        shown at time t when start <= t < end, a missing bound being
+        unbounded, and elements without both bounds are always shown.
+        The whole timeline is sent once: a slider and a play button
+        below the graph move the time in the browser, where an
+        interval index only updates the elements starting or ending
+        between two frames, without rerunning the app. The current
+        time is reported lazily, with the next returned value, under
+        'timeline'.
+
+        Parameters
+        ----------
+        start : str, default 'start'
+            Name of the data attribute holding the start time of the
+            elements (inclusive).
+        end : str, default 'end'
+            Name of the data attribute holding the end time of the
+            elements (exclusive).
+        dtype : Optional[Literal['number', 'date']], default None
+            Type of the time values. Dates are parsed by the browser
+            (e.g. ISO 8601 strings). If not provided, 'date' is used
+            when `value` is a date or datetime, and 'number'
+            otherwise.
+        value : Optional[Union[int, float, str, date]], default None
+            Time to show. The time only moves to it when it changes,
+            so the position set in the browser is kept across reruns.
+            If not provided, the timeline starts at its earliest time.
+        duration : float, default 10.0
+            Seconds to play the whole timeline.
+        loop : bool, default False
+            If True, playing restarts from the beginning once the end
+            is reached.
+
+        Example
+        -------
+        >>> timeline = Timeline("opened", "closed", dtype="date")
+        >>> streamlit_cytoscape(elements, timeline=timeline, key="g")
+        """
+        if duration <= 0:
+            raise ValueError("duration must be positive")
+        if dtype is None:
+            dtype = "date" if isinstance(value, date) else "number"
+        if dtype not in ("number", "date"):
+            raise ValueError(f"Unknown dtype '{dtype}'")
+        self.start = start
+        self.end = end
+        self.dtype = dtype
+        self.value = value
+        self.duration = duration
+        self.loop = loop
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "dtype": self.dtype,
+            "value": _bound(self.value),
+            "duration": self.duration,
+            "loop": self.loop,
+        }
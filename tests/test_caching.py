@@ -0,0 +1,39 @@
+"""Tests for the LRU caches shared by the sessions."""
+
+import threading
+
+from streamlit_cytoscape.caching import LRUCache
+
+
+def test_least_recently_used_evicted():
+    cache: LRUCache[int] = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+def test_concurrent_access():
+    cache: LRUCache[int] = LRUCache(4)
+    errors = []
+
+    def hammer(offset):
+        try:
+            for i in range(5000):
+                key = (offset + i) % 8
+                if cache.get(key) is None:
+                    cache.put(key, key)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=hammer, args=(k,)) for k in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(cache) == 4
@@ -0,0 +1,70 @@
+"""Tests for the session registry of shared elements."""
+
+import pytest
+
+from streamlit_cytoscape.datasets import (
+    MAX_DATASETS,
+    RESYNC_ACTION,
+    DatasetRegistry,
+)
+
+ELEMENTS = {"nodes": [{"data": {"id": "a"}}], "edges": []}
+
+
+def test_payload_sent_once_per_key():
+    registry = DatasetRegistry()
+    handle = registry.register(ELEMENTS)
+    assert registry.needs_payload(handle, "g1")
+    assert not registry.needs_payload(handle, "g1")
+    assert registry.needs_payload(handle, "g2")
+    assert registry.needs_payload(handle, None)
+
+
+def test_resync_request_resends_payload_once():
+    registry = DatasetRegistry()
+    handle = registry.register(ELEMENTS)
+    registry.needs_payload(handle, "g")
+    request = {
+        "action": RESYNC_ACTION,
+        "data": {"handle": handle},
+        "timestamp": 1,
+    }
+    registry.resync("g", request)
+    assert registry.needs_payload(handle, "g")
+    # the request is returned again on every rerun
+    registry.resync("g", request)
+    assert not registry.needs_payload(handle, "g")
+    registry.resync("g", {**request, "timestamp": 2})
+    assert registry.needs_payload(handle, "g")
+
+
+def test_resync_request_not_returned():
+    registry = DatasetRegistry()
+    value = {"action": "clicked", "data": {}, "timestamp": 1}
+    assert registry.handle_value("g", value) == value
+    request = {"action": RESYNC_ACTION, "data": {}, "timestamp": 2}
+    assert registry.handle_value("g", request) == value
+    assert registry.handle_value("h", request) is None
+
+
+def test_least_recently_used_dataset_evicted():
+    registry = DatasetRegistry()
+    handles = [
+        registry.register({"nodes": [{"data": {"id": str(i)}}], "edges": []})
+        for i in range(MAX_DATASETS)
+    ]
+    registry.needs_payload(handles[1], "g")
+    registry.get(handles[0])
+    handle = registry.register(ELEMENTS)
+    assert len(registry.datasets) == MAX_DATASETS
+    assert handles[1] not in registry.datasets
+    with pytest.raises(KeyError):
+        registry.get(handles[1])
+    assert registry.get(handles[0])
+    assert registry.get(handle) == ELEMENTS
+    # registered again, the evicted elements are sent again
+    restored = registry.register(
+        {"nodes": [{"data": {"id": "1"}}], "edges": []}
+    )
+    assert restored == handles[1]
+    assert registry.needs_payload(restored, "g")
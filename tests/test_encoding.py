@@ -0,0 +1,125 @@
+"""Tests for the compact wire format of the elements."""
+
+import json
+import zlib
+from pathlib import Path
+
+from streamlit_cytoscape.encoding import (
+    COMPRESSION_LEVEL,
+    encode_elements,
+    pack_elements,
+)
+
+DATA_DIR = Path(__file__).parents[1] / "examples" / "data"
+LABELS = ["PERSON", "COMPANY", "ACCOUNT"]
+
+
+def make_elements(size):
+    nodes = [
+        {
+            "data": {
+                "id": f"urn:entity:customer:{i:08d}",
+                "label": LABELS[i % len(LABELS)],
+                "name": f"Name {i}",
+            }
+        }
+        for i in range(size)
+    ]
+    edges = [
+        {
+            "data": {
+                "id": f"e{i}",
+                "source": nodes[i]["data"]["id"],
+                "target": nodes[(i * 7 + 1) % size]["data"]["id"],
+                "label": "KNOWS",
+            }
+        }
+        for i in range(size)
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+def test_edges_reference_node_indices():
+    encoded = encode_elements(make_elements(10))
+    assert encoded["format"] == "compact"
+    assert encoded["ids"]["range"] == ["urn:entity:customer:0000000", 0]
+    assert encoded["edges"]["data"]["source"]["values"][:3] == [0, 1, 2]
+    assert encoded["edges"]["data"]["target"]["values"][:3] == [1, 8, 5]
+
+
+def test_repeated_strings_are_interned():
+    encoded = encode_elements(make_elements(30))
+    strings = encoded["strings"]
+    # edge labels are the most repeated
+    assert strings[0] == "KNOWS"
+    assert set(strings) == {"KNOWS", *LABELS}
+    label = encoded["nodes"]["data"]["label"]["strings"]
+    assert [strings[i] for i in label[:4]] == LABELS + ["PERSON"]
+    assert encoded["nodes"]["data"]["name"] == {"range": ["Name ", 0]}
+
+
+def test_repeated_values_are_dictionary_encoded():
+    elements = {
+        "nodes": [{"data": {"id": i, "score": i % 2}} for i in range(4)],
+        "edges": [],
+    }
+    score = encode_elements(elements)["nodes"]["data"]["score"]
+    assert score == {"dictionary": [0, 1], "codes": [0, 1, 0, 1]}
+
+
+def test_sequential_ids_are_ranges():
+    encoded = encode_elements(make_elements(10))
+    assert encoded["edges"]["data"]["id"] == {"range": ["e", 0]}
+
+
+def test_joined_edge_ids_are_not_sent():
+    elements = {
+        "nodes": [{"data": {"id": "a"}}, {"data": {"id": "b"}}],
+        "edges": [{"data": {"id": "a-b", "source": "a", "target": "b"}}],
+    }
+    encoded = encode_elements(elements)
+    assert encoded["edges"]["data"]["id"] == {"join": "-"}
+
+
+def test_sparse_columns():
+    elements = {
+        "nodes": [
+            {"data": {"id": f"n{i}", "note": "x" if i == 2 else None}}
+            for i in range(5)
+        ],
+        "edges": [],
+    }
+    note = encode_elements(elements)["nodes"]["data"]["note"]
+    assert note == {"rows": [2], "strings": ["x"]}
+
+
+def test_missing_nodes_and_fields():
+    elements = {
+        "nodes": [{"data": {"id": 1}, "position": {"x": 0, "y": 0}}],
+        "edges": [{"data": {"id": "e", "source": 1, "target": 2}}],
+    }
+    encoded = encode_elements(elements)
+    assert encoded["edges"]["data"]["target"]["values"] == ["2"]
+    assert encoded["nodes"]["fields"]["position"]["values"] == [
+        {"x": 0, "y": 0}
+    ]
+
+
+def test_payload_is_smaller():
+    elements = make_elements(1000)
+    raw = len(json.dumps(elements))
+    compact = len(json.dumps(encode_elements(elements)))
+    assert raw / compact > 2
+
+
+def test_packed_example_is_smaller():
+    elements = json.loads((DATA_DIR / "claims.json").read_text())
+    packed = pack_elements(elements)
+    assert json.loads(zlib.decompress(packed)) == encode_elements(elements)
+    assert len(json.dumps(elements)) / len(packed) >= 3
+    # the encoding shrinks the JSON before deflate, and deflates smaller
+    # than the plain JSON does
+    plain = json.dumps(elements, separators=(",", ":"))
+    encoded = json.dumps(encode_elements(elements), separators=(",", ":"))
+    assert len(encoded) < len(plain)
+    assert len(packed) < len(zlib.compress(plain.encode(), COMPRESSION_LEVEL))
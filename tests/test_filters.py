@@ -0,0 +1,62 @@
+from datetime import date
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from streamlit_cytoscape import Filter
+
+
+PAGE_NAME = "Range Filters"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+
+
+def count_claims(iframe, min_amount=None):
+    condition = "" if min_amount is None else f"[claim_amount >= {min_amount}]"
+    return iframe.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return {{
+            visible: cy.nodes('[label="CLAIM"]').filter(':visible').length,
+            expected: cy.nodes('[label="CLAIM"]{condition}').length,
+        }};
+    }}"""
+    )
+
+
+def test_filter_dump():
+    f = Filter("opened", min_value=date(2024, 1, 1), group="edges")
+    assert f.dump() == {
+        "attribute": "opened",
+        "min": "2024-01-01",
+        "max": None,
+        "group": "edges",
+        "dtype": "date",
+    }
+    assert Filter("amount", 10, 20).dump()["dtype"] == "number"
+
+
+def test_filter_invalid_range():
+    with pytest.raises(ValueError):
+        Filter("amount", min_value=20, max_value=10)
+
+
+def test_range_filter_hides_out_of_range(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first.locator(":root")
+    frame.click(position={"x": 0, "y": 0})  # await and scroll to view
+    counts = count_claims(frame)
+    assert counts["visible"] == counts["expected"]
+
+    # raise the lower amount bound by 20 steps of 1000
+    thumb = page.get_by_role("slider").first
+    thumb.focus()
+    for _ in range(20):
+        thumb.press("ArrowRight")
+    expect(page.get_by_text("25000.00").first).to_be_visible(timeout=10000)
+    page.wait_for_timeout(1000)
+
+    counts = count_claims(frame, 25000)
+    assert 0 < counts["visible"] < count_claims(frame)["expected"]
+    assert counts["visible"] == counts["expected"]
@@ -0,0 +1,130 @@
+"""Tests for leaf and chain folding."""
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from streamlit_cytoscape import GraphIndex, GraphOverlay
+from streamlit_cytoscape.folding import fold_leaves, fold_tree, unfold
+
+
+PAGE_NAME = "Leaf Folding"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+
+
+def make_graph():
+    """
+    Triangle p1-p2-p3. p1 has the leaves e1 and e2 (e2 twice), p2 the
+    chain c1-c2-c3. Isolated pair a-b, and star s with l1 and l2.
+    """
+    ids = "p1 p2 p3 e1 e2 c1 c2 c3 a b s l1 l2".split()
+    pairs = [
+        ("p1", "p2"),
+        ("p2", "p3"),
+        ("p3", "p1"),
+        ("p1", "e1"),
+        ("p1", "e2"),
+        ("e2", "p1"),
+        ("p2", "c1"),
+        ("c1", "c2"),
+        ("c2", "c3"),
+        ("a", "b"),
+        ("s", "l1"),
+        ("s", "l2"),
+    ]
+    return {
+        "nodes": [{"data": {"id": i, "label": "X"}} for i in ids],
+        "edges": [
+            {"data": {"id": f"e{k}", "source": s, "target": t}}
+            for k, (s, t) in enumerate(pairs)
+        ],
+    }
+
+
+def folded(elements):
+    return {n["data"]["id"]: n["data"].get("_folded") for n in elements}
+
+
+def test_fold_leaves():
+    elements = fold_leaves(make_graph())
+    assert folded(elements["nodes"]) == {
+        "p1": 2,
+        "p2": None,
+        "p3": None,
+        "c1": None,
+        "c2": 1,
+        "a": 1,
+        "s": 2,
+    }
+    assert len(elements["edges"]) == 5
+
+
+def test_fold_chains():
+    index = GraphIndex(make_graph())
+    parent, rounds = fold_tree(index, chains=True)
+    assert index.ids[parent[index.position("c3")]] == "c2"
+    assert index.ids[parent[index.position("c1")]] == "p2"
+    assert len(rounds) == 3
+    elements = fold_leaves(index, chains=True)
+    assert folded(elements["nodes"]) == {
+        "p1": 2,
+        "p2": 3,
+        "p3": None,
+        "a": 1,
+        "s": 2,
+    }
+
+
+def test_unfold():
+    elements = unfold(make_graph(), ["p2"], chains=True, visible=["p1"])
+    # the next node of the chain, with the rest of it still folded
+    assert folded(elements["nodes"]) == {"c1": 2, "p2": None}
+    assert [e["data"]["id"] for e in elements["edges"]] == ["e6"]
+
+
+def test_overlay_fold():
+    overlay = GraphOverlay(GraphIndex(make_graph()), fold="chains")
+    assert overlay.node_ids() == {"p1", "p2", "p3", "a", "s"}
+    overlay.expand(["p2"])
+    nodes = folded(overlay.elements()["nodes"])
+    assert nodes["p2"] is None and nodes["c1"] == 2
+    overlay.expand(["c1"])
+    nodes = folded(overlay.elements()["nodes"])
+    assert nodes["c1"] is None and nodes["c2"] == 1
+    with pytest.raises(ValueError):
+        GraphOverlay(GraphIndex(make_graph()), fold="trees")
+
+
+def test_folding_badges(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    expect(frame.locator("#cy")).to_be_visible()
+    page.wait_for_timeout(1000)
+
+    badge = root.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        const node = cy.nodes("[_folded > 0]").first();
+        return [node.id(), node.data("_folded"), node.style("label")];
+    }}"""
+    )
+    node_id, count, label = badge
+    assert label.endswith(f"+{count}")
+
+    # expanding restores the folded nodes and removes the badge
+    root.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        cy.getElementById("{node_id}").select().emit("dbltap");
+    }}"""
+    )
+    page.wait_for_timeout(3000)
+    remaining = root.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return cy.getElementById("{node_id}").data("_folded");
+    }}"""
+    )
+    assert not remaining
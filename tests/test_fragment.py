@@ -0,0 +1,77 @@
+"""Tests for rendering the graph in a Streamlit fragment."""
+
+import streamlit as st
+
+from streamlit_cytoscape.component import _elements_args
+from streamlit_cytoscape.datasets import DatasetRegistry
+from streamlit_cytoscape.fragment import cytoscape_fragment, in_fragment
+
+ELEMENTS = {"nodes": [{"data": {"id": "a"}}], "edges": []}
+
+
+def passthrough_fragment(monkeypatch):
+    calls = []
+
+    def fragment(func, run_every=None):
+        calls.append(run_every)
+        return func
+
+    monkeypatch.setattr(st, "fragment", fragment, raising=False)
+    return calls
+
+
+def test_in_fragment_while_running(monkeypatch):
+    calls = passthrough_fragment(monkeypatch)
+
+    @cytoscape_fragment(run_every=5)
+    def graph():
+        return in_fragment()
+
+    assert not in_fragment()
+    assert graph()
+    assert not in_fragment()
+    assert calls == [5]
+
+
+def test_in_fragment_without_st_fragment(monkeypatch):
+    monkeypatch.delattr(st, "fragment", raising=False)
+
+    @cytoscape_fragment
+    def graph():
+        return in_fragment()
+
+    assert graph()
+    assert not in_fragment()
+
+
+def test_register_for_replaces_previous_dataset():
+    registry = DatasetRegistry()
+    first = registry.register_for("g", ELEMENTS)
+    second = registry.register_for("g", {"nodes": [], "edges": []})
+    assert second != first
+    assert first not in registry.datasets
+
+    # kept while used by another instance, or pinned
+    registry.register_for("h", ELEMENTS)
+    registry.register_for("g", ELEMENTS)
+    registry.register_for("g", {"nodes": [], "edges": []})
+    assert first in registry.datasets
+    pinned = registry.register({"nodes": [{"data": {"id": "b"}}]})
+    registry.register_for("k", {"nodes": [{"data": {"id": "b"}}]})
+    registry.register_for("k", ELEMENTS)
+    assert pinned in registry.datasets
+
+
+def test_unchanged_elements_not_resent(monkeypatch):
+    passthrough_fragment(monkeypatch)
+
+    @cytoscape_fragment
+    def graph(elements):
+        return _elements_args(elements, "fragment_graph", False)
+
+    payload, handle = graph(ELEMENTS)
+    assert payload == ELEMENTS and handle is not None
+    # fragment rerun with equal elements: only the handle is sent
+    assert graph({**ELEMENTS}) == (None, handle)
+    payload, changed = graph({"nodes": [], "edges": []})
+    assert payload is not None and changed != handle
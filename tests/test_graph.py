@@ -0,0 +1,93 @@
+"""Tests for the GraphIndex adjacency index and capped expansion."""
+
+import pytest
+
+from streamlit_cytoscape import streamlit_cytoscape
+from streamlit_cytoscape.graph import GraphIndex, is_placeholder
+
+
+def make_star(size):
+    """Hub node 'h' connected to size leaves, leaf 'l1' to 'x'."""
+    nodes = [{"data": {"id": "h"}}, {"data": {"id": "x"}}]
+    nodes += [{"data": {"id": f"l{i}"}} for i in range(size)]
+    edges = [
+        {"data": {"id": f"e{i}", "source": "h", "target": f"l{i}", "w": i}}
+        for i in range(size)
+    ]
+    edges.append({"data": {"id": "ex", "source": "l1", "target": "x"}})
+    edges.append({"data": {"id": "dangling", "source": "h", "target": "?"}})
+    return {"nodes": nodes, "edges": edges}
+
+
+def ids(elements, group="nodes"):
+    return [el["data"]["id"] for el in elements[group]]
+
+
+def test_csr_degrees():
+    index = GraphIndex(make_star(5))
+    assert index.degree[index.position("h")] == 5
+    assert index.degree[index.position("l1")] == 2
+    assert len(index.edges) == 6  # dangling edge ignored
+
+
+def test_neighborhood_depth():
+    index = GraphIndex(make_star(5))
+    one_hop = index.neighborhood(["l1"])
+    assert set(ids(one_hop)) == {"l1", "h", "x"}
+    two_hops = index.neighborhood(["x"], depth=2)
+    assert set(ids(two_hops)) == {"x", "l1", "h"}
+    assert set(ids(two_hops, "edges")) == {"ex", "e1"}
+
+
+def test_neighborhood_limit_and_load_more():
+    index = GraphIndex(make_star(10), weight="w")
+    page = index.neighborhood(["h"], limit=3, rank_by="weight")
+    assert ids(page)[:4] == ["h", "l9", "l8", "l7"]
+    more = [_id for _id in ids(page) if is_placeholder(_id)]
+    assert len(more) == 1
+    assert page["nodes"][-1]["data"]["_remaining"] == 7
+
+    next_page = index.neighborhood(
+        more, limit=3, rank_by="weight", visible=ids(page)
+    )
+    assert ids(next_page)[:3] == ["l6", "l5", "l4"]
+    assert set(ids(next_page, "edges")) >= {"e6", "e5", "e4"}
+
+
+def test_visible_neighbors_not_counted_towards_limit():
+    index = GraphIndex(make_star(10), weight="w")
+    visible = ["l9", "l8", "l6"]
+    page = index.neighborhood(
+        ["h"], limit=3, rank_by="weight", visible=visible
+    )
+    added = [_id for _id in ids(page) if _id.startswith("l")]
+    assert added == ["l7", "l5", "l4"]
+    (more,) = [n for n in page["nodes"] if is_placeholder(n["data"]["id"])]
+    # l3 to l0
+    assert more["data"]["_remaining"] == 4
+
+    next_page = index.neighborhood(
+        [more["data"]["id"]],
+        limit=3,
+        rank_by="weight",
+        visible=visible + ids(page),
+    )
+    assert [_id for _id in ids(next_page) if _id.startswith("l")] == [
+        "l3",
+        "l2",
+        "l1",
+    ]
+
+    # every neighbor visible: no empty page behind a placeholder
+    all_visible = index.neighborhood(
+        ["h"], limit=3, visible=[f"l{i}" for i in range(10)]
+    )
+    assert not any(is_placeholder(_id) for _id in ids(all_visible))
+
+
+def test_expand_options_validation():
+    elements = {"nodes": [], "edges": []}
+    with pytest.raises(ValueError):
+        streamlit_cytoscape(elements, expand_depth=0)
+    with pytest.raises(ValueError):
+        streamlit_cytoscape(elements, expand_limit=0)
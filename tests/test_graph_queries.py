@@ -0,0 +1,44 @@
+from playwright.sync_api import Page
+
+
+PAGE_NAME = "Graph Queries"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+
+
+def get_queried(iframe):
+    return iframe.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return {{
+            nodes: cy.nodes('.queried').map((n) => n.id()),
+            faded: cy.elements('.faded').length,
+        }};
+    }}"""
+    )
+
+
+def test_shortest_path_highlight(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first.locator(":root")
+    frame.click(position={"x": 0, "y": 0})  # await and scroll to view
+    page.wait_for_timeout(1000)
+
+    queried = get_queried(frame)
+    assert queried["nodes"][0] == "p21"
+    assert queried["nodes"][-1] == "p22"
+    assert queried["faded"] > 0
+
+
+def test_simple_paths_highlight(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    page.get_by_text("Simple paths").click()
+    page.get_by_text("3 path(s)").wait_for(timeout=10000)
+    frame = page.frame_locator(FRAME_LOCATOR).first.locator(":root")
+    frame.click(position={"x": 0, "y": 0})  # await and scroll to view
+    page.wait_for_timeout(1000)
+
+    queried = get_queried(frame)
+    assert {"p21", "p22"} <= set(queried["nodes"])
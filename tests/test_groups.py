@@ -0,0 +1,79 @@
+"""Tests for compound node groups, collapsed and expanded in the
+browser."""
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from streamlit_cytoscape import streamlit_cytoscape
+
+
+PAGE_NAME = "Node Groups"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+
+
+def test_group_by_validation():
+    elements = {"nodes": [], "edges": []}
+    with pytest.raises(ValueError):
+        streamlit_cytoscape(elements, group_by="company", view="matrix")
+
+
+def count_elements(root):
+    return root.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return {{
+            groups: cy.nodes("[label='_GROUP']").length,
+            collapsed: cy.nodes("[?_collapsed]").length,
+            members: cy.nodes("[label='PERSON']").length,
+            edges: cy.edges("[!_isGroupEdge]").length,
+            aggregates: cy.edges("[?_isGroupEdge]").length,
+        }};
+    }}"""
+    )
+
+
+def toggle_group(root, group_id):
+    root.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        cy.getElementById("{group_id}").emit("dbltap");
+    }}"""
+    )
+
+
+def test_collapse_and_expand_groups(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    expect(frame.locator("#cy")).to_be_visible()
+    page.wait_for_timeout(1000)
+
+    # 100 people of 5 companies, all collapsed
+    counts = count_elements(root)
+    assert counts["groups"] == counts["collapsed"] == 5
+    assert counts["members"] == 0
+    assert counts["edges"] == 0
+    assert counts["aggregates"] > 0
+
+    # expanded from the browser cache, without rerunning the app
+    for i in range(5):
+        toggle_group(root, f"_group:Company {i}")
+        page.wait_for_timeout(300)
+    counts = count_elements(root)
+    assert counts["collapsed"] == 0
+    assert counts["members"] == 100
+    assert counts["aggregates"] == 0
+    edges = counts["edges"]
+
+    toggle_group(root, "_group:Company 0")
+    page.wait_for_timeout(300)
+    counts = count_elements(root)
+    assert counts["collapsed"] == 1
+    assert 0 < counts["members"] < 100
+    assert counts["edges"] < edges
+
+    toggle_group(root, "_group:Company 0")
+    page.wait_for_timeout(300)
+    assert count_elements(root)["edges"] == edges
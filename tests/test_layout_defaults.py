@@ -0,0 +1,46 @@
+"""Tests for the size-aware defaults of the named layouts."""
+
+import pytest
+
+from streamlit_cytoscape.layouts import (
+    LAYOUTS,
+    SIZE_DEFAULTS,
+    SIZE_THRESHOLDS,
+    _size_tiers,
+    adaptive_layout,
+)
+
+
+def test_adaptive_layout():
+    small = adaptive_layout("cose", SIZE_THRESHOLDS["medium"] - 1)
+    assert small == LAYOUTS["cose"]
+    medium = adaptive_layout("cose", SIZE_THRESHOLDS["medium"])
+    assert medium["numIter"] == 50
+    assert medium["nodeDimensionsIncludeLabels"] is False
+    assert medium["animate"] == "end"
+    large = adaptive_layout("cose", SIZE_THRESHOLDS["large"])
+    assert large["numIter"] == 30
+    assert large["animate"] is False
+    assert adaptive_layout("fcose", 10**5)["quality"] == "draft"
+    # layouts without specific defaults get the common ones
+    assert adaptive_layout("random", 10**5)["animate"] is False
+    with pytest.raises(ValueError):
+        adaptive_layout("unknown", 10)
+
+
+def test_size_tiers():
+    tiers = _size_tiers("cose")
+    assert [t["minNodes"] for t in tiers] == sorted(SIZE_THRESHOLDS.values())
+    assert tiers[0]["options"]["numIter"] == 50
+    assert tiers[1]["options"]["animate"] is False
+    # layouts without specific defaults get the common ones
+    assert _size_tiers("random") == [
+        {"minNodes": threshold, "options": SIZE_DEFAULTS[size]}
+        for size, threshold in SIZE_THRESHOLDS.items()
+    ]
+
+
+def test_size_tiers_thresholds_validated(monkeypatch):
+    monkeypatch.setitem(SIZE_THRESHOLDS, "medium", 0)
+    with pytest.raises(ValueError):
+        _size_tiers("cose")
@@ -0,0 +1,108 @@
+"""Tests for the shared server side layout pool."""
+
+import numpy as np
+import pytest
+
+from streamlit_cytoscape.graph import GraphIndex
+from streamlit_cytoscape.layout_pool import LayoutPool, force_layout
+
+
+def make_elements(n=60, seed=0):
+    """Two clusters of nodes joined by one edge."""
+    rng = np.random.default_rng(seed)
+    half = n // 2
+    edges = []
+    for k in range(2 * n):
+        group = k % 2
+        s, t = rng.integers(0, half, 2) + group * half
+        edges.append(
+            {"data": {"id": f"e{k}", "source": f"n{s}", "target": f"n{t}"}}
+        )
+    edges.append({"data": {"id": "bridge", "source": "n0", "target": "n59"}})
+    nodes = [{"data": {"id": f"n{i}"}} for i in range(n)]
+    return {"nodes": nodes, "edges": edges}
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = LayoutPool(max_workers=1, cache_dir=str(tmp_path))
+    yield pool
+    pool.shutdown()
+
+
+def test_force_layout():
+    index = GraphIndex(make_elements())
+    pos = force_layout(len(index), index.source, index.target, seed=1)
+    assert pos.shape == (60, 2)
+    assert np.isfinite(pos).all()
+    # clusters are apart
+    first, second = pos[:30].mean(0), pos[30:].mean(0)
+    spread = np.linalg.norm(pos[:30] - first, axis=1).mean()
+    assert np.linalg.norm(first - second) > spread
+
+
+def test_requests_coalesced(pool):
+    index = GraphIndex(make_elements())
+    first = pool.submit(index, "force", iterations=20)
+    second = pool.submit(index, "force", iterations=20)
+    assert second is first
+    positions = first.result(timeout=60)
+    assert pool.misses == 1 and pool.coalesced == 1
+
+    # cached, other options are another job
+    assert np.array_equal(pool.positions(index, iterations=20), positions)
+    assert pool.hits == 1
+    pool.positions(index, iterations=10, timeout=60)
+    assert pool.misses == 2
+
+
+def test_lru_eviction(tmp_path):
+    # room for one layout of 60 nodes
+    pool = LayoutPool(max_workers=1, max_bytes=60 * 16)
+    try:
+        a = GraphIndex(make_elements(seed=0))
+        b = GraphIndex(make_elements(seed=1))
+        pool.positions(a, "circle", timeout=60)
+        pool.positions(b, "circle", timeout=60)
+        pool.positions(b, "circle", timeout=60)
+        assert pool.hits == 1
+        pool.positions(a, "circle", timeout=60)
+        assert pool.misses == 3
+    finally:
+        pool.shutdown()
+
+
+def test_disk_persistence(pool, tmp_path):
+    elements = make_elements()
+    positioned = pool.elements(elements, "circle", timeout=60)
+    assert "position" in positioned["nodes"][0]
+
+    restarted = LayoutPool(max_workers=1, cache_dir=str(tmp_path))
+    try:
+        assert restarted.elements(elements, "circle") == positioned
+        assert restarted.hits == 1 and restarted.misses == 0
+    finally:
+        restarted.shutdown()
+
+
+def test_unknown_layout(pool):
+    with pytest.raises(ValueError):
+        pool.submit(make_elements(), "spiral")
+
+
+def test_terminated_worker_restarted(pool):
+    pool.positions(make_elements(), "circle", timeout=60)
+    (worker,) = pool._workers
+    worker.process.kill()
+    worker.process.wait()
+    positions = pool.positions(make_elements(20), "circle", timeout=60)
+    assert positions.shape == (20, 2)
+    assert worker not in pool._workers and len(pool._workers) == 1
+
+
+def test_worker_errors_raised(pool):
+    future = pool.submit(make_elements(), "force", iterations="x")
+    with pytest.raises(TypeError):
+        future.result(60)
+    # the worker is still usable
+    assert pool.positions(make_elements(), "circle", timeout=60).shape
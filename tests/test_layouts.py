@@ -0,0 +1,188 @@
+import pytest
+from playwright.sync_api import Page, expect
+
+from streamlit_cytoscape.layouts import SIZE_THRESHOLDS, adaptive_layout
+
+
+PAGE_NAME = "Layout Algorithms"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+# layouts bundled with Cytoscape, benchmarked in the browser
+BENCHMARKED = ["cose", "grid", "circle", "concentric", "breadthfirst"]
+BUDGET_MS = 5000
+# options of the size tiers checked on the laid out graph
+TIER_OPTIONS = [
+    "numIter",
+    "coolingFactor",
+    "animate",
+    "nodeDimensionsIncludeLabels",
+]
+# same graph on every run: a ring of `n` nodes, each also linked to
+# the nodes 7 and 23 positions further
+GRAPH_ELEMENTS = """
+    const elements = [];
+    for (let i = 0; i < n; i++) {
+        elements.push({ data: { id: `n${i}`, label: "NODE" } });
+    }
+    [1, 7, 23].forEach((step) => {
+        for (let i = 0; i < n; i++) {
+            const data = { id: `e${step}_${i}`, source: `n${i}` };
+            elements.push({ data: { ...data, target: `n${(i + step) % n}` } });
+        }
+    });
+"""
+
+
+def layout_time(iframe, n_nodes, options):
+    """
+    Milliseconds to lay out the graph of `n_nodes` nodes (and three
+    times as many edges) in a headless Cytoscape instance, until
+    layoutstop.
+    """
+    return iframe.evaluate(
+        f"""([n, options]) => new Promise((resolve) => {{
+        {ASSIGN_CY}
+        {GRAPH_ELEMENTS}
+        const graph = new cy.constructor({{
+            headless: true,
+            styleEnabled: true,
+            elements,
+        }});
+        const start = performance.now();
+        const layout = graph.layout(options);
+        layout.one("layoutstop", () => {{
+            const elapsed = performance.now() - start;
+            graph.destroy();
+            resolve(elapsed);
+        }});
+        layout.run();
+    }})""",
+        [n_nodes, options],
+    )
+
+
+@pytest.mark.parametrize("name", BENCHMARKED)
+def test_layout_time_below_thresholds(page: Page, name):
+    """
+    Below each size threshold, the defaults of the smaller size lay
+    out the graph within the budget.
+    """
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    expect(frame.locator("#cy")).to_be_visible()
+    root = frame.locator(":root")
+
+    for threshold in sorted(SIZE_THRESHOLDS.values()):
+        n_nodes = threshold - 1
+        elapsed = layout_time(root, n_nodes, adaptive_layout(name, n_nodes))
+        print(f"{name}: {n_nodes} nodes in {elapsed:.0f} ms")
+        assert elapsed < BUDGET_MS
+
+
+def replace_graph(iframe, n_nodes):
+    """
+    Replaces the elements of the displayed graph by the graph of
+    `n_nodes` nodes, and records the options of the next cose layout
+    run on it.
+    """
+    iframe.evaluate(
+        f"""(n) => {{
+        {ASSIGN_CY}
+        {GRAPH_ELEMENTS}
+        cy.json({{ elements }});
+        window.coseOptions = null;
+        cy.on("layoutstart", (event) => {{
+            if (event.layout.options.name === "cose") {{
+                window.coseOptions = event.layout.options;
+            }}
+        }});
+    }}""",
+        n_nodes,
+    )
+
+
+def cose_options(iframe, keys, timeout=10000):
+    """
+    Waits for the cose layout recorded by `replace_graph`, returns its
+    options in `keys`.
+    """
+    return iframe.evaluate(
+        """([keys, timeout]) => new Promise((resolve) => {
+        const start = performance.now();
+        const check = () => {
+            const options = window.coseOptions;
+            if (options || performance.now() - start > timeout) {
+                resolve(
+                    options &&
+                        Object.fromEntries(keys.map((k) => [k, options[k]]))
+                );
+            } else {
+                setTimeout(check, 100);
+            }
+        };
+        check();
+    })""",
+        [keys, timeout],
+    )
+
+
+def test_size_options_applied(page: Page):
+    """
+    The layout run in the browser gets the options of the size tiers
+    reached by the number of nodes laid out.
+    """
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    expect(frame.locator("#cy")).to_be_visible()
+    root = frame.locator(":root")
+
+    medium, large = SIZE_THRESHOLDS["medium"], SIZE_THRESHOLDS["large"]
+    for n_nodes in [medium - 1, medium, large]:
+        replace_graph(root, n_nodes)
+        # the layout is run again when it changes
+        for name in ["grid", "cose"]:
+            page.get_by_test_id("stSelectbox").click()
+            page.get_by_role("option", name=name, exact=True).click()
+            page.wait_for_load_state("networkidle")
+        expected = adaptive_layout("cose", n_nodes)
+        keys = [k for k in TIER_OPTIONS if k in expected]
+        options = cose_options(root, keys)
+        assert options == {k: expected[k] for k in keys}
+
+
+def loaded_chunks(iframe):
+    return iframe.evaluate(
+        """() => performance
+            .getEntriesByType("resource")
+            .map((entry) => entry.name.split("/").pop())
+            .filter((name) => name.endsWith(".chunk.js"))"""
+    )
+
+
+def test_layout_extensions_lazy_loaded(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    expect(frame.locator("#cy")).to_be_visible()
+    root = frame.locator(":root")
+
+    startup = root.evaluate(
+        """() => performance
+            .getEntriesByName("streamlit-cytoscape:startup")
+            .map((entry) => entry.duration)"""
+    )
+    assert len(startup) == 1
+    print(f"startup: {startup[0]:.0f} ms")
+    # cose is bundled with Cytoscape
+    assert not any(c.startswith("layout-") for c in loaded_chunks(root))
+
+    page.get_by_test_id("stSelectbox").click()
+    page.get_by_role("option", name="fcose").click()
+    page.wait_for_load_state("networkidle")
+    expect(root).to_be_visible()
+    page.wait_for_timeout(1000)
+    chunks = loaded_chunks(root)
+    assert any(c.startswith("layout-fcose") for c in chunks)
+    assert not any(c.startswith("layout-cola") for c in chunks)
@@ -0,0 +1,91 @@
+from playwright.sync_api import Page, expect
+import json
+import re
+
+
+PAGE_NAME = "Legend"
+NODE_ID = "n1"  # PERSON node in social.json
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+
+
+def AWAIT_RETURN_ACTION(page):
+    page.get_by_text('"action":"').click(timeout=10000)
+
+
+def count_visible(label, iframe):
+    return iframe.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return cy.nodes('[label="{label}"]').filter(':visible').length;
+    }}"""
+    )
+
+
+def get_node_pos(_id, iframe):
+    pos = iframe.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return cy.getElementById("{_id}").renderedPosition();
+    }}"""
+    )
+    return pos
+
+
+def get_return_json(page: Page):
+    data = (
+        page.get_by_test_id("stJson")
+        .text_content()
+        .replace('""', '","')
+        .replace('}"', '},"')
+    )
+    data = re.sub("([0-9]+):", "", data)
+    # separators after number / null values and arrays
+    data = re.sub(r'(:-?[0-9.]+|:null|:true|:false|\])"', r'\1,"', data)
+    return json.loads(data)
+
+
+def test_legend_lists_style_labels(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    items = frame.locator(".legend__item")
+    expect(items).to_have_count(5, timeout=10000)
+    expect(items.first).to_contain_text("PERSON")
+
+
+def test_legend_toggle_without_rerun(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    root.click(position={"x": 0, "y": 0})  # await and scroll to view
+    expect(page.get_by_text("Total Number of runs: 1")).to_be_visible()
+    assert count_visible("POST", root) > 0
+
+    item = frame.locator(".legend__item[data-key='nodes:POST']")
+    item.click()
+    expect(item).to_have_attribute("data-hidden", "true")
+    assert count_visible("POST", root) == 0
+    page.wait_for_timeout(500)
+    expect(page.get_by_text("Total Number of runs: 1")).to_be_visible()
+
+    item.click()
+    expect(item).to_have_attribute("data-hidden", "false")
+    assert count_visible("POST", root) > 0
+
+
+def test_hidden_labels_reported_lazily(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    root.click(position={"x": 0, "y": 0})  # await and scroll to view
+
+    frame.locator(".legend__item[data-key='nodes:POST']").click()
+    root.click(position=get_node_pos(NODE_ID, root))
+    AWAIT_RETURN_ACTION(page)
+    data = get_return_json(page)
+
+    assert data["action"] == "clicked_node"
+    assert data["hidden_labels"] == {"nodes": ["POST"], "edges": []}
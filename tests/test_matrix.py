@@ -0,0 +1,103 @@
+"""Tests for the adjacency matrix view and its orderings."""
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from streamlit_cytoscape.graph import GraphIndex
+from streamlit_cytoscape.matrix import clusters, matrix_order, _matrix_args
+
+
+PAGE_NAME = "Adjacency Matrix"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+
+
+def make_graph():
+    """Two triangles a-b-c and x-y-z joined by c-x, plus 'w' alone."""
+    nodes = [
+        {"data": {"id": i, "label": "B" if i in "xyz" else "A"}}
+        for i in "zyxwcba"
+    ]
+    pairs = [
+        ("a", "b"),
+        ("b", "c"),
+        ("c", "a"),
+        ("x", "y"),
+        ("y", "z"),
+        ("z", "x"),
+        ("c", "x"),
+    ]
+    edges = [
+        {"data": {"id": f"e{k}", "source": s, "target": t}}
+        for k, (s, t) in enumerate(pairs)
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+def test_label_and_degree_orders():
+    elements = make_graph()
+    assert matrix_order(elements, "label") == list("abcwxyz")
+    # by decreasing degree, ties in the order of the nodes
+    assert matrix_order(elements, "degree") == list("xczybaw")
+
+
+def test_cluster_order():
+    index = GraphIndex(make_graph())
+    cluster = dict(zip(index.ids, clusters(index).tolist()))
+    assert cluster["a"] == cluster["b"] == cluster["c"]
+    assert cluster["x"] == cluster["y"] == cluster["z"]
+    assert cluster["a"] != cluster["x"]
+    # the isolated node is the smallest cluster
+    assert cluster["w"] == max(cluster.values())
+
+    args = _matrix_args(index, "cluster")
+    ids, groups = args["ids"], args["groups"]
+    assert groups == sorted(groups)
+    # nodes of a cluster are contiguous
+    assert {ids.index(i) for i in "abc"} in ({0, 1, 2}, {3, 4, 5})
+    assert ids[-1] == "w"
+
+
+def test_matrix_order_validation():
+    with pytest.raises(ValueError):
+        matrix_order(make_graph(), "pagerank")
+
+
+def test_matrix_cell_selection(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    canvas = frame.locator("#matrix")
+    expect(canvas).to_be_visible()
+    expect(frame.locator("#viewbar")).to_be_hidden()
+
+    # 200 nodes by default: one cell per node pair and no labels
+    side, n_nodes = root.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        const canvas = document.getElementById("matrix");
+        const side = Math.min(canvas.clientWidth, canvas.clientHeight);
+        return [side, cy.nodes(":visible").length];
+    }}"""
+    )
+    step = side / n_nodes
+    # first non-empty cell of the first row
+    for col in range(1, n_nodes):
+        canvas.click(
+            position={"x": (col + 0.5) * step, "y": 0.5 * step},
+            force=True,
+        )
+        selected = root.evaluate(
+            f"""() => {{
+            {ASSIGN_CY}
+            return cy.edges(":selected").length;
+        }}"""
+        )
+        if selected:
+            break
+    assert selected > 0
+    # the selection is shown by the info panel, as in the graph view
+    expect(frame.locator("#infopanel")).not_to_have_text(
+        "No selected elements"
+    )
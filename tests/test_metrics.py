@@ -0,0 +1,57 @@
+"""Tests for the vectorized node metrics."""
+
+import numpy as np
+import pytest
+
+from streamlit_cytoscape import NodeStyle
+from streamlit_cytoscape.graph import GraphIndex
+from streamlit_cytoscape.metrics import compute_metrics, core_number, pagerank
+
+
+def make_graph():
+    """Triangle a-b-c with a tail c-d, plus an isolated node 'z'."""
+    nodes = [{"data": {"id": i}} for i in "abcdz"]
+    pairs = [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")]
+    edges = [
+        {"data": {"id": f"e{k}", "source": s, "target": t, "w": k + 1}}
+        for k, (s, t) in enumerate(pairs)
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+def test_degrees():
+    metrics = compute_metrics(make_graph(), weight="w")
+    assert metrics["degree"].tolist() == [2, 2, 3, 1, 0]
+    assert metrics["weighted_degree"].tolist() == [4, 3, 9, 4, 0]
+
+
+def test_pagerank():
+    rank = pagerank(GraphIndex(make_graph()))
+    assert rank.sum() == pytest.approx(1.0)
+    # d only receives from c, the dangling node spreads uniformly
+    assert rank[4] == pytest.approx(rank.min())
+    assert np.argmax(rank) in (2, 3)
+
+
+def test_core_number():
+    assert core_number(GraphIndex(make_graph())).tolist() == [2, 2, 2, 1, 0]
+
+
+def test_metrics_cached_by_fingerprint():
+    first = compute_metrics(make_graph(), ["core"])
+    assert compute_metrics(make_graph(), ["core"]) is first
+    assert compute_metrics(make_graph(), ["degree"]) is not first
+    with pytest.raises(ValueError):
+        compute_metrics(make_graph(), ["betweenness"])
+
+
+def test_metrics_elements_and_styles():
+    metrics = compute_metrics(make_graph(), ["degree"])
+    elements = metrics.elements()
+    assert elements["nodes"][2]["data"] == {"id": "c", "_degree": 3}
+    assert "_degree" not in make_graph()["nodes"][2]["data"]
+
+    size = metrics.map_data("degree", 10, 40)
+    assert size == "mapData(_degree, 0.0, 3.0, 10, 40)"
+    style = NodeStyle("PERSON", size=size).dump()["style"]
+    assert style["width"] == style["height"] == size
@@ -172,3 +172,28 @@ def test_switch_back_to_tab1(page: Page):
     )
     assert dims["width"] > 0, "Tab 1 container should still have width"
     assert dims["height"] > 0, "Tab 1 container should still have height"
+
+
+def test_tab3_shares_registered_elements(page: Page):
+    """Test that Tab 3 renders the elements registered for Tab 1."""
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    page.wait_for_selector(FRAME_LOCATOR, timeout=10000)
+
+    page.get_by_role("tab", name="Tab 3").click()
+    page.wait_for_load_state("networkidle")
+    page.wait_for_timeout(500)
+
+    frame = page.frame_locator(FRAME_LOCATOR).nth(2).locator(":root")
+    counts = get_elements_count(frame)
+    assert counts["nodes"] == 5, "Tab 3 graph should have Tab 1's 5 nodes"
+    assert counts["edges"] == 4, "Tab 3 graph should have Tab 1's 4 edges"
+
+    # Both instances resolved the handle from the shared cache
+    shared = frame.evaluate(
+        """() => {
+        const store = window.parent.__streamlitCytoscapeDatasets;
+        return store ? store.size : 0;
+    }"""
+    )
+    assert shared == 1, "Graph A should be stored once for both tabs"
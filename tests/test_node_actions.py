@@ -1,7 +1,10 @@
 from playwright.sync_api import Page, expect
 import json
+import math
 import re
 
+import pytest
+
 
 PAGE_NAME = "Node Actions"
 NODE_ID = "c"
@@ -37,6 +40,8 @@ def get_return_json(page: Page):
         .replace('}"', '},"')
     )
     data = re.sub("([0-9]+):", "", data)
+    # separators after number / null values and arrays
+    data = re.sub(r'(:-?[0-9.]+|:null|:true|:false|\])"', r'\1,"', data)
     return json.loads(data)
 
 
@@ -109,3 +114,156 @@ def test_remove_button(page: Page):
 
     assert data["action"] == "remove"
     assert data["data"]["node_ids"][0] == NODE_ID
+
+
+def test_expand_depth_and_limit(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first.locator(":root")
+    frame.click(position={"x": 0, "y": 0})  # await and scroll to view
+
+    pos = get_node_pos(NODE_ID, frame)
+    frame.dblclick(position=pos)
+    AWAIT_SELECT(frame)
+    data = get_return_json(page)
+
+    assert data["action"] == "expand"
+    assert data["data"]["depth"] == 1
+    assert data["data"]["limit"] is None
+
+
+def node_displayed(_id, iframe, displayed=True, timeout=10000):
+    """
+    Waits until the node is (or is no longer) displayed, returns
+    whether it is.
+    """
+    return iframe.evaluate(
+        f"""([id, displayed, timeout]) => new Promise((resolve) => {{
+        {ASSIGN_CY}
+        const start = performance.now();
+        const check = () => {{
+            const found = cy.getElementById(id).nonempty();
+            if (found === displayed || performance.now() - start > timeout) {{
+                resolve(found);
+            }} else {{
+                setTimeout(check, 100);
+            }}
+        }};
+        check();
+    }})""",
+        [_id, displayed, timeout],
+    )
+
+
+def placeholder_id(_id, iframe, timeout=10000):
+    """
+    Waits for the "load more" placeholder of node `_id`, returns its id.
+    """
+    return iframe.evaluate(
+        f"""([id, timeout]) => new Promise((resolve) => {{
+        {ASSIGN_CY}
+        const start = performance.now();
+        const check = () => {{
+            const found = cy
+                .nodes()
+                .filter((n) => n.id().startsWith(`_more:${{id}}:`));
+            if (found.nonempty() || performance.now() - start > timeout) {{
+                resolve(found.nonempty() ? found.id() : null);
+            }} else {{
+                setTimeout(check, 100);
+            }}
+        }};
+        check();
+    }})""",
+        [_id, timeout],
+    )
+
+
+def test_expanded_placeholder_removed(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    page.get_by_label("Max neighbors per expanded node").fill("1")
+    page.keyboard.press("Enter")
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first.locator(":root")
+    frame.click(position={"x": 0, "y": 0})  # await and scroll to view
+
+    # "a" has 3 neighbors: with 2 of them hidden, expanding it shows one
+    # and a placeholder for the other, visible neighbors are not counted
+    remove_node("ea1", page, frame)
+    remove_node("ea2", page, frame)
+    frame.dblclick(position=get_node_pos("a", frame))
+    placeholder = placeholder_id("a", frame)
+    assert placeholder is not None
+    assert node_displayed("ea1", frame) != node_displayed("ea2", frame)
+
+    frame.dblclick(position=get_node_pos(placeholder, frame))
+    assert not node_displayed(placeholder, frame, displayed=False)
+    assert node_displayed("ea1", frame)
+    assert node_displayed("ea2", frame)
+
+
+def settled_positions(iframe, interval=500):
+    """
+    Waits until no node moves for `interval` ms (layouts done), returns
+    the node positions by id.
+    """
+    return iframe.evaluate(
+        f"""(interval) => new Promise((resolve) => {{
+        {ASSIGN_CY}
+        const snapshot = () => JSON.stringify(
+            Object.fromEntries(cy.nodes().map((n) => [n.id(), n.position()]))
+        );
+        let last = snapshot();
+        const check = () => {{
+            const current = snapshot();
+            if (current === last) {{
+                resolve(JSON.parse(current));
+            }} else {{
+                last = current;
+                setTimeout(check, interval);
+            }}
+        }};
+        setTimeout(check, interval);
+    }})""",
+        interval,
+    )
+
+
+def remove_node(_id, page, iframe):
+    iframe.click(position=get_node_pos(_id, iframe))
+    AWAIT_SELECT(iframe)
+    page.keyboard.down("Delete")
+    assert get_return_json(page)["data"]["node_ids"] == [_id]
+    assert not node_displayed(_id, iframe, displayed=False)
+
+
+def test_expand_lays_out_added_nodes_only(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first.locator(":root")
+    frame.click(position={"x": 0, "y": 0})  # await and scroll to view
+
+    # "ea1" and "ea2" only neighbor "a": expanding it adds them back
+    remove_node("ea1", page, frame)
+    remove_node("ea2", page, frame)
+    before = settled_positions(frame)
+
+    frame.dblclick(position=get_node_pos("a", frame))
+    assert node_displayed("ea1", frame)
+    assert node_displayed("ea2", frame)
+    after = settled_positions(frame)
+
+    for _id, pos in before.items():
+        assert after[_id]["x"] == pytest.approx(pos["x"], abs=1)
+        assert after[_id]["y"] == pytest.approx(pos["y"], abs=1)
+    # the added nodes are placed next to the expanded node
+    for _id in ["ea1", "ea2"]:
+        nearest = min(
+            before,
+            key=lambda n: math.dist(
+                (after[_id]["x"], after[_id]["y"]),
+                (before[n]["x"], before[n]["y"]),
+            ),
+        )
+        assert nearest == "a"
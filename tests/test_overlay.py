@@ -0,0 +1,52 @@
+"""Tests for per-session overlays of a shared base graph."""
+
+from streamlit_cytoscape.graph import GraphIndex
+from streamlit_cytoscape.overlay import GraphOverlay
+
+ELEMENTS = {
+    "nodes": [{"data": {"id": i}} for i in ["a", "b", "c", "d"]],
+    "edges": [
+        {"data": {"id": "ab", "source": "a", "target": "b"}},
+        {"data": {"id": "bc", "source": "b", "target": "c"}},
+        {"data": {"id": "cd", "source": "c", "target": "d"}},
+    ],
+}
+
+
+def ids(elements, group="nodes"):
+    return {el["data"]["id"] for el in elements[group]}
+
+
+def test_overlay_does_not_modify_base():
+    base = GraphIndex(ELEMENTS)
+    overlay = GraphOverlay(base, ["a"])
+    overlay.expand(["a"], depth=2)
+    overlay.remove(["a"])
+    assert ids(overlay.elements()) == {"b", "c"}
+    assert ids(overlay.elements(), "edges") == {"bc"}
+    assert ids(GraphOverlay(base).elements()) == {"a", "b", "c", "d"}
+    assert len(base.edges) == 3
+
+
+def test_overlay_handle_changes_with_edits():
+    overlay = GraphOverlay(GraphIndex(ELEMENTS), ["a"])
+    handle = overlay.handle
+    assert overlay.handle_action(
+        {"action": "expand", "data": {"node_ids": ["a"], "depth": 1}}
+    )
+    assert overlay.handle != handle
+    assert not overlay.handle_action({"action": "clicked_node", "data": {}})
+
+
+def test_overlay_added_elements():
+    overlay = GraphOverlay(GraphIndex(ELEMENTS), ["a"])
+    overlay.add(
+        {
+            "nodes": [{"data": {"id": "note"}}],
+            "edges": [{"data": {"id": "n", "source": "a", "target": "note"}}],
+        }
+    )
+    assert ids(overlay.elements()) == {"a", "note"}
+    assert ids(overlay.elements(), "edges") == {"n"}
+    overlay.remove(["note"])
+    assert ids(overlay.elements(), "edges") == set()
@@ -0,0 +1,78 @@
+"""Tests for the profiling hooks and payload counters."""
+
+import json
+
+import pytest
+
+from streamlit_cytoscape import profiling
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    yield
+    profiling.enable_counters(False)
+    profiling.reset_counters()
+
+
+def make_call(key="graph"):
+    call = profiling._start(key)
+    with call.phase("styles"):
+        pass
+    call.measure(
+        {
+            "elements": {"nodes": [{"data": {"id": "a"}}], "edges": []},
+            "elementsKey": None,
+            "style": [],
+            "layout": {"name": "cose"},
+            "events": [],
+            "height": "500px",
+        }
+    )
+    profiling._finish(call)
+    return call
+
+
+def test_inactive_by_default():
+    assert profiling._start("graph") is None
+
+
+def test_payload_sizes_by_group():
+    with profiling.profile() as calls:
+        call = make_call()
+    assert calls == [call]
+    elements = {"nodes": [{"data": {"id": "a"}}], "edges": []}
+    assert call.sizes["elements"] == len(json.dumps(elements)) + 4
+    assert call.sizes["layout"] == len('{"name": "cose"}')
+    assert call.sizes["other"] == len('"500px"')
+    assert set(call.timings) == {"styles", "serialize"}
+    assert call.total_bytes == sum(call.sizes.values())
+    # collection stops with the block
+    assert profiling._start("graph") is None
+
+
+def test_hooks():
+    received = []
+    profiling.add_hook(received.append)
+    try:
+        call = make_call()
+    finally:
+        profiling.remove_hook(received.append)
+    assert received == [call]
+
+
+def test_prometheus_text():
+    profiling.enable_counters()
+    call = make_call('a "b"')
+    make_call('a "b"')
+    text = profiling.prometheus_text()
+    assert "# TYPE streamlit_cytoscape_calls_total counter" in text
+    assert 'streamlit_cytoscape_calls_total{key="a \\"b\\""} 2' in text
+    total = call.sizes["elements"] * 2
+    assert (
+        'streamlit_cytoscape_payload_bytes_total{key="a \\"b\\"",'
+        f'group="elements"}} {total}'
+    ) in text
+    assert (
+        'streamlit_cytoscape_payload_bytes_max{key="a \\"b\\"",'
+        f'group="elements"}} {call.sizes["elements"]}'
+    ) in text
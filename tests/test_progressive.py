@@ -0,0 +1,49 @@
+from playwright.sync_api import Page, expect
+
+
+PAGE_NAME = "Progressive Loading"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+N_NODES = 10000  # default of the demo page
+
+
+def count_elements(iframe):
+    return iframe.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return [cy.nodes().length, cy.edges().length];
+    }}"""
+    )
+
+
+def test_progressive_loading(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    progress = frame.locator("#progress")
+
+    # hidden once every element is added
+    expect(progress).to_have_attribute("data-visible", "false", timeout=30000)
+    nodes, edges = count_elements(root)
+    assert nodes == N_NODES
+    assert edges == 2 * N_NODES
+
+
+def test_preset_positions_kept(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    expect(frame.locator("#progress")).to_have_attribute(
+        "data-visible", "false", timeout=30000
+    )
+    # no layout run: nodes are not on the placeholder grid
+    positions = root.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return cy.nodes().slice(0, 2).map((n) => n.position());
+    }}"""
+    )
+    assert positions[0] != {"x": 0, "y": 0}
+    assert positions[1] != {"x": 60, "y": 0}
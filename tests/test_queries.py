@@ -0,0 +1,67 @@
+"""Tests for the path and neighborhood queries over a GraphIndex."""
+
+import pytest
+
+from streamlit_cytoscape.graph import GraphIndex
+from streamlit_cytoscape.queries import (
+    Highlight,
+    common_neighbors,
+    shortest_path,
+    simple_paths,
+)
+
+
+def make_graph():
+    """Square a-b-c-d-a with a weighted shortcut a-c and a lone 'z'."""
+    nodes = [{"data": {"id": i}} for i in "abcdz"]
+    pairs = [("a", "b", 1), ("b", "c", 1), ("c", "d", 1), ("d", "a", 1)]
+    pairs += [("a", "c", 5), ("a", "b", 1)]  # parallel a-b edge
+    edges = [
+        {"data": {"id": f"e{k}", "source": s, "target": t, "w": w}}
+        for k, (s, t, w) in enumerate(pairs)
+    ]
+    return GraphIndex({"nodes": nodes, "edges": edges}, weight="w")
+
+
+def test_shortest_path():
+    index = make_graph()
+    result = shortest_path(index, "a", "c")
+    assert result.paths == [["a", "c"]]
+    assert result.edge_ids == ["e4"]
+    weighted = shortest_path(index, "a", "c", weighted=True)
+    assert len(weighted.paths[0]) == 3
+    assert not shortest_path(index, "a", "z")
+
+
+def test_shortest_path_parallel_edges():
+    result = shortest_path(make_graph(), "b", "d")
+    assert result.paths in ([["b", "a", "d"]], [["b", "c", "d"]])
+    if result.paths == [["b", "a", "d"]]:
+        assert result.edge_ids == ["e0", "e3", "e5"]
+
+
+def test_simple_paths():
+    index = make_graph()
+    result = simple_paths(index, "a", "c", max_length=2)
+    assert result.paths[0] == ["a", "c"]
+    assert sorted(result.paths[1:]) == [["a", "b", "c"], ["a", "d", "c"]]
+    assert len(simple_paths(index, "a", "c", 3, limit=1).paths) == 1
+    assert len(simple_paths(index, "b", "d", 3).paths) == 4
+
+
+def test_common_neighbors():
+    result = common_neighbors(make_graph(), ["b", "d"])
+    assert set(result.node_ids) == {"b", "d", "a", "c"}
+    assert set(result.edge_ids) == {"e0", "e1", "e2", "e3", "e5"}
+    with pytest.raises(ValueError):
+        common_neighbors(make_graph(), ["b"])
+
+
+def test_highlight_dump():
+    dump = Highlight(["a"], ["e1"], fade=False).dump()
+    assert dump == {
+        "nodes": ["a"],
+        "edges": ["e1"],
+        "focus": True,
+        "fade": False,
+    }
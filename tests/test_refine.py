@@ -0,0 +1,62 @@
+from playwright.sync_api import Page, expect
+
+
+PAGE_NAME = "Layout Refinement"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+
+
+def run_refine(iframe, options):
+    """
+    Runs the 'refine' layout, returns the mean edge length once the
+    initial positions are set and once refined.
+    """
+    return iframe.evaluate(
+        f"""(options) => new Promise((resolve) => {{
+        {ASSIGN_CY}
+        const mean = () => cy.edges().reduce((sum, e) => {{
+            const s = e.source().position();
+            const t = e.target().position();
+            return sum + Math.hypot(s.x - t.x, s.y - t.y);
+        }}, 0) / cy.edges().length;
+        let ready;
+        const layout = cy.layout({{ name: "refine", ...options }});
+        layout.one("layoutready", () => (ready = mean()));
+        layout.one("layoutstop", () => resolve([ready, mean()]));
+        layout.run();
+    }})""",
+        options,
+    )
+
+
+def test_refine_layout(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    expect(frame.locator("#cy")).to_be_visible()
+
+    initial, refined = run_refine(
+        root, {"initial": "grid", "rounds": 3, "animationDuration": 0}
+    )
+    # clustered graph: edges get shorter than on the grid
+    assert refined < initial
+
+
+def test_refine_stopped_by_layout(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    expect(frame.locator("#cy")).to_be_visible()
+
+    stopped = root.evaluate(
+        f"""() => new Promise((resolve) => {{
+        {ASSIGN_CY}
+        const layout = cy.layout({{ name: "refine", rounds: 50 }});
+        layout.one("layoutstop", () => resolve(true));
+        layout.run();
+        cy.layout({{ name: "grid" }}).run();
+    }})"""
+    )
+    assert stopped
@@ -0,0 +1,89 @@
+"""Tests for the graph sampling utilities."""
+
+import numpy as np
+import pytest
+
+from streamlit_cytoscape import GraphIndex
+from streamlit_cytoscape.sampling import (
+    METHODS,
+    bfs_tree,
+    sample_elements,
+    sample_nodes,
+)
+
+
+def make_graph(n=400, seed=0):
+    """Random graph with hubs, plus an isolated pair 'x'-'y'."""
+    rng = np.random.default_rng(seed)
+    hubs = rng.pareto(1.5, n) + 1
+    source = rng.choice(n, 3 * n, p=hubs / hubs.sum())
+    target = rng.integers(0, n, 3 * n)
+    nodes = [{"data": {"id": f"n{i}"}} for i in range(n)]
+    nodes += [{"data": {"id": "x"}}, {"data": {"id": "y"}}]
+    edges = [
+        {"data": {"id": f"e{k}", "source": f"n{s}", "target": f"n{t}"}}
+        for k, (s, t) in enumerate(zip(source.tolist(), target.tolist()))
+    ]
+    edges.append({"data": {"id": "xy", "source": "x", "target": "y"}})
+    return {"nodes": nodes, "edges": edges}
+
+
+def is_connected(elements):
+    index = GraphIndex(elements)
+    return bool((bfs_tree(index, 0) >= 0).all())
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_samples_connected_and_seeded(method):
+    index = GraphIndex(make_graph())
+    node_ids = sample_nodes(index, 50, method, seed=3)
+    assert len(node_ids) == len(set(node_ids)) == 50
+    assert is_connected(index.subgraph(node_ids))
+    assert "x" not in node_ids
+    assert sample_nodes(make_graph(), 50, method, seed=3) == node_ids
+
+
+def test_sample_of_small_component():
+    index = GraphIndex(make_graph())
+    for method in METHODS:
+        assert sorted(sample_nodes(index, 10, method, start="x")) == [
+            "x",
+            "y",
+        ]
+
+
+def test_top_k_sample():
+    index = GraphIndex(make_graph())
+    node_ids = sample_nodes(index, 20, "top_k", metric="degree")
+    # the highest degree node first, the others connected to it
+    assert node_ids[0] == index.ids[int(np.argmax(index.degree))]
+    scores = np.zeros(len(index))
+    scores[index.position("n7")] = 1.0
+    assert sample_nodes(index, 5, "top_k", metric=scores)[0] == "n7"
+
+
+def test_sample_elements():
+    elements = sample_elements(make_graph(), 30, "random_walk", seed=1)
+    assert len(elements["nodes"]) == 30
+    assert is_connected(elements)
+
+
+def test_sampling_validation():
+    with pytest.raises(ValueError):
+        sample_nodes(make_graph(), 10, "snowball")
+    with pytest.raises(ValueError):
+        sample_nodes(make_graph(), 0)
+    with pytest.raises(ValueError):
+        sample_nodes(make_graph(), 10, "top_k", metric=[1.0, 2.0])
+    with pytest.raises(ValueError, match="accepted options: \\['burn'\\]"):
+        sample_nodes(make_graph(), 10, "forest_fire", restart=0.1)
+    with pytest.raises(ValueError, match="accepted options: \\[\\]"):
+        sample_nodes(make_graph(), 10, "top_k", burn=0.5)
+
+
+def test_cached_sample_not_shared():
+    graph = GraphIndex(make_graph())
+    sample = sample_nodes(graph, 10, "random_walk", seed=1)
+    sample.append("X")
+    again = sample_nodes(graph, 10, "random_walk", seed=1)
+    assert "X" not in again and len(again) == 10
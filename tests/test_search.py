@@ -0,0 +1,42 @@
+from playwright.sync_api import Page, expect
+
+
+PAGE_NAME = "Search"
+NODE_ID = "p12"  # Joseph Guerra in claims.json
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+
+
+def get_selected(iframe):
+    return iframe.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return cy.$(':selected').map((n) => n.id());
+    }}"""
+    )
+
+
+def test_search_results_ranked(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    search = frame.locator("#toolbarSearchInput")
+    expect(search).to_be_visible(timeout=10000)
+
+    search.fill("guerra")
+    results = frame.locator(".search__result")
+    expect(results.first).to_have_text("Joseph Guerra", timeout=10000)
+
+
+def test_search_selects_node(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    search = frame.locator("#toolbarSearchInput")
+    expect(search).to_be_visible(timeout=10000)
+
+    search.fill("joseph gue")
+    expect(frame.locator(".search__result").first).to_be_visible()
+    search.press("Enter")
+    expect(frame.locator("#infopanelLabel")).to_contain_text("PERSON")
+    assert get_selected(frame.locator(":root")) == [NODE_ID]
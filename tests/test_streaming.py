@@ -0,0 +1,155 @@
+"""Tests for the bounded retention and increments of element streams."""
+
+from queue import Queue
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from streamlit_cytoscape import streaming
+from streamlit_cytoscape.streaming import ElementStream
+
+PAGE_NAME = "Live Streaming"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+MAX_ELEMENTS = 300  # default of the demo page
+
+
+def node(i):
+    return {"data": {"id": f"n{i}", "label": "NODE"}}
+
+
+def edge(i, source, target):
+    return {
+        "data": {"id": f"e{i}", "source": f"n{source}", "target": f"n{target}"}
+    }
+
+
+def ids(elements):
+    return [el["data"]["id"] for g in ("nodes", "edges") for el in elements[g]]
+
+
+def test_increments():
+    stream = ElementStream()
+    stream.push({"nodes": [node(1), node(2)], "edges": [edge(1, 1, 2)]})
+    version = stream.version
+    stream.push({"nodes": [node(3)], "edges": [edge(2, 2, 3)]})
+
+    elements, evicted = stream.changes(version)
+    assert ids(elements) == ["n3", "e2"]
+    assert evicted == []
+    # whole window
+    elements, evicted = stream.changes(None)
+    assert ids(elements) == ["n1", "n2", "n3", "e1", "e2"]
+    assert evicted is None
+
+
+def test_max_elements_evicts_oldest_first():
+    stream = ElementStream(max_elements=4)
+    stream.push({"nodes": [node(1), node(2)], "edges": [edge(1, 1, 2)]})
+    version = stream.version
+    stream.push({"nodes": [node(3)], "edges": [edge(2, 2, 3)]})
+
+    # evicting n1 evicts its edge
+    assert len(stream) == 3
+    assert ids(stream.elements()) == ["n2", "n3", "e2"]
+    elements, evicted = stream.changes(version)
+    assert ids(elements) == ["n3", "e2"]
+    assert sorted(evicted) == ["e1", "n1"]
+
+
+def test_push_again_refreshes():
+    stream = ElementStream(max_elements=2)
+    stream.push({"nodes": [node(1), node(2)]})
+    version = stream.version
+    stream.push({"nodes": [{"data": {"id": "n1", "label": "UPDATED"}}]})
+    stream.push({"nodes": [node(3)]})
+
+    assert ids(stream.elements()) == ["n1", "n3"]
+    elements, evicted = stream.changes(version)
+    assert elements["nodes"][0]["data"]["label"] == "UPDATED"
+    assert evicted == ["n2"]
+
+
+def test_window(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(streaming.time, "monotonic", lambda: now[0])
+    stream = ElementStream(window=10)
+    stream.push({"nodes": [node(1)]})
+    now[0] = 105.0
+    stream.push({"nodes": [node(2)]})
+    version = stream.version
+
+    # expired without a push: a new version
+    now[0] = 112.0
+    elements, evicted = stream.changes(version)
+    assert stream.version == version + 1
+    assert ids(elements) == []
+    assert evicted == ["n1"]
+    assert ids(stream.elements()) == ["n2"]
+
+
+def test_history_exceeded(monkeypatch):
+    monkeypatch.setattr(streaming, "HISTORY", 2)
+    stream = ElementStream(max_elements=1)
+    stream.push({"nodes": [node(1)]})
+    version = stream.version
+    for i in range(2, 5):
+        stream.push({"nodes": [node(i)]})
+
+    # the evicted IDs since the version are no longer known
+    elements, evicted = stream.changes(version)
+    assert evicted is None
+    assert ids(elements) == ["n4"]
+
+
+def test_invalid_elements():
+    stream = ElementStream()
+    stream.push({"nodes": [node(1)]})
+    with pytest.raises(ValueError, match="unknown node"):
+        stream.push({"edges": [edge(1, 1, 2)]})
+    loop = {"data": {"id": "n2", "source": "n1", "target": "n1"}}
+    with pytest.raises(ValueError, match="both a node and an edge"):
+        stream.push({"nodes": [node(2)], "edges": [loop]})
+    # nothing pushed by failed batches
+    assert ids(stream.elements()) == ["n1"]
+    with pytest.raises(ValueError):
+        ElementStream(max_elements=0)
+
+
+def test_consume():
+    stream = ElementStream()
+    queue = Queue()
+    queue.put({"nodes": [node(1)]})
+    queue.put({"nodes": [node(2)]})
+    assert stream.consume(queue) == 2
+    assert stream.consume(queue) == 0
+
+    batches = ({"nodes": [node(i)]} for i in range(3, 10))
+    assert stream.consume(batches, max_batches=3) == 3
+    assert ids(stream.elements()) == ["n1", "n2", "n3", "n4", "n5"]
+
+
+def count_elements(iframe):
+    return iframe.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return cy.elements().length;
+    }}"""
+    )
+
+
+def test_live_stream(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    expect(frame.locator("#cy")).to_be_visible()
+
+    # increments are added every second, up to the retention bound
+    page.wait_for_timeout(3000)
+    first = count_elements(root)
+    assert first > 0
+    page.wait_for_timeout(3000)
+    assert count_elements(root) > first
+    page.wait_for_timeout(60000)
+    assert count_elements(root) <= MAX_ELEMENTS
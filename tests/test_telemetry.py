@@ -0,0 +1,72 @@
+from playwright.sync_api import Page, expect
+import json
+import re
+
+import pytest
+
+from streamlit_cytoscape.telemetry import _telemetry_args
+
+
+PAGE_NAME = "Telemetry"
+NODE_ID = "n1"  # PERSON node in social.json
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+
+
+def AWAIT_RETURN_ACTION(page):
+    page.get_by_text('"action":"').click(timeout=10000)
+
+
+def get_node_pos(_id, iframe):
+    pos = iframe.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return cy.getElementById("{_id}").renderedPosition();
+    }}"""
+    )
+    return pos
+
+
+def get_return_json(page: Page):
+    data = (
+        page.get_by_test_id("stJson")
+        .first.text_content()
+        .replace('""', '","')
+        .replace('}"', '},"')
+    )
+    data = re.sub("([0-9]+):", "", data)
+    # separators after number / null values and arrays
+    data = re.sub(r'(:-?[0-9.]+|:null|:true|:false|\])"', r'\1,"', data)
+    return json.loads(data)
+
+
+def test_periodic_report(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    # elements, style and layout measured on load, sent within 2s
+    expect(page.get_by_text('"firstPaint"')).to_be_visible(timeout=10000)
+    expect(page.get_by_text('"elements"').first).to_be_visible()
+    expect(page.get_by_text('"nodes"')).to_be_visible()
+
+
+def test_report_removed_from_returned_value(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    root.click(position={"x": 0, "y": 0})  # await and scroll to view
+
+    root.click(position=get_node_pos(NODE_ID, root))
+    AWAIT_RETURN_ACTION(page)
+    data = get_return_json(page)
+
+    assert data["action"] == "clicked_node"
+    assert "telemetry" not in data
+
+
+def test_periodic_reports_opt_in():
+    assert _telemetry_args(True, None, "graph") == {"interval": None}
+    assert _telemetry_args(True, 2, "graph") == {"interval": 2}
+    assert _telemetry_args(False, 2, "graph") is None
+    with pytest.raises(ValueError):
+        _telemetry_args(True, 0, "graph")
@@ -0,0 +1,63 @@
+from playwright.sync_api import Page, expect
+
+
+PAGE_NAME = "Temporal Playback"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+
+
+def visible_edges(iframe):
+    """
+    Returns the number of visible transactions and of those expected
+    at the current time of the timeline.
+    """
+    return iframe.evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        const label = document.querySelector(".timeline__label").innerText;
+        const t = Date.parse(label);
+        const expected = cy.edges().filter(
+            (e) => Date.parse(e.data("start")) <= t
+                && t < Date.parse(e.data("end"))
+        );
+        return [cy.edges(":visible").length, expected.length];
+    }}"""
+    )
+
+
+def test_timeline_scrub(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    root = frame.locator(":root")
+    timeline = frame.locator("#timeline")
+    expect(timeline).to_have_attribute("data-visible", "true")
+    # starts at the earliest time
+    expect(frame.locator(".timeline__label")).to_have_text("2024-01-01")
+
+    frame.locator(".timeline__slider").fill("500")
+    expect(frame.locator(".timeline__label")).not_to_have_text("2024-01-01")
+    visible, expected = visible_edges(root)
+    assert visible == expected > 0
+
+    frame.locator(".timeline__slider").fill("100")
+    visible, expected = visible_edges(root)
+    assert visible == expected > 0
+
+
+def test_timeline_play(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    timeline = frame.locator("#timeline")
+    label = frame.locator(".timeline__label")
+
+    frame.locator(".timeline__play").click()
+    expect(timeline).to_have_attribute("data-playing", "true")
+    expect(label).not_to_have_text("2024-01-01")
+    frame.locator(".timeline__play").click()
+    expect(timeline).to_have_attribute("data-playing", "false")
+    # paused: the time doesn't move anymore
+    paused = label.inner_text()
+    page.wait_for_timeout(500)
+    assert label.inner_text() == paused
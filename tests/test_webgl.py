@@ -0,0 +1,39 @@
+from playwright.sync_api import Page, expect
+
+
+PAGE_NAME = "WebGL Renderer"
+ASSIGN_CY = "const cy = document.getElementById('cy')._cyreg.cy;"
+FRAME_LOCATOR = "iframe[title*='streamlit_cytoscape']"
+N_NODES = 30000  # default of the demo page
+NO_WEBGL2 = """
+const getContext = HTMLCanvasElement.prototype.getContext;
+HTMLCanvasElement.prototype.getContext = function (type, ...args) {
+    return type === "webgl2" ? null : getContext.call(this, type, ...args);
+};
+"""
+
+
+def test_webgl_renderer(page: Page):
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    # software WebGL (SwiftShader) is available in headless Chromium
+    expect(frame.locator("#cy")).to_have_attribute("data-renderer", "webgl")
+    expect(frame.locator("#progress")).to_have_attribute(
+        "data-visible", "false", timeout=60000
+    )
+    nodes = frame.locator(":root").evaluate(
+        f"""() => {{
+        {ASSIGN_CY}
+        return cy.nodes().length;
+    }}"""
+    )
+    assert nodes == N_NODES
+
+
+def test_canvas_fallback(page: Page):
+    page.add_init_script(NO_WEBGL2)
+    page.get_by_role("link", name=PAGE_NAME).click()
+    page.wait_for_load_state("networkidle")
+    frame = page.frame_locator(FRAME_LOCATOR).first
+    expect(frame.locator("#cy")).to_have_attribute("data-renderer", "canvas")